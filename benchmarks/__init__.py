@@ -0,0 +1,71 @@
+# -*- encoding: utf8 -*-
+# ------------------------------------------------------------------------------
+# __init__.py
+# Created on 18/10/2026
+#
+# The MIT License
+#
+#
+# Copyright 2022 Jorge A. Gomes
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# region IMPORTS
+
+import sys
+
+from typing import Optional, Any, Union, List, Tuple, Dict, Type
+
+# endregion (imports)
+# ---------------------------------------------------------
+# region EXPORTS
+
+
+__all__ = [
+    '',
+]
+
+
+# endregion (exports)
+# ---------------------------------------------------------
+# region CONSTANTS & ENUMS
+
+# endregion (constants)
+# ---------------------------------------------------------
+# region CLASSES
+
+# endregion (classes)
+# ---------------------------------------------------------
+# region FUNCTIONS
+
+
+def main() -> int:
+    return 0
+
+
+# endregion (functions)
+# ---------------------------------------------------------
+# region ENTRYPOINT
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+# endregion (entrypoint)
@@ -0,0 +1,190 @@
+# -*- encoding: utf8 -*-
+# ------------------------------------------------------------------------------
+# corpus.py
+# Created on 18/10/2026
+#
+# The MIT License
+#
+#
+# Copyright 2022 Jorge A. Gomes
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# region IMPORTS
+
+import os
+import sys
+import random
+
+from minilang.utillities.jsom import JSOM
+from typing import Optional, Dict, List, Callable
+
+# endregion (imports)
+# ---------------------------------------------------------
+# region EXPORTS
+
+
+__all__ = [
+    'DEFAULT_MIX',
+    'generate',
+]
+
+
+# endregion (exports)
+# ---------------------------------------------------------
+# region CONSTANTS & ENUMS
+
+# relative weights of each kind of generated item
+DEFAULT_MIX: Dict[str, int] = {
+    'identifier': 30,
+    'keyword': 12,
+    'number': 10,
+    'delimiter': 25,
+    'operator': 10,
+    'string': 5,
+    'line_comment': 2,
+    'block_comment': 2,
+    'documentation': 1,
+}
+
+WORDS = 'alpha beta gamma delta value count index total result buffer item node left right next'.split()
+
+# endregion (constants)
+# ---------------------------------------------------------
+# region CLASSES
+
+
+class _Generator:
+    """Builds the items of a synthetic corpus from a lexer configuration"""
+
+    def __init__(self, conf: JSOM, rng: random.Random):
+        self.conf: JSOM = conf
+        self.rng: random.Random = rng
+        self.keywords: List[str] = list(conf.keyword.reserved)
+        for key_kind in conf.keyword.subkinds:
+            self.keywords.extend(conf.keyword[key_kind])
+        self.delimiters: str = conf.delimiter.chars
+        self.operators: List[str] = [k for k in conf.tokens if all(c in conf.operator.chars for c in k)]
+        markers = (conf.comment.line, conf.comment.block.begin, conf.document.line, conf.document.block.begin)
+        self.operators = [op for op in self.operators if op not in markers]
+
+    def identifier(self) -> str:
+        word = self.rng.choice(WORDS)
+        return word.capitalize() + str(self.rng.randint(0, 99)) if self.rng.random() < 0.3 else word
+
+    def keyword(self) -> str:
+        return self.rng.choice(self.keywords)
+
+    def number(self) -> str:
+        rng = self.rng
+        conf = self.conf
+        choice = rng.randint(0, len(conf.number.integer.base_chars) + 2)
+        if choice < len(conf.number.integer.base_chars):
+            base_char = conf.number.integer.base_chars[choice]
+            digits = conf.number.integer.base[base_char].digits
+            body = ''.join(rng.choice(digits) for _ in range(rng.randint(1, 8)))
+            return f"0{base_char}{body}"
+        if choice == len(conf.number.integer.base_chars):
+            return f"{rng.randint(0, 9999)}.{rng.randint(0, 9999)}"
+        if choice == len(conf.number.integer.base_chars) + 1:
+            return f"{rng.randint(1, 999)}{conf.number.separator}{rng.randint(100, 999)}"
+        return f"{rng.randint(1, 99999)}"
+
+    def delimiter(self) -> str:
+        return self.rng.choice(self.delimiters)
+
+    def operator(self) -> str:
+        return f" {self.rng.choice(self.operators)} "
+
+    def string(self) -> str:
+        quote = self.rng.choice(self.conf.string.delimiters)
+        mark = self.conf.string.escape.mark
+        words = ' '.join(self.rng.choice(WORDS) for _ in range(self.rng.randint(0, 8)))
+        return f"{quote}{words}{mark}{quote}{mark}{mark}{words[:5]}{quote}"
+
+    def _text(self, lines: int) -> str:
+        return '\n'.join(' '.join(self.rng.choice(WORDS) for _ in range(8)) for _ in range(lines))
+
+    def line_comment(self) -> str:
+        return f"\n{self.conf.comment.line} {self._text(1)}\n"
+
+    def block_comment(self) -> str:
+        block = self.conf.comment.block
+        return f"\n{block.begin}\n{self._text(self.rng.randint(1, 6))}\n{block.end}\n"
+
+    def documentation(self) -> str:
+        block = self.conf.document.block
+        return f"\n{block.begin}\n{self._text(self.rng.randint(2, 20))}\n{block.end}\n"
+
+
+# endregion (classes)
+# ---------------------------------------------------------
+# region FUNCTIONS
+
+
+def generate(conf: JSOM, size: int, mix: Optional[Dict[str, int]] = None, seed: int = 0) -> str:
+    """Generates a synthetic source code that the lexer accepts
+
+    :param conf: The lexer configuration the corpus is generated for
+    :param size: The approximate size of the corpus, in characters
+    :param mix: The relative weight of each kind of item; see `DEFAULT_MIX`
+    :param seed: The random seed, so the same arguments give the same corpus
+    :return: The source code
+    """
+    mix = DEFAULT_MIX if mix is None else mix
+    rng = random.Random(seed)
+    generator = _Generator(conf, rng)
+    names: List[str] = [name for name, weight in mix.items() if weight > 0]
+    weights: List[int] = [mix[name] for name in names]
+    makers: List[Callable[[], str]] = [getattr(generator, name) for name in names]
+    chunks: List[str] = []
+    length = 0
+    column = 0
+
+    while length < size:
+        for maker in rng.choices(makers, weights, k=64):
+            item = maker()
+            column += len(item) + 1
+            separator = '\n' if column > 80 else ' '
+            if separator == '\n':
+                column = 0
+            chunks.append(item)
+            chunks.append(separator)
+            length += len(item) + 1
+
+    return ''.join(chunks)
+
+
+def main() -> int:
+    path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'minilang', 'lexing', 'lexconf.json')
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 4096
+    sys.stdout.write(generate(JSOM.parse_file(path), size))
+    return 0
+
+
+# endregion (functions)
+# ---------------------------------------------------------
+# region ENTRYPOINT
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+# endregion (entrypoint)
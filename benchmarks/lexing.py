@@ -0,0 +1,300 @@
+# -*- encoding: utf8 -*-
+# ------------------------------------------------------------------------------
+# lexing.py
+# Created on 18/10/2026
+#
+# The MIT License
+#
+#
+# Copyright 2022 Jorge A. Gomes
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# region IMPORTS
+
+import os
+import sys
+import gc
+import json
+import time
+import platform
+import argparse
+import tracemalloc
+
+from minilang.utillities.jsom import JSOM
+from minilang.utillities.code import Source
+from minilang.lexing.core import Lexer, Error
+from minilang.lexing.scanner import Scanner
+from minilang.lexing.config import LexerConfig
+from minilang.lexing.stream import TokenStream, LazyTokenStream, mask
+from minilang.lexing.tokens import TC_KEYWORD, SC_SEMICOLON, SC_COMMA, SC_IDENTIFIER
+from benchmarks.corpus import generate
+from typing import Optional, Any, Union, Dict, List, Callable
+
+# endregion (imports)
+# ---------------------------------------------------------
+# region EXPORTS
+
+
+__all__ = [
+    'BENCHMARKS',
+    'run',
+    'compare',
+    'disagreements',
+]
+
+
+# endregion (exports)
+# ---------------------------------------------------------
+# region CONSTANTS & ENUMS
+
+LEXCONF = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'minilang', 'lexing', 'lexconf.json')
+
+# endregion (constants)
+# ---------------------------------------------------------
+# region FUNCTIONS
+
+
+def _check(error: Optional[Error]) -> None:
+    # not an assertion, which -O would strip: timing a failed scan measures nothing
+    if error is not None:
+        raise RuntimeError(f"Scan failed: {error.message}")
+
+
+def _lex_interpreted(conf: JSOM, scanner: Scanner, source: Source) -> int:
+    tokens, error = Lexer(conf, source).gen_tokens()
+    _check(error)
+    return len(tokens)
+
+
+def _lex_compiled(conf: JSOM, scanner: Scanner, source: Source) -> int:
+    tokens, error = Lexer(conf, source, scanner=scanner).gen_tokens()
+    _check(error)
+    return len(tokens)
+
+
+def _lex_buffer(conf: JSOM, scanner: Scanner, source: Source) -> int:
+    buffer, error = Lexer(conf, source, scanner=scanner).gen_buffer()
+    _check(error)
+    return len(buffer)
+
+
+def _stream_traversal(conf: JSOM, scanner: Scanner, source: Source) -> int:
+    tokens, error = Lexer(conf, source, scanner=scanner).gen_tokens()
+    _check(error)
+    stream = TokenStream(source, tokens)
+    count = 0
+    while not stream.eot:
+        # a few probes per token, as a parser trying alternatives would do
+        if not stream.match_kind('KEYWORD') and not stream.match_token(';', ','):
+            stream.is_subkind('IDENTIFIER')
+            stream.advance()
+        count += 1
+    return count
+
+
+def _stream_code_traversal(conf: JSOM, scanner: Scanner, source: Source) -> int:
+    tokens, error = Lexer(conf, source, scanner=scanner).gen_tokens()
+    _check(error)
+    stream = TokenStream(source, tokens)
+    keyword, separator, identifier = mask(TC_KEYWORD), mask(SC_SEMICOLON, SC_COMMA), mask(SC_IDENTIFIER)
+    count = 0
+    while not stream.eot:
+        # the same probes as `_stream_traversal`, as bitmask tests
+        if not stream.match_any(keyword) and not stream.match_any(separator):
+            stream.is_any(identifier)
+            stream.advance()
+        count += 1
+    return count
+
+
+def _lazy_stream_traversal(conf: JSOM, scanner: Scanner, source: Source) -> int:
+    lexer = Lexer(conf, source, scanner=scanner)
+    stream = LazyTokenStream(source, lexer.iter_tokens(), lookahead=2)
+    count = 0
+    while not stream.eot:
+        if not stream.match_kind('KEYWORD') and not stream.match_token(';', ','):
+            stream.is_subkind('IDENTIFIER')
+            stream.advance()
+        count += 1
+    return count
+
+
+# every benchmark takes (conf, scanner, source) and returns the number of tokens processed
+BENCHMARKS: Dict[str, Callable[[JSOM, Scanner, Source], int]] = {
+    'lexer.gen_tokens.interpreted': _lex_interpreted,
+    'lexer.gen_tokens.compiled': _lex_compiled,
+    'lexer.gen_buffer.compiled': _lex_buffer,
+    'stream.traversal': _stream_traversal,
+    'stream.code_traversal': _stream_code_traversal,
+    'stream.lazy_traversal': _lazy_stream_traversal,
+}
+
+
+def run(conf: Union[JSOM, LexerConfig], code: str, names: Optional[List[str]] = None, repeat: int = 3
+        ) -> Dict[str, Dict[str, Any]]:
+    """Runs benchmarks over a source code
+
+    Timings are the best of `repeat` runs; peak memory is measured in a separate
+    run under tracemalloc, as tracing slows everything down.
+
+    :param conf: The lexer configuration
+    :param code: The source code
+    :param names: The benchmarks to run; all of them by default
+    :param repeat: The number of timed runs
+    :return: The metrics of each benchmark
+    """
+    # resolved once, as a build would, so the benchmarks time scanning only
+    conf = LexerConfig.compile(conf)
+    scanner = Scanner.compile(conf)
+    results: Dict[str, Dict[str, Any]] = {}
+    size = len(code.encode('utf-8'))
+
+    for name in names or list(BENCHMARKS):
+        bench = BENCHMARKS[name]
+        best = float('inf')
+        count = 0
+        for _ in range(repeat):
+            source = Source('<corpus>', code)
+            gc.collect()
+            start = time.perf_counter()
+            count = bench(conf, scanner, source)
+            best = min(best, time.perf_counter() - start)
+
+        gc.collect()
+        tracemalloc.start()
+        bench(conf, scanner, Source('<corpus>', code))
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        results[name] = {
+            'seconds': best,
+            'tokens': count,
+            'tokens_per_sec': count / best,
+            'bytes_per_sec': size / best,
+            'peak_bytes': peak,
+        }
+
+    return results
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]], tolerance: float
+            ) -> List[str]:
+    """Compares results against a baseline
+
+    :param results: The current results
+    :param baseline: The baseline results
+    :param tolerance: The accepted relative slowdown or memory growth, e.g. 0.1 for 10%
+    :return: A message per regression; empty if there is none
+    """
+    regressions: List[str] = []
+    for name, current in results.items():
+        if name not in baseline:
+            continue
+        base = baseline[name]
+        if current['tokens_per_sec'] < base['tokens_per_sec'] * (1 - tolerance):
+            regressions.append(f"{name}: {current['tokens_per_sec']:.0f} tokens/s, "
+                               f"baseline {base['tokens_per_sec']:.0f} tokens/s")
+        if current['peak_bytes'] > base['peak_bytes'] * (1 + tolerance):
+            regressions.append(f"{name}: {current['peak_bytes']} peak bytes, baseline {base['peak_bytes']} bytes")
+    return regressions
+
+
+def disagreements(results: Dict[str, Dict[str, Any]]) -> List[str]:
+    """Checks that every benchmark processed the same tokens
+
+    All benchmarks scan the same corpus, so a different count means a scanning
+    path, or a traversal, went wrong.
+
+    :param results: The results, see `run`
+    :return: A message per benchmark disagreeing with the first one; empty if they all agree
+    """
+    messages: List[str] = []
+    if not results:
+        return messages
+    first, expected = next(iter(results.items()))
+    for name, metrics in results.items():
+        if metrics['tokens'] != expected['tokens']:
+            messages.append(f"{name}: {metrics['tokens']} tokens, {first} {expected['tokens']} tokens")
+    return messages
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='benchmarks.lexing', description="Lexer and TokenStream benchmarks")
+    parser.add_argument('--size', type=int, default=200_000, help="corpus size in characters")
+    parser.add_argument('--seed', type=int, default=0, help="corpus random seed")
+    parser.add_argument('--repeat', type=int, default=3, help="timed runs per benchmark")
+    parser.add_argument('--bench', action='append', choices=list(BENCHMARKS), help="benchmark to run; repeatable")
+    parser.add_argument('--output', help="file to write the JSON results to")
+    parser.add_argument('--baseline', help="JSON results to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.10, help="accepted relative regression")
+    args = parser.parse_args(argv)
+
+    conf: JSOM = JSOM.parse_file(LEXCONF)
+    code: str = generate(conf, args.size, seed=args.seed)
+    try:
+        results = run(conf, code, args.bench, args.repeat)
+    except RuntimeError as exc:
+        print(f"FAILED {exc}", file=sys.stderr)
+        return 1
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'size': args.size,
+            'seed': args.seed,
+        },
+        'results': results,
+    }
+
+    for name, metrics in results.items():
+        print(f"{name:32} {metrics['tokens_per_sec']:>12,.0f} tokens/s {metrics['bytes_per_sec'] / 1e6:>8.2f} MB/s "
+              f"{metrics['peak_bytes'] / 1e6:>8.2f} MB peak")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+
+    mismatches = disagreements(results)
+    for mismatch in mismatches:
+        print(f"MISMATCH {mismatch}", file=sys.stderr)
+    if mismatches:
+        return 1
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline['results'], args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+
+    return 0
+
+
+# endregion (functions)
+# ---------------------------------------------------------
+# region ENTRYPOINT
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+# endregion (entrypoint)
@@ -0,0 +1,261 @@
+# -*- encoding: utf8 -*-
+# ------------------------------------------------------------------------------
+# cache.py
+# Created on 18/10/2026
+#
+# The MIT License
+#
+#
+# Copyright 2022 Jorge A. Gomes
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# region IMPORTS
+
+import os
+import sys
+import json
+import struct
+import hashlib
+
+from array import array
+
+from minilang.utillities.jsom import JSOM
+from minilang.utillities.code import Source
+from minilang.lexing.buffer import TokenBuffer, COLUMN_TYPES
+from minilang.lexing.config import LexerConfig
+from minilang.parsing.flat import FlatTree
+from typing import Optional, Union, List
+
+# endregion (imports)
+# ---------------------------------------------------------
+# region EXPORTS
+
+
+__all__ = [
+    'TokenCache',
+    'TreeCache',
+    'config_fingerprint',
+    'file_digest',
+]
+
+
+# endregion (exports)
+# ---------------------------------------------------------
+# region CONSTANTS & ENUMS
+
+MAGIC = b'MLTK'
+VERSION = 1
+
+# magic, version, byte order (1 for little endian), token count, names size
+HEADER = struct.Struct('<4sHBxII')
+ALIGNMENT = 4
+
+# endregion (constants)
+# ---------------------------------------------------------
+# region CLASSES
+
+
+class TokenCache:
+    """On-disk cache of token buffers
+
+    Entries are keyed by the digest of the source file bytes and by the
+    fingerprint of the lexer configuration, so an entry is valid as long as it
+    exists. Each entry stores the buffer columns as raw native arrays, aligned
+    so they can be cast straight over the bytes of the entry when loaded.
+    """
+
+    __slots__ = '_directory', '_fingerprint'
+
+    EXTENSION = '.mltk'
+
+    # region SPECIAL
+
+    def __init__(self, directory: str, conf: Union[JSOM, LexerConfig]):
+        self._directory: str = directory
+        self._fingerprint: str = config_fingerprint(conf)
+
+    # endregion
+
+    # region PROPERTIES
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @property
+    def fingerprint(self) -> str:
+        return self._fingerprint
+
+    # endregion
+
+    # region METHODS
+
+    def path(self, digest: str) -> str:
+        return os.path.join(self._directory, f"{digest}-{self._fingerprint[:16]}{self.EXTENSION}")
+
+    def load(self, digest: str, source: Source) -> Optional[TokenBuffer]:
+        """Loads the tokens of a source from the cache
+
+        :param digest: The digest of the source file, see `file_digest`
+        :param source: The source to attach to the buffer
+        :return: A read-only buffer over the bytes of the entry, or None on a miss or an invalid entry
+        """
+        # the entry is read at once: a memory map would hold a file descriptor
+        # for as long as the buffer lives, and builds keep thousands of them
+        try:
+            with open(self.path(digest), 'rb') as file:
+                data = file.read()
+        except OSError:
+            return None
+
+        if len(data) < HEADER.size:
+            return None
+        magic, version, little, count, names_size = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION or little != (sys.byteorder == 'little'):
+            return None
+
+        view = memoryview(data)
+        offset = HEADER.size
+        if offset + names_size > len(data):
+            return None
+        try:
+            names: List[str] = bytes(view[offset:offset + names_size]).decode('utf-8').split('\0')
+        except UnicodeDecodeError:
+            return None
+        offset = _align(offset + names_size)
+        columns = []
+        for typecode in COLUMN_TYPES:
+            size = count * array(typecode).itemsize
+            if offset + size > len(data):
+                return None
+            columns.append(view[offset:offset + size].cast(typecode))
+            offset = _align(offset + size)
+
+        # kinds, subkinds and suffixes are indices in the names
+        kinds, subkinds, _, _, _, suffixes = columns
+        if any(max(column, default=0) >= len(names) for column in (kinds, subkinds, suffixes)):
+            return None
+        return TokenBuffer.from_columns(source, names, *columns)
+
+    def store(self, digest: str, buffer: TokenBuffer) -> str:
+        """Stores the tokens of a source in the cache
+
+        The entry is written to a temporary file first, so concurrent builds
+        never read a partial entry.
+
+        :param digest: The digest of the source file, see `file_digest`
+        :param buffer: The tokens
+        :return: The path of the entry
+        """
+        names = '\0'.join(buffer.names).encode('utf-8')
+        chunks: List[bytes] = [HEADER.pack(MAGIC, VERSION, sys.byteorder == 'little', len(buffer), len(names)), names]
+        offset = HEADER.size + len(names)
+        for typecode, column in zip(COLUMN_TYPES, buffer.columns):
+            chunks.append(b'\0' * (_align(offset) - offset))
+            data = column.tobytes() if isinstance(column, (array, memoryview)) else array(typecode, column).tobytes()
+            chunks.append(data)
+            offset = _align(offset) + len(data)
+
+        path = self.path(digest)
+        os.makedirs(self._directory, exist_ok=True)
+        temp = f"{path}.{os.getpid()}.tmp"
+        with open(temp, 'wb') as file:
+            file.write(b''.join(chunks))
+        os.replace(temp, path)
+        return path
+
+    # endregion (methods)
+
+
+class TreeCache(TokenCache):
+    """On-disk cache of flat syntax trees
+
+    Entries sit next to the token cache entries and are keyed the same way, as
+    the token indices of a tree only hold for the tokens it was parsed from.
+    Trees of an older format are misses.
+    """
+
+    __slots__ = ()
+
+    EXTENSION = '.mlast'
+
+    # region METHODS
+
+    def load(self, digest: str, source: Optional[Source] = None,
+             token_count: Optional[int] = None) -> Optional[FlatTree]:
+        """Loads the syntax tree of a source from the cache
+
+        :param digest: The digest of the source file, see `file_digest`
+        :param source: Unused; the tree refers to the tokens of the source
+        :param token_count: The number of tokens of the source, if known; see `FlatTree.frombytes`
+        :return: A read-only tree over the bytes of the entry, or None on a miss, a corrupt entry included
+        """
+        # read at once, as token entries are, to hold no file descriptor
+        try:
+            with open(self.path(digest), 'rb') as file:
+                return FlatTree.frombytes(file.read(), token_count)
+        except OSError:
+            return None
+
+    def store(self, digest: str, tree: FlatTree) -> str:
+        """Stores the syntax tree of a source in the cache
+
+        :param digest: The digest of the source file, see `file_digest`
+        :param tree: The tree
+        :return: The path of the entry
+        """
+        path = self.path(digest)
+        os.makedirs(self._directory, exist_ok=True)
+        temp = f"{path}.{os.getpid()}.tmp"
+        tree.save(temp)
+        os.replace(temp, path)
+        return path
+
+    # endregion (methods)
+
+
+# endregion (classes)
+# ---------------------------------------------------------
+# region FUNCTIONS
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def config_fingerprint(conf: Union[JSOM, LexerConfig]) -> str:
+    """Gets a digest of a lexer configuration that ignores key order"""
+    if isinstance(conf, LexerConfig):
+        conf = conf.jsom
+    return hashlib.sha256(json.dumps(conf, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def file_digest(filename: str, chunk_size: int = 1 << 20) -> str:
+    """Gets the digest of the raw bytes of a file"""
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as file:
+        chunk = file.read(chunk_size)
+        while chunk:
+            digest.update(chunk)
+            chunk = file.read(chunk_size)
+    return digest.hexdigest()
+
+# endregion (functions)
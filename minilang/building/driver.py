@@ -0,0 +1,229 @@
+# -*- encoding: utf8 -*-
+# ------------------------------------------------------------------------------
+# driver.py
+# Created on 18/10/2026
+#
+# The MIT License
+#
+#
+# Copyright 2022 Jorge A. Gomes
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# region IMPORTS
+
+import os
+import sys
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from minilang.utillities.jsom import JSOM
+from minilang.utillities.code import MappedSource
+from minilang.lexing.core import Lexer, Error
+from minilang.lexing.buffer import TokenBuffer
+from minilang.lexing.scanner import Scanner
+from minilang.building.project import Project
+from minilang.building.cache import TokenCache, file_digest
+from typing import Optional, Iterable, List, Tuple
+
+# endregion (imports)
+# ---------------------------------------------------------
+# region EXPORTS
+
+
+__all__ = [
+    'LexResult',
+    'lex_files',
+    'lex_project',
+]
+
+
+# endregion (exports)
+# ---------------------------------------------------------
+# region CONSTANTS & ENUMS
+
+LEXCONF: str = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'lexing', 'lexconf.json')
+
+# below this many files the pool startup costs more than it saves
+MIN_PARALLEL_FILES: int = 4
+
+# the scanner and token cache of a worker process, set once by `_init_worker`
+_scanner: Optional[Scanner] = None
+_cache: Optional[TokenCache] = None
+
+# endregion (constants)
+# ---------------------------------------------------------
+# region CLASSES
+
+
+class LexResult:
+    """The outcome of lexing one source file: a token buffer and its errors
+
+    Files are lexed in recovery mode, so a file with errors still has a buffer,
+    with ERROR tokens, unless it could not be read at all.
+    """
+
+    __slots__ = 'filename', 'buffer', 'errors'
+
+    def __init__(self, filename: str, buffer: Optional[TokenBuffer] = None, errors: Optional[List[Error]] = None):
+        self.filename: str = filename
+        self.buffer: Optional[TokenBuffer] = buffer
+        self.errors: List[Error] = errors or []
+
+    def __str__(self) -> str:
+        if self.errors:
+            return f"[ {self.filename} | {len(self.errors)} errors, first: {self.errors[0].message} ]"
+        return f"[ {self.filename} | {len(self.buffer)} tokens ]"
+
+    @property
+    def error(self) -> Optional[Error]:
+        return self.errors[0] if self.errors else None
+
+
+# endregion (classes)
+# ---------------------------------------------------------
+# region FUNCTIONS
+
+
+def _init_worker(conf: JSOM, cache: Optional[TokenCache] = None) -> None:
+    global _scanner, _cache
+    _scanner = Scanner.compile(conf)
+    _cache = cache
+
+
+def _lex_file(filename: str, digest: Optional[str] = None) -> Tuple[str, Optional[TokenBuffer], List[str]]:
+    """Lexes one file in a worker process, storing its tokens in the cache if any
+
+    Only the token columns travel back to the parent process, and errors are
+    reduced to their message, so nothing refers to the worker's source. Files
+    with errors are not cached, as the cache does not keep the errors.
+    """
+    try:
+        source = MappedSource.load(filename)
+        try:
+            lexer = Lexer(_scanner.config, source, scanner=_scanner, recover=True)
+            buffer, _ = lexer.gen_buffer()
+        finally:
+            source.close()
+        if _cache is not None and digest is not None and not lexer.errors:
+            _cache.store(digest, buffer)
+    except (OSError, ValueError) as exc:
+        return filename, None, [f"{type(exc).__name__}: {exc}"]
+    return filename, buffer, [error.message for error in lexer.errors]
+
+
+def lex_files(filenames: Iterable[str], conf: JSOM, workers: Optional[int] = None,
+              cache: Optional[TokenCache] = None) -> List[LexResult]:
+    """Lexes source files in parallel across a pool of processes
+
+    Files found in the cache are loaded straight from it. Every worker compiles
+    its own ``Scanner`` once and ships compact token buffers back; each buffer
+    is then attached to a lazy memory-mapped source in this process, so no file
+    stays open until its tokens are read.
+
+    :param filenames: The source files
+    :param conf: The lexer configuration
+    :param workers: The number of processes; defaults to the number of CPUs
+    :param cache: An optional token cache, built for `conf`
+    :return: One result per file, in the order given
+    """
+    filenames = list(filenames)
+    results: dict = {}
+    pending: List[Tuple[str, Optional[str]]] = []
+
+    for filename in filenames:
+        digest = None
+        if cache is not None:
+            try:
+                digest = file_digest(filename)
+            except OSError as exc:
+                results[filename] = LexResult(filename, errors=[Error(f"{type(exc).__name__}: {exc}")])
+                continue
+            buffer = cache.load(digest, MappedSource.load(filename, lazy=True))
+            if buffer is not None:
+                results[filename] = LexResult(filename, buffer)
+                continue
+        pending.append((filename, digest))
+
+    if workers == 1 or len(pending) < MIN_PARALLEL_FILES:
+        _init_worker(conf, cache)
+        done = [_lex_file(filename, digest) for filename, digest in pending]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(conf, cache)) as executor:
+            futures = [executor.submit(_lex_file, filename, digest) for filename, digest in pending]
+            done = [future.result() for future in as_completed(futures)]
+
+    for filename, buffer, messages in done:
+        if buffer is not None:
+            buffer.attach(MappedSource.load(filename, lazy=True))
+        results[filename] = LexResult(filename, buffer, [Error(message) for message in messages])
+
+    return [results[filename] for filename in filenames]
+
+
+def lex_project(project: Project, conf: JSOM, preset: str = 'default', workers: Optional[int] = None,
+                use_cache: bool = True) -> List[LexResult]:
+    """Lexes every source file of a project
+
+    The token cache lives in the ``tokens`` directory of the project artifacts.
+
+    :param project: The project
+    :param conf: The lexer configuration
+    :param preset: The build preset used to discover the sources
+    :param workers: The number of processes; defaults to the number of CPUs
+    :param use_cache: Whether to use the project token cache
+    :return: One result per source file
+    """
+    cache = TokenCache(token_cache_path(project), conf) if use_cache else None
+    return lex_files(project.sources(preset), conf, workers, cache)
+
+
+def token_cache_path(project: Project) -> str:
+    return os.path.join(project.path('artifacts'), 'tokens')
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    project: Project = Project.load(argv[0] if argv else '.')
+    conf: JSOM = JSOM.parse_file(LEXCONF)
+    results = lex_project(project, conf)
+    failed = 0
+
+    for result in results:
+        filename = os.path.relpath(result.filename, project.root)
+        if result.errors:
+            failed += 1
+            for error in result.errors:
+                print(f"{filename}: {error.message}", file=sys.stderr)
+        else:
+            print(f"{filename}: {len(result.buffer)} tokens")
+
+    return 1 if failed else 0
+
+
+# endregion (functions)
+# ---------------------------------------------------------
+# region ENTRYPOINT
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+# endregion (entrypoint)
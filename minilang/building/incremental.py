@@ -0,0 +1,243 @@
+# -*- encoding: utf8 -*-
+# ------------------------------------------------------------------------------
+# incremental.py
+# Created on 18/10/2026
+#
+# The MIT License
+#
+#
+# Copyright 2022 Jorge A. Gomes
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# region IMPORTS
+
+import os
+import json
+import hashlib
+
+from minilang.parsing.flat import NK_LIST, FlatTree, NODE_KINDS
+from minilang.parsing.nodes import Block
+from minilang.building.cache import file_digest
+from typing import Optional, Any, List, Dict, Sequence
+
+# endregion (imports)
+# ---------------------------------------------------------
+# region EXPORTS
+
+
+__all__ = [
+    'BuildState',
+    'interface_digest',
+]
+
+
+# endregion (exports)
+# ---------------------------------------------------------
+# region CONSTANTS & ENUMS
+
+VERSION = 1
+
+# routine and accessor bodies are not part of the interface of a module
+_BLOCK = NODE_KINDS[Block]
+
+# endregion (constants)
+# ---------------------------------------------------------
+# region CLASSES
+
+
+class BuildState:
+    """What the last build knew about every module, kept in a JSON file
+
+    Each module entry holds the digest, size and modification time of its
+    file, the lexer configuration fingerprint, the digest of its interface,
+    the interface digests of the modules it imported, and its dependents. A
+    module is current, and its artifacts reusable, if its file and the
+    interfaces it imports are the same as in the last build.
+    """
+
+    __slots__ = '_filename', '_root', '_fingerprint', '_modules'
+
+    # region CLASSMETHODS
+
+    @classmethod
+    def load(cls, filename: str, root: str, fingerprint: str) -> "BuildState":
+        """Loads the state of the last build
+
+        :param filename: The state file
+        :param root: The directory module paths are stored relative to
+        :param fingerprint: The lexer configuration fingerprint of this build
+        :return: The state; empty if the file is missing, invalid or from another configuration
+        """
+        state = cls(filename, root, fingerprint)
+        try:
+            with open(filename, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return state
+        if isinstance(data, dict) and data.get('version') == VERSION and data.get('fingerprint') == fingerprint:
+            state._modules = data.get('modules', {})
+        return state
+
+    # endregion
+
+    # region SPECIAL
+
+    def __init__(self, filename: str, root: str, fingerprint: str):
+        self._filename: str = filename
+        self._root: str = root
+        self._fingerprint: str = fingerprint
+        self._modules: Dict[str, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._modules)
+
+    def __str__(self) -> str:
+        return f"[ BuildState {self._filename} | {len(self)} modules ]"
+
+    # endregion
+
+    # region PROPERTIES
+
+    @property
+    def filename(self) -> str:
+        return self._filename
+
+    @property
+    def fingerprint(self) -> str:
+        return self._fingerprint
+
+    # endregion
+
+    # region METHODS
+
+    def _key(self, module: str) -> str:
+        return os.path.relpath(module, self._root).replace(os.sep, '/')
+
+    def entry(self, module: str) -> Optional[Dict[str, Any]]:
+        return self._modules.get(self._key(module))
+
+    def digest(self, module: str) -> str:
+        """Gets the digest of a module file, skipping the hashing if its size and time are unchanged
+
+        :param module: The module file
+        :return: The digest, see ``cache.file_digest``
+        :raises OSError: if the file can't be read
+        """
+        stat = os.stat(module)
+        entry = self.entry(module)
+        if entry is not None and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime_ns:
+            return entry['digest']
+        return file_digest(module)
+
+    def interface(self, module: str) -> Optional[str]:
+        entry = self.entry(module)
+        return None if entry is None else entry['interface']
+
+    def is_current(self, module: str, digest: str, imports: Dict[str, str]) -> bool:
+        """Tells whether a module is built as it would be now
+
+        :param module: The module file
+        :param digest: The digest of the module file
+        :param imports: The current interface digest of each imported module
+        :return: True if neither the module nor the interfaces it imports changed since it was recorded
+        """
+        entry = self.entry(module)
+        return entry is not None and entry['digest'] == digest and entry['config'] == self._fingerprint \
+            and entry['imports'] == {self._key(dependency): value for dependency, value in imports.items()}
+
+    def record(self, module: str, digest: str, interface: str, imports: Dict[str, str], dependents: List[str]
+               ) -> None:
+        """Records a module as built
+
+        :param module: The module file
+        :param digest: The digest of the module file
+        :param interface: The interface digest of the module
+        :param imports: The interface digest of each imported module
+        :param dependents: The modules importing it
+        """
+        try:
+            stat = os.stat(module)
+        except OSError:
+            self.forget(module)
+            return
+        self._modules[self._key(module)] = {
+            'digest': digest,
+            'size': stat.st_size,
+            'mtime': stat.st_mtime_ns,
+            'config': self._fingerprint,
+            'interface': interface,
+            'imports': {self._key(dependency): value for dependency, value in imports.items()},
+            'dependents': sorted(self._key(dependent) for dependent in dependents),
+        }
+
+    def forget(self, module: str) -> None:
+        self._modules.pop(self._key(module), None)
+
+    def retain(self, modules: Sequence[str]) -> None:
+        """Forgets the modules that are no longer part of the build"""
+        keys = {self._key(module) for module in modules}
+        self._modules = {key: entry for key, entry in self._modules.items() if key in keys}
+
+    def save(self) -> None:
+        """Writes the state file, through a temporary file so it is never left partial"""
+        os.makedirs(os.path.dirname(self._filename), exist_ok=True)
+        temp = f"{self._filename}.{os.getpid()}.tmp"
+        with open(temp, 'w', encoding='utf-8') as file:
+            json.dump({'version': VERSION, 'fingerprint': self._fingerprint, 'modules': self._modules}, file,
+                      indent=1, sort_keys=True)
+        os.replace(temp, self._filename)
+
+    # endregion (methods)
+
+
+# endregion (classes)
+# ---------------------------------------------------------
+# region FUNCTIONS
+
+
+def interface_digest(tree: FlatTree, tokens: Sequence[Any]) -> str:
+    """Gets a digest of what a module exposes to the modules importing it
+
+    The interface is every top level declaration but the bodies of routines
+    and accessors: names, types, parameters, qualifiers and constant values.
+    Editing a body leaves the digest unchanged.
+
+    :param tree: The syntax tree of the module
+    :param tokens: The tokens the tree refers to
+    :return: A hex digest
+    """
+    digest = hashlib.sha256()
+    rows: List[int] = []
+    if len(tree):
+        rows.extend(reversed([row for member in tree.children(0) if tree.kind(member) == NK_LIST
+                              for row in tree.children(member)]))
+    while rows:
+        row = rows.pop()
+        kind = tree.kind(row)
+        if kind == _BLOCK:
+            continue
+        token = tree.token(row)
+        value = tokens[token].value if token >= 0 else ''
+        digest.update(f"{kind}:{tree.flags(row)}:{tree.operator(row)}:{value}\0".encode('utf-8'))
+        rows.extend(reversed(list(tree.children(row))))
+    return digest.hexdigest()
+
+# endregion (functions)
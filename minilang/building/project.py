@@ -0,0 +1,165 @@
+# -*- encoding: utf8 -*-
+# ------------------------------------------------------------------------------
+# project.py
+# Created on 18/10/2026
+#
+# The MIT License
+#
+#
+# Copyright 2022 Jorge A. Gomes
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# region IMPORTS
+
+import os
+
+from minilang.utillities.jsom import JSOM
+from typing import Optional, List
+
+# endregion (imports)
+# ---------------------------------------------------------
+# region EXPORTS
+
+
+__all__ = [
+    'Project',
+]
+
+
+# endregion (exports)
+# ---------------------------------------------------------
+# region CONSTANTS & ENUMS
+
+CONFIG_FILE = 'config.json'
+
+# endregion (constants)
+# ---------------------------------------------------------
+# region CLASSES
+
+
+class Project:
+    """A minilang project, as described by its ``config.json``
+
+    All paths declared in ``build.paths`` are relative to the directory holding
+    the configuration file.
+    """
+
+    # region CLASSMETHODS
+
+    @classmethod
+    def load(cls, path: str) -> "Project":
+        """Loads a project from its directory or from its configuration file
+
+        :param path: The project directory or configuration file
+        :return: The project
+        """
+        if os.path.isdir(path):
+            path = os.path.join(path, CONFIG_FILE)
+        return cls(os.path.dirname(os.path.abspath(path)), JSOM.parse_file(path))
+
+    # endregion
+
+    # region SPECIAL
+
+    def __init__(self, root: str, config: JSOM):
+        self._root: str = root
+        self._config: JSOM = config
+
+    def __str__(self) -> str:
+        return f"[ Project {self.name} | {self._root} ]"
+
+    # endregion
+
+    # region PROPERTIES
+
+    @property
+    def root(self) -> str:
+        return self._root
+
+    @property
+    def config(self) -> JSOM:
+        return self._config
+
+    @property
+    def name(self) -> str:
+        return self._config.project.name
+
+    # endregion
+
+    # region METHODS
+
+    def path(self, key: str) -> str:
+        """Gets the absolute path of one of the ``build.paths`` entries
+
+        :param key: The entry name, e.g. 'source' or 'artifacts'
+        :return: The absolute path
+        """
+        return os.path.normpath(os.path.join(self._root, self._config.build.paths[key]))
+
+    def preset(self, name: str = 'default') -> JSOM:
+        return self._config.build.presets[name]
+
+    def sources(self, preset: str = 'default', key: str = 'source') -> List[str]:
+        """Discovers the source files of the project
+
+        Every file under the `key` path with the same extension as the preset's
+        ``main`` file is a source file.
+
+        :param preset: The build preset name
+        :param key: The ``build.paths`` entry to search
+        :return: The sorted absolute file names
+        """
+        extension: str = os.path.splitext(self.preset(preset).main)[1]
+        top: str = self.path(key)
+        found: List[str] = []
+        for directory, _, files in os.walk(top):
+            for file in files:
+                if os.path.splitext(file)[1] == extension:
+                    found.append(os.path.join(directory, file))
+        return sorted(found)
+
+    def main_file(self, preset: str = 'default') -> Optional[str]:
+        main = os.path.join(self.path('source'), self.preset(preset).main)
+        return main if os.path.isfile(main) else None
+
+    def module_file(self, module: str, preset: str = 'default') -> Optional[str]:
+        """Resolves the path of an import statement to a source file
+
+        The path is looked up in the sources first and then in the dependencies,
+        with the extension of the preset's ``main`` file.
+
+        :param module: The imported path, like "some/dependency/module"
+        :param preset: The build preset name
+        :return: The absolute file name, or None if there is no such module
+        """
+        extension: str = os.path.splitext(self.preset(preset).main)[1]
+        for key in ('source', 'dependencies'):
+            if key not in self._config.build.paths:
+                continue
+            filename = os.path.join(self.path(key), module + extension)
+            if os.path.isfile(filename):
+                return os.path.normpath(filename)
+        return None
+
+    # endregion (methods)
+
+
+# endregion (classes)
@@ -0,0 +1,484 @@
+# -*- encoding: utf8 -*-
+# ------------------------------------------------------------------------------
+# scheduler.py
+# Created on 18/10/2026
+#
+# The MIT License
+#
+#
+# Copyright 2022 Jorge A. Gomes
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# region IMPORTS
+
+import os
+import re
+import sys
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from minilang.utillities.jsom import JSOM
+from minilang.utillities.code import MappedSource
+from minilang.lexing.core import Lexer, Error
+from minilang.lexing.buffer import TokenBuffer
+from minilang.lexing.config import LexerConfig
+from minilang.lexing.scanner import Scanner
+from minilang.lexing.tokens import KW_IMPORT
+from minilang.parsing.flat import FlatTree
+from minilang.parsing.parser import Parser
+from minilang.building.project import Project
+from minilang.building.cache import TokenCache, TreeCache, config_fingerprint, file_digest
+from minilang.building.driver import LEXCONF, MIN_PARALLEL_FILES, LexResult, token_cache_path
+from minilang.building.incremental import BuildState, interface_digest
+from typing import Optional, Any, Union, Iterable, Callable, List, Dict, Set, Tuple, Pattern
+
+# endregion (imports)
+# ---------------------------------------------------------
+# region EXPORTS
+
+
+__all__ = [
+    'ModuleGraph',
+    'ModuleResult',
+    'import_pattern',
+    'scan_imports',
+    'build_project',
+    'tree_cache_path',
+    'state_path',
+]
+
+
+# endregion (exports)
+# ---------------------------------------------------------
+# region CONSTANTS & ENUMS
+
+# the scanner and caches of a worker process, set once by `_init_worker`
+_scanner: Optional[Scanner] = None
+_tokens: Optional[TokenCache] = None
+_trees: Optional[TreeCache] = None
+
+# endregion (constants)
+# ---------------------------------------------------------
+# region CLASSES
+
+
+class ModuleGraph:
+    """The import graph of the modules of a build
+
+    Modules are absolute file names. Each module maps to the modules it
+    imports; imports that resolve to no file are kept as errors of the
+    importing module.
+    """
+
+    __slots__ = '_dependencies', '_dependents', '_errors'
+
+    # region CLASSMETHODS
+
+    @classmethod
+    def scan(cls, roots: Iterable[str], resolve: Callable[[str], Optional[str]], pattern: Pattern
+             ) -> "ModuleGraph":
+        """Builds the graph of some modules and of everything they import, transitively
+
+        :param roots: The module files to start from
+        :param resolve: Maps an import path to a module file, or to None
+        :param pattern: The import pattern, see `import_pattern`
+        :return: The graph
+        """
+        graph = cls()
+        pending: deque = deque(os.path.normpath(os.path.abspath(root)) for root in roots)
+        while pending:
+            module = pending.popleft()
+            if module in graph._dependencies:
+                continue
+            dependencies: List[str] = []
+            graph._dependencies[module] = dependencies
+            graph._dependents.setdefault(module, [])
+            try:
+                paths = scan_imports(module, pattern)
+            except OSError as exc:
+                graph._errors.setdefault(module, []).append(f"{type(exc).__name__}: {exc}")
+                continue
+            for path in paths:
+                dependency = resolve(path)
+                if dependency is None:
+                    graph._errors.setdefault(module, []).append(f"Unresolved import \"{path}\"")
+                elif dependency not in dependencies:
+                    dependencies.append(dependency)
+                    graph._dependents.setdefault(dependency, []).append(module)
+                    pending.append(dependency)
+        return graph
+
+    # endregion
+
+    # region SPECIAL
+
+    def __init__(self):
+        self._dependencies: Dict[str, List[str]] = {}
+        self._dependents: Dict[str, List[str]] = {}
+        self._errors: Dict[str, List[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._dependencies)
+
+    def __contains__(self, module: str) -> bool:
+        return module in self._dependencies
+
+    def __str__(self) -> str:
+        return f"[ ModuleGraph | {len(self)} modules ]"
+
+    # endregion
+
+    # region PROPERTIES
+
+    @property
+    def modules(self) -> List[str]:
+        return list(self._dependencies)
+
+    # endregion
+
+    # region METHODS
+
+    def dependencies(self, module: str) -> List[str]:
+        return self._dependencies[module]
+
+    def dependents(self, module: str) -> List[str]:
+        return self._dependents.get(module, [])
+
+    def errors(self, module: str) -> List[str]:
+        return self._errors.get(module, [])
+
+    def waves(self) -> Tuple[List[List[str]], List[str]]:
+        """Groups the modules in topological waves
+
+        Every module of a wave only depends on modules of earlier waves, so the
+        modules of a wave can be processed in parallel.
+
+        :return: The waves, and the modules left out because they are in or behind an import cycle
+        """
+        pending: Dict[str, int] = {module: len(dependencies) for module, dependencies in self._dependencies.items()}
+        wave = sorted(module for module, count in pending.items() if count == 0)
+        waves: List[List[str]] = []
+        while wave:
+            waves.append(wave)
+            following: List[str] = []
+            for module in wave:
+                for dependent in self.dependents(module):
+                    pending[dependent] -= 1
+                    if pending[dependent] == 0:
+                        following.append(dependent)
+            wave = sorted(following)
+        return waves, sorted(module for module, count in pending.items() if count > 0)
+
+    # endregion (methods)
+
+
+class ModuleResult(LexResult):
+    """The outcome of building one module: its tokens, its syntax tree and its errors
+
+    `output` holds whatever the build stage returned for the module, or what
+    was reused from an earlier build, in which case `reused` is set.
+    """
+
+    __slots__ = 'tree', 'digest', 'interface', 'output', 'reused'
+
+    def __init__(self, filename: str, buffer: Optional[TokenBuffer] = None, tree: Optional[FlatTree] = None,
+                 errors: Optional[List[Error]] = None, digest: Optional[str] = None):
+        super().__init__(filename, buffer, errors)
+        self.tree: Optional[FlatTree] = tree
+        self.digest: Optional[str] = digest
+        self.interface: Optional[str] = None
+        self.output: Any = None
+        self.reused: bool = False
+
+
+# endregion (classes)
+# ---------------------------------------------------------
+# region FUNCTIONS
+
+
+def import_pattern(conf: Union[JSOM, LexerConfig]) -> Pattern:
+    """Builds the pattern `scan_imports` uses to find import statements
+
+    Comments and strings are matched too, so import statements inside them are
+    skipped, as the lexer would.
+
+    :param conf: The lexer configuration
+    :return: A bytes pattern whose 'path' group is set on import statements only
+    """
+    config = LexerConfig.compile(conf)
+    quotes = ''.join(re.escape(quote) for quote in config.quotes)
+    alternatives = [rf'\b{KW_IMPORT}\s*\{{[^}}]*\}}\s*->\s*(?P<quote>[{quotes}])(?P<path>[^\n]*?)(?P=quote)']
+    for marker in sorted(config.markers, key=len, reverse=True):
+        end = config.markers[marker][2]
+        if end is None:
+            alternatives.append(re.escape(marker) + r'[^\n]*')
+        else:
+            alternatives.append(re.escape(marker) + r'.*?(?:' + re.escape(end) + r'|\Z)')
+    escape = re.escape(config.escape)
+    for quote in config.quotes:
+        alternatives.append(f'{re.escape(quote)}(?:{escape}.|[^{re.escape(quote)}{escape}\\n])*')
+    return re.compile('|'.join(alternatives).encode('utf-8'), re.DOTALL)
+
+
+def scan_imports(filename: str, pattern: Pattern) -> List[str]:
+    """Finds the paths imported by a source file without lexing it
+
+    :param filename: The source file
+    :param pattern: The import pattern, see `import_pattern`
+    :return: The imported paths, in source order
+    """
+    with open(filename, 'rb') as file:
+        code = file.read()
+    if KW_IMPORT.encode('utf-8') not in code:
+        return []
+    return [match.group('path').decode('utf-8') for match in pattern.finditer(code) if match.group('path') is not None]
+
+
+def _init_worker(conf: Union[JSOM, LexerConfig], tokens: Optional[TokenCache] = None,
+                 trees: Optional[TreeCache] = None) -> None:
+    global _scanner, _tokens, _trees
+    _scanner = Scanner.compile(conf)
+    _tokens = tokens
+    _trees = trees
+
+
+def _parse_file(filename: str, digest: Optional[str] = None
+                ) -> Tuple[str, Optional[TokenBuffer], Optional[FlatTree], List[str]]:
+    """Lexes and parses one file in a worker process, storing its tokens and tree in the caches if any
+
+    As in ``driver._lex_file``, only compact columns and error messages travel
+    back to the parent process. Files with lexical errors are not parsed, and
+    files with errors are not cached.
+    """
+    try:
+        source = MappedSource.load(filename)
+        try:
+            config = _scanner.config
+            tokens, errors = Lexer(config, source, scanner=_scanner).recover_tokens()
+            buffer = TokenBuffer.from_tokens(source, tokens, config.names)
+            messages = [error.message for error in errors]
+            tree = None
+            if not messages:
+                tree, error = Parser(source, tokens).parse_flat()
+                if error:
+                    messages.append(str(error))
+        finally:
+            source.close()
+        if not messages and digest is not None:
+            if _tokens is not None:
+                _tokens.store(digest, buffer)
+            if _trees is not None:
+                _trees.store(digest, tree)
+    except (OSError, ValueError) as exc:
+        return filename, None, None, [f"{type(exc).__name__}: {exc}"]
+    return filename, buffer, tree, messages
+
+
+def _release(result: ModuleResult) -> None:
+    # unmaps the source of a module once read; it is a lazy one, mapped again if read later
+    if result.buffer is not None:
+        result.buffer.source.close()
+
+
+def build_project(project: Project, conf: Union[JSOM, LexerConfig], preset: str = 'default',
+                  workers: Optional[int] = None, use_cache: bool = True,
+                  stage: Optional[Callable[[ModuleResult, Dict[str, ModuleResult]], Any]] = None,
+                  state: Optional[BuildState] = None, reuse: Optional[Callable[[ModuleResult], Any]] = None
+                  ) -> Tuple[ModuleGraph, List[ModuleResult]]:
+    """Lexes and parses the modules of a project and their dependencies in parallel
+
+    The import graph is scanned first, from the project sources through the
+    modules they import, dependencies included. Parsing does not depend on
+    imports, so every module not found in the caches is submitted to the
+    process pool at once. `stage`, e.g. translation, runs in this process on
+    each module as soon as the module and all its dependencies are through;
+    its result is kept in ``ModuleResult.output``. Modules with errors, or
+    depending on one, or in an import cycle, are never staged.
+
+    Token buffers get lazy sources, unmapped again once the interface of their
+    module is known and once it is staged, so no file is held open per module.
+
+    With a `state`, modules that are current, as neither their file nor the
+    interfaces they import changed, get their output from `reuse` instead of
+    `stage`; `reuse` returns None when there is nothing to reuse, and the
+    module is staged anyway. The state is updated and saved at the end.
+
+    :param project: The project
+    :param conf: The lexer configuration
+    :param preset: The build preset used to discover and resolve the sources
+    :param workers: The number of processes; defaults to the number of CPUs
+    :param use_cache: Whether to use the project token and tree caches
+    :param stage: Called with a module result and the results of the modules staged so far
+    :param state: The state of the last build, see `state_path`
+    :param reuse: Called with the result of a current module to get its output from the last build
+    :return: The import graph, and one result per module in the order they were staged
+    """
+    config = LexerConfig.compile(conf)
+    graph = ModuleGraph.scan(project.sources(preset), lambda path: project.module_file(path, preset),
+                             import_pattern(config))
+    tokens = TokenCache(token_cache_path(project), config) if use_cache else None
+    trees = TreeCache(tree_cache_path(project), config) if use_cache else None
+
+    results: Dict[str, ModuleResult] = {}
+    staged: Dict[str, ModuleResult] = {}
+    failed: Set[str] = set()
+    ready: deque = deque()
+
+    def done(module: str, result: ModuleResult) -> None:
+        result.errors.extend(Error(message) for message in graph.errors(module))
+        if not result.errors:
+            entry = state.entry(module) if state is not None else None
+            if entry is not None and entry['digest'] == result.digest:
+                result.interface = entry['interface']
+            else:
+                result.interface = interface_digest(result.tree, result.buffer)
+        _release(result)
+        results[module] = result
+        ready.append(module)
+
+    def advance() -> None:
+        # stages every module whose dependencies are all through, in the order they become ready
+        while ready:
+            module = ready.popleft()
+            if module in staged or module in failed or module not in results:
+                continue
+            dependencies = graph.dependencies(module)
+            if any(dependency in failed for dependency in dependencies) or results[module].errors:
+                if not results[module].errors:
+                    results[module].errors.append(Error("Depends on modules with errors"))
+                failed.add(module)
+                ready.extend(graph.dependents(module))
+                continue
+            if not all(dependency in staged for dependency in dependencies):
+                continue
+            result = results[module]
+            imports = {dependency: results[dependency].interface for dependency in dependencies}
+            if state is not None and reuse is not None and state.is_current(module, result.digest, imports):
+                result.output = reuse(result)
+                result.reused = result.output is not None
+            if stage is not None and not result.reused:
+                result.output = stage(result, staged)
+                _release(result)
+            if state is not None:
+                state.record(module, result.digest, result.interface, imports, graph.dependents(module))
+            staged[module] = result
+            ready.extend(graph.dependents(module))
+
+    pending: List[Tuple[str, Optional[str]]] = []
+    for module in graph.modules:
+        digest = None
+        if tokens is not None or state is not None:
+            try:
+                digest = state.digest(module) if state is not None else file_digest(module)
+            except OSError as exc:
+                done(module, ModuleResult(module, errors=[Error(f"{type(exc).__name__}: {exc}")]))
+                continue
+        if tokens is not None:
+            buffer = tokens.load(digest, MappedSource.load(module, lazy=True))
+            tree = trees.load(digest, token_count=len(buffer)) if buffer is not None else None
+            if tree is not None:
+                done(module, ModuleResult(module, buffer, tree, digest=digest))
+                continue
+        pending.append((module, digest))
+    advance()
+
+    digests = dict(pending)
+
+    def collect(outcome: Tuple[str, Optional[TokenBuffer], Optional[FlatTree], List[str]]) -> None:
+        module, buffer, tree, messages = outcome
+        if buffer is not None:
+            buffer.attach(MappedSource.load(module, lazy=True))
+        done(module, ModuleResult(module, buffer, tree, [Error(message) for message in messages], digests[module]))
+        advance()
+
+    if workers == 1 or len(pending) < MIN_PARALLEL_FILES:
+        _init_worker(config, tokens, trees)
+        for module, digest in pending:
+            collect(_parse_file(module, digest))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(config, tokens, trees)) as executor:
+            futures = [executor.submit(_parse_file, module, digest) for module, digest in pending]
+            for future in as_completed(futures):
+                collect(future.result())
+
+    order = list(staged.values())
+    for module in graph.waves()[1]:
+        if module not in failed:
+            results[module].errors.append(Error("Import cycle"))
+    order.extend(result for module, result in results.items() if module not in staged)
+
+    if state is not None:
+        state.retain(list(staged))
+        state.save()
+    return graph, order
+
+
+def tree_cache_path(project: Project) -> str:
+    return os.path.join(project.path('artifacts'), 'trees')
+
+
+def state_path(project: Project, target: str = '') -> str:
+    """Gets the path of the build state of a project
+
+    Each target keeps a state of its own, next to its artifacts: a module being
+    current for one target says nothing of the artifacts of another.
+
+    :param project: The project
+    :param target: The name of the target; none for builds that only lex and parse
+    :return: The path
+    """
+    return os.path.join(project.path('artifacts'), target, 'build.json')
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    project: Project = Project.load(argv[0] if argv else '.')
+    conf: JSOM = JSOM.parse_file(LEXCONF)
+    state = BuildState.load(state_path(project), project.root, config_fingerprint(conf))
+    graph, results = build_project(project, conf, state=state)
+    waves, cyclic = graph.waves()
+    failed = 0
+
+    for number, wave in enumerate(waves):
+        print(f"wave {number}: {', '.join(os.path.relpath(module, project.root) for module in wave)}")
+    for result in results:
+        filename = os.path.relpath(result.filename, project.root)
+        if result.errors:
+            failed += 1
+            for error in result.errors:
+                print(f"{filename}: {error.message}", file=sys.stderr)
+        else:
+            print(f"{filename}: {len(result.buffer)} tokens, {len(result.tree)} tree rows")
+
+    return 1 if failed else 0
+
+
+# endregion (functions)
+# ---------------------------------------------------------
+# region ENTRYPOINT
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+# endregion (entrypoint)
@@ -0,0 +1,352 @@
+# -*- encoding: utf8 -*-
+# ------------------------------------------------------------------------------
+# targets.py
+# Created on 18/10/2026
+#
+# The MIT License
+#
+#
+# Copyright 2022 Jorge A. Gomes
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# region IMPORTS
+
+import os
+import sys
+
+from minilang.utillities.jsom import JSOM
+from minilang.utillities.error import MinilangError, ExecutionError
+from minilang.lexing.core import Error
+from minilang.parsing.nodes import Module, Import
+from minilang.building.project import Project
+from minilang.building.cache import config_fingerprint
+from minilang.building.driver import LEXCONF
+from minilang.building.incremental import BuildState
+from minilang.building.scheduler import ModuleResult, build_project, state_path
+from minilang.translating.bytecode import CodeModule
+from minilang.translating.translator import Translator
+from minilang.translating.pysource import PythonModule, PythonTranslator
+from typing import Optional, Any, Callable, List, Dict, Tuple
+
+# endregion (imports)
+# ---------------------------------------------------------
+# region EXPORTS
+
+
+__all__ = [
+    'BytecodeTarget',
+    'PythonTarget',
+    'TARGETS',
+    'build_program',
+    'run_command',
+]
+
+
+# endregion (exports)
+# ---------------------------------------------------------
+# region CONSTANTS & ENUMS
+
+# endregion (constants)
+# ---------------------------------------------------------
+# region CLASSES
+
+
+class _Target:
+    """A build target: translates every module to an artifact
+
+    `stage` and `reuse` are meant for ``scheduler.build_project``. Artifacts
+    are kept under the target name in the artifacts directory, mirroring the
+    module paths relative to the project root; `MODULE` is the class loading
+    them.
+    """
+
+    NAME = ''
+    EXTENSION = ''
+    MODULE: Optional[type] = None
+
+    __slots__ = '_project', '_preset', '_directory'
+
+    def __init__(self, project: Project, preset: str = 'default'):
+        self._project: Project = project
+        self._preset: str = preset
+        self._directory: str = os.path.join(project.path('artifacts'), self.NAME)
+
+    def __str__(self) -> str:
+        return f"[ {type(self).__name__} {self._directory} ]"
+
+    # region PROPERTIES
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    # endregion
+
+    # region METHODS
+
+    def path(self, module: str) -> str:
+        """Gets the artifact file of a module
+
+        :param module: The module file
+        :return: The artifact file name
+        """
+        relative = os.path.splitext(os.path.relpath(module, self._project.root))[0]
+        return os.path.join(self._directory, relative.replace('..', '__') + self.EXTENSION)
+
+    def describe(self, output: Any) -> str:
+        """Summarizes the artifact of a module, for build reports"""
+        return type(output).__name__
+
+    def _imports(self, module: Module, staged: Dict[str, ModuleResult]) -> Dict[str, Any]:
+        # the outputs of the modules a module imports, by import path; None for those not staged
+        imports: Dict[str, Any] = {}
+        for node in module.members:
+            if isinstance(node, Import):
+                path = module.value(node.path.token)[1:-1]
+                dependency = staged.get(self._project.module_file(path, self._preset))
+                imports[path] = dependency.output if dependency is not None else None
+        return imports
+
+    def _filename(self, result: ModuleResult) -> str:
+        return os.path.relpath(result.filename, self._project.root).replace(os.sep, '/')
+
+    # endregion (methods)
+
+
+class BytecodeTarget(_Target):
+    """The 'bytecode' build target: translates every module to a bytecode artifact"""
+
+    NAME = 'bytecode'
+    EXTENSION = '.mlbc'
+    MODULE = CodeModule
+
+    __slots__ = ()
+
+    # region METHODS
+
+    def describe(self, output: CodeModule) -> str:
+        return f"{len(output.routines)} routines, {len(output.classes)} classes"
+
+    def stage(self, result: ModuleResult, staged: Dict[str, ModuleResult]) -> Optional[CodeModule]:
+        """Translates a module and writes its artifact
+
+        Errors are added to the module result.
+
+        :param result: The module, parsed
+        :param staged: The modules staged so far, which include its dependencies
+        :return: The translated module, or None on errors
+        """
+        buffer = result.buffer
+        module = result.tree.to_node(buffer.source, buffer)
+        code, error = Translator(module, self._imports(module, staged)).translate()
+        if error:
+            result.errors.append(Error(str(error)))
+            return None
+        code.filename = self._filename(result)
+        try:
+            code.save(self.path(result.filename))
+        except OSError as exc:
+            result.errors.append(Error(f"{type(exc).__name__}: {exc}"))
+            return None
+        return code
+
+    def reuse(self, result: ModuleResult) -> Optional[CodeModule]:
+        """Loads the artifact of a module from the last build
+
+        :param result: The module, current
+        :return: The translated module, or None if there is no valid artifact
+        """
+        try:
+            return CodeModule.load(self.path(result.filename))
+        except (OSError, ValueError):
+            return None
+
+    # endregion (methods)
+
+
+class PythonTarget(_Target):
+    """The 'python' build target: translates every module to Python source
+
+    Both the ``.py`` source and the ``.pyc`` file of its code object are kept,
+    so modules that did not change are neither translated nor compiled again.
+    """
+
+    NAME = 'python'
+    EXTENSION = '.py'
+    MODULE = PythonModule
+
+    __slots__ = ()
+
+    # region METHODS
+
+    def describe(self, output: PythonModule) -> str:
+        return f"{len(output.info['lines'])} lines, {len(output.info['classes'])} classes"
+
+    def stage(self, result: ModuleResult, staged: Dict[str, ModuleResult]) -> Optional[PythonModule]:
+        """Translates a module, writes its source and compiles it
+
+        Errors are added to the module result.
+
+        :param result: The module, parsed
+        :param staged: The modules staged so far, which include its dependencies
+        :return: The translated module, or None on errors
+        """
+        buffer = result.buffer
+        module = result.tree.to_node(buffer.source, buffer)
+        python, error = PythonTranslator(module, self._imports(module, staged)).translate()
+        if error:
+            result.errors.append(Error(str(error)))
+            return None
+        python.filename = self._filename(result)
+        try:
+            python.save(self.path(result.filename))
+            python.compile()
+        except (OSError, SyntaxError) as exc:
+            result.errors.append(Error(f"{type(exc).__name__}: {exc}"))
+            return None
+        return python
+
+    def reuse(self, result: ModuleResult) -> Optional[PythonModule]:
+        """Loads the source of a module from the last build; its code loads from the .pyc file when run
+
+        :param result: The module, current
+        :return: The translated module, or None if there is no valid artifact
+        """
+        try:
+            return PythonModule.load(self.path(result.filename))
+        except (OSError, ValueError):
+            return None
+
+    # endregion (methods)
+
+
+# the targets a preset may list, by name
+TARGETS: Dict[str, type] = {target.NAME: target for target in (BytecodeTarget, PythonTarget)}
+
+# endregion (classes)
+# ---------------------------------------------------------
+# region FUNCTIONS
+
+
+def build_program(path: str, target: type, preset: str = 'default'
+                  ) -> Tuple[Optional[List[Any]], Optional[MinilangError]]:
+    """Builds a project for a target, to run its main module
+
+    :param path: The project directory or configuration file
+    :param target: The target class, e.g. ``BytecodeTarget``
+    :param preset: The build preset
+    :return: The translated modules, dependencies first and the main module last, and None; or None and the
+        first error
+    """
+    project = Project.load(path)
+    conf: JSOM = JSOM.parse_file(LEXCONF)
+    main_file = project.main_file(preset)
+    if main_file is None:
+        return None, ExecutionError(f"{project.name} has no main module")
+    builder = target(project, preset)
+    state = BuildState.load(state_path(project, target.NAME), project.root, config_fingerprint(conf))
+    _, results = build_project(project, conf, preset, state=state, stage=builder.stage, reuse=builder.reuse)
+    modules: List[Any] = []
+    main_module: Optional[Any] = None
+    for result in results:
+        if result.errors:
+            return None, ExecutionError(f"{os.path.relpath(result.filename, project.root)}: "
+                                        f"{result.errors[0].message}")
+        if result.filename == os.path.normpath(main_file):
+            main_module = result.output
+        else:
+            modules.append(result.output)
+    if main_module is None:
+        return None, ExecutionError(f"{project.name} main module was not built")
+    return modules + [main_module], None
+
+
+def run_command(argv: List[str], target: type, run: Callable[[List[Any]], Tuple[Any, Optional[MinilangError]]]
+                ) -> int:
+    """Runs the command line of a target runner
+
+    The arguments are either artifact files of the target, run in order, or a
+    project directory, built first; the example project by default.
+
+    :param argv: The command line arguments
+    :param target: The target class, e.g. ``BytecodeTarget``
+    :param run: Runs the translated modules, dependencies first
+    :return: The exit code: what the entry function returned, if an integer, or 1 on errors
+    """
+    path = argv[0] if argv else os.path.join(os.path.dirname(__file__), '../../examples/testproj')
+    try:
+        if path.endswith(target.EXTENSION):
+            modules, error = [target.MODULE.load(filename) for filename in argv], None
+        else:
+            modules, error = build_program(path, target)
+    except (OSError, ValueError) as exc:
+        # missing or invalid artifacts and project files
+        print(f"{type(exc).__name__}: {exc}", file=sys.stderr)
+        return 1
+    result = None
+    if error is None:
+        result, error = run(modules)
+    if error:
+        print(error, file=sys.stderr)
+        for line in error.trace[1:] if isinstance(error, ExecutionError) else ():
+            print(f"  from {line}", file=sys.stderr)
+        return 1
+    return result if type(result) is int else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    project: Project = Project.load(argv[0] if argv else '.')
+    conf: JSOM = JSOM.parse_file(LEXCONF)
+    names = [name for name in project.preset().get('targets', []) if name in TARGETS]
+    if not names:
+        print(f"{project.name}: no {' or '.join(TARGETS)} target", file=sys.stderr)
+        return 1
+
+    failed = 0
+    for name in names:
+        target = TARGETS[name](project)
+        state = BuildState.load(state_path(project, name), project.root, config_fingerprint(conf))
+        _, results = build_project(project, conf, state=state, stage=target.stage, reuse=target.reuse)
+
+        for result in results:
+            filename = os.path.relpath(result.filename, project.root)
+            if result.errors:
+                failed += 1
+                for error in result.errors:
+                    print(f"{filename}: {error.message}", file=sys.stderr)
+            else:
+                artifact = os.path.relpath(target.path(result.filename), project.root)
+                print(f"{filename}: {target.describe(result.output)}{' (reused)' if result.reused else ''}"
+                      f" -> {artifact}")
+
+    return 1 if failed else 0
+
+
+# endregion (functions)
+# ---------------------------------------------------------
+# region ENTRYPOINT
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+# endregion (entrypoint)
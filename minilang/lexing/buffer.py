@@ -0,0 +1,294 @@
+# -*- encoding: utf8 -*-
+# ------------------------------------------------------------------------------
+# buffer.py
+# Created on 18/10/2026
+#
+# The MIT License
+#
+#
+# Copyright 2022 Jorge A. Gomes
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# region IMPORTS
+
+from array import array
+
+from minilang.utillities.code import Source, SourceLocation
+from typing import Optional, Iterator, Iterable, List, Dict
+
+# endregion (imports)
+# ---------------------------------------------------------
+# region EXPORTS
+
+
+__all__ = [
+    'TokenBuffer',
+    'BufferedToken',
+]
+
+
+# endregion (exports)
+# ---------------------------------------------------------
+# region CONSTANTS & ENUMS
+
+# array type codes of kinds, subkinds, starts, ends, bases and suffixes
+COLUMN_TYPES = 'H', 'H', 'i', 'i', 'B', 'H'
+
+# endregion (constants)
+# ---------------------------------------------------------
+# region CLASSES
+
+
+class TokenBuffer:
+    """Columnar storage for the tokens of a source
+
+    Every token is a row spread over parallel typed arrays. Kinds, subkinds and
+    suffixes are interned in a small string table and stored as its indices, so a
+    token costs about twenty bytes and no Python objects at all. ``BufferedToken``
+    views are only created when a row is accessed by index.
+
+    When the table is seeded with the ``LexerConfig.names`` of the configuration
+    the tokens are scanned with, the stored indices of kinds and subkinds are
+    their integer codes too.
+    """
+
+    __slots__ = '_source', '_names', '_codes', '_kinds', '_subkinds', '_starts', '_ends', '_bases', \
+        '_suffixes'
+
+    # region CLASSMETHODS
+
+    @classmethod
+    def from_columns(cls, source: Source, names: List[str], *columns) -> "TokenBuffer":
+        """Builds a buffer over existing columns
+
+        The columns may be any objects supporting the buffer indexing, like
+        memoryviews cast over a memory map; such buffers are read-only.
+
+        :param source: The source code the tokens were scanned from
+        :param names: The interned kind, subkind and suffix strings
+        :param columns: The kinds, subkinds, starts, ends, bases and suffixes columns
+        :return: The new buffer
+        """
+        buffer = cls(source)
+        buffer._names = list(names)
+        buffer._codes = {name: code for code, name in enumerate(buffer._names)}
+        buffer._kinds, buffer._subkinds, buffer._starts, buffer._ends, buffer._bases, buffer._suffixes = columns
+        return buffer
+
+    @classmethod
+    def from_tokens(cls, source: Source, tokens: Iterable, names: Optional[Iterable[str]] = None
+                    ) -> "TokenBuffer":
+        buffer = cls(source, names)
+        for token in tokens:
+            value = token._slice
+            buffer.append(token.kind, token.subkind, value.start, value.stop, token.base, token.suffix)
+        return buffer
+
+    # endregion
+
+    # region SPECIAL
+
+    def __init__(self, source: Source, names: Optional[Iterable[str]] = None):
+        self._source: Source = source
+        self._names: List[str] = [''] if names is None else list(names)
+        if not self._names or self._names[0] != '':
+            raise ValueError("TokenBuffer names must start with the empty name")
+        self._codes: Dict[str, int] = {name: code for code, name in enumerate(self._names)}
+        self._kinds, self._subkinds, self._starts, self._ends, self._bases, self._suffixes = \
+            (array(typecode) for typecode in COLUMN_TYPES)
+
+    def __len__(self) -> int:
+        return self._kinds.__len__()
+
+    def __getitem__(self, index: int) -> "BufferedToken":
+        if index < 0:
+            index += len(self._kinds)
+        if not 0 <= index < len(self._kinds):
+            raise IndexError("TokenBuffer index out of range")
+        return BufferedToken(self, index)
+
+    def __iter__(self) -> Iterator["BufferedToken"]:
+        for index in range(len(self._kinds)):
+            yield BufferedToken(self, index)
+
+    def __str__(self) -> str:
+        return f"[ TokenBuffer {self._source.filename} | {len(self)} tokens ]"
+
+    def __getstate__(self) -> tuple:
+        # the source code is not shipped along with the tokens; see `attach`
+        columns = tuple(column if isinstance(column, array) else array(typecode, column)
+                        for typecode, column in zip(COLUMN_TYPES, self.columns))
+        return (self._source.filename, self._names) + columns
+
+    def __setstate__(self, state: tuple) -> None:
+        filename, self._names, self._kinds, self._subkinds, self._starts, self._ends, self._bases, \
+            self._suffixes = state
+        self._source = Source(filename)
+        self._codes = {name: code for code, name in enumerate(self._names)}
+
+    # endregion
+
+    # region PROPERTIES
+
+    @property
+    def source(self) -> Source:
+        return self._source
+
+    @property
+    def names(self) -> List[str]:
+        """Gets the interned kind, subkind and suffix strings, indexed by code"""
+        return self._names
+
+    @property
+    def columns(self) -> tuple:
+        """Gets the kinds, subkinds, starts, ends, bases and suffixes columns, typed as `COLUMN_TYPES`"""
+        return self._kinds, self._subkinds, self._starts, self._ends, self._bases, self._suffixes
+
+    @property
+    def kinds(self) -> array:
+        return self._kinds
+
+    @property
+    def subkinds(self) -> array:
+        return self._subkinds
+
+    @property
+    def starts(self) -> array:
+        return self._starts
+
+    @property
+    def ends(self) -> array:
+        return self._ends
+
+    # endregion (properties)
+
+    # region METHODS
+
+    def attach(self, source: Source) -> "TokenBuffer":
+        """Attaches the source code the tokens were scanned from
+
+        Unpickled buffers only know the name of their source file; token values
+        and locations are available again once the source is attached.
+
+        :param source: The source, loaded the same way it was when scanned
+        :return: This buffer
+        """
+        self._source = source
+        return self
+
+    def code(self, name: str) -> int:
+        """Gets the interned code of a kind, subkind or suffix string, adding it if needed"""
+        code = self._codes.get(name)
+        if code is None:
+            code = self._codes[name] = len(self._names)
+            self._names.append(name)
+        return code
+
+    def append(self, kind: str, subkind: str, start: int, end: int, base: int = 10, suffix: str = '') -> None:
+        codes = self._codes
+        self._kinds.append(codes[kind] if kind in codes else self.code(kind))
+        self._subkinds.append(codes[subkind] if subkind in codes else self.code(subkind))
+        self._starts.append(start)
+        self._ends.append(end)
+        self._bases.append(base)
+        self._suffixes.append(codes[suffix] if suffix in codes else self.code(suffix))
+
+    def kind_of(self, index: int) -> str:
+        return self._names[self._kinds[index]]
+
+    def subkind_of(self, index: int) -> str:
+        return self._names[self._subkinds[index]]
+
+    def value_of(self, index: int) -> str:
+        return self._source[self._starts[index]:self._ends[index]]
+
+    def location_of(self, index: int) -> SourceLocation:
+        """Materializes the location of a token
+
+        Lines and columns are not stored; the location resolves them through the
+        line index of the source.
+
+        :param index: The token index in this buffer
+        :return: A new SourceLocation
+        """
+        start = self._starts[index]
+        return SourceLocation(self._source, start if start >= 0 else len(self._source))
+
+    # endregion (methods)
+
+
+class BufferedToken:
+    """A flyweight view over one row of a ``TokenBuffer``
+
+    Exposes the same read-only interface as ``Token``.
+    """
+
+    __slots__ = '_buffer', '_index'
+
+    def __init__(self, buffer: TokenBuffer, index: int):
+        self._buffer: TokenBuffer = buffer
+        self._index: int = index
+
+    def __str__(self) -> str:
+        return f"[ {self.kind} {self.subkind} {self.value} {self.location} ]"
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    @property
+    def source(self) -> Source:
+        return self._buffer._source
+
+    @property
+    def location(self) -> SourceLocation:
+        return self._buffer.location_of(self._index)
+
+    @property
+    def kind(self) -> str:
+        return self._buffer._names[self._buffer._kinds[self._index]]
+
+    @property
+    def subkind(self) -> str:
+        return self._buffer._names[self._buffer._subkinds[self._index]]
+
+    @property
+    def kind_code(self) -> int:
+        return self._buffer._kinds[self._index]
+
+    @property
+    def subkind_code(self) -> int:
+        return self._buffer._subkinds[self._index]
+
+    @property
+    def value(self) -> str:
+        return self._buffer.value_of(self._index)
+
+    @property
+    def base(self) -> int:
+        return self._buffer._bases[self._index]
+
+    @property
+    def suffix(self) -> str:
+        return self._buffer._names[self._buffer._suffixes[self._index]]
+
+
+# endregion (classes)
@@ -0,0 +1,264 @@
+# -*- encoding: utf8 -*-
+# ------------------------------------------------------------------------------
+# config.py
+# Created on 18/10/2026
+#
+# The MIT License
+#
+#
+# Copyright 2022 Jorge A. Gomes
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# region IMPORTS
+
+from sys import intern
+from types import MappingProxyType
+
+from minilang.utillities.jsom import JSOM
+from typing import Optional, Any, Union, Tuple, Mapping, FrozenSet, NamedTuple
+
+# endregion (imports)
+# ---------------------------------------------------------
+# region EXPORTS
+
+
+__all__ = [
+    'Kinds',
+    'NumberBase',
+    'LexerConfig',
+    'keyword_table',
+    'operator_trie',
+    'token_names',
+]
+
+
+# endregion (exports)
+# ---------------------------------------------------------
+# region CLASSES
+
+
+class Kinds(NamedTuple):
+    """The token kind names of a lexer configuration"""
+    whitespace: str
+    word: str
+    keyword: str
+    number: str
+    delimiter: str
+    operator: str
+    string: str
+    comment: str
+    documentation: str
+    eof: str
+    # the kind of the tokens standing for unscannable text, in recovery mode
+    error: str = 'ERROR'
+
+
+class NumberBase(NamedTuple):
+    """An integer base introduced by '0' and a base character, like '0x'"""
+    char: str
+    digits: str
+    digit_set: FrozenSet[str]
+    subkind: str
+    radix: int
+
+
+class LexerConfig:
+    """A lexer configuration, validated and resolved once
+
+    Built from the ``JSOM`` of a ``lexconf.json``; every lookup the lexer does
+    while scanning is a plain attribute holding a frozenset or a read-only
+    mapping, instead of a chain of ``JSOM`` attribute lookups. Instances are
+    immutable.
+    """
+
+    __slots__ = ('jsom', 'kinds', 'whitespace', 'include_whitespace', 'delimiters', 'operators',
+                 'operator_max_length', 'terminators', 'tokens', 'quotes', 'escape', 'digits', 'bases', 'separator',
+                 'number_subkind', 'float_subkind', 'word_max_length', 'keywords', 'identifier', 'markers',
+                 'synchronizers', 'operator_table', 'operator_trie', 'names', 'codes')
+
+    # region CLASSMETHODS
+
+    @classmethod
+    def compile(cls, config: Union[JSOM, "LexerConfig"]) -> "LexerConfig":
+        """Gets the LexerConfig of a configuration
+
+        :param config: A lexer configuration, compiled or not
+        :return: The compiled configuration
+        :raises ValueError: if the configuration misses entries or has invalid ones
+        """
+        if isinstance(config, LexerConfig):
+            return config
+        return cls(config)
+
+    # endregion
+
+    # region SPECIAL
+
+    def __init__(self, conf: JSOM):
+        try:
+            self._resolve(conf)
+        except (AttributeError, KeyError, TypeError) as exc:
+            raise ValueError(f"Invalid lexer configuration: {exc}") from exc
+
+        if not isinstance(self.operator_max_length, int) or self.operator_max_length < 1:
+            raise ValueError("Invalid lexer configuration: operator.max_length must be a positive integer")
+        if not isinstance(self.word_max_length, int) or self.word_max_length < 1:
+            raise ValueError("Invalid lexer configuration: word.max_length must be a positive integer")
+        if len(self.escape) != 1:
+            raise ValueError("Invalid lexer configuration: string.escape.mark must be a single character")
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        raise AttributeError("LexerConfig object is read-only")
+
+    def __str__(self) -> str:
+        return f"[ LexerConfig | {len(self.keywords)} keywords, {len(self.tokens)} tokens ]"
+
+    # endregion
+
+    # region METHODS
+
+    def _set(self, key: str, value: Any) -> None:
+        object.__setattr__(self, key, value)
+
+    def _resolve(self, conf: JSOM) -> None:
+        number = conf.number
+        self._set('jsom', conf)
+        self._set('kinds', Kinds(**{name: intern(kind) for name, kind in conf.kinds.items()}))
+        self._set('whitespace', frozenset(conf.whitespace.chars))
+        self._set('include_whitespace', bool(conf.whitespace.include))
+        self._set('delimiters', frozenset(conf.delimiter.chars))
+        self._set('operators', frozenset(conf.operator.chars))
+        self._set('operator_max_length', conf.operator.max_length)
+        self._set('terminators', self.whitespace | self.delimiters | self.operators)
+        self._set('synchronizers', self.whitespace | self.delimiters)
+        self._set('tokens', MappingProxyType({intern(token): intern(name) for token, name in conf.tokens.items()}))
+        self._set('quotes', MappingProxyType({quote: intern(conf.string[quote].subkind)
+                                              for quote in conf.string.delimiters}))
+        self._set('escape', conf.string.escape.mark)
+        self._set('digits', frozenset('0123456789'))
+
+        bases = {}
+        for char in number.integer.base_chars:
+            base = number.integer.base[char]
+            digit_set = frozenset(base.digits.lower() + base.digits.upper())
+            bases[char.lower()] = bases[char.upper()] = NumberBase(char, base.digits, digit_set, intern(base.subkind),
+                                                                   len(base.digits))
+        self._set('bases', MappingProxyType(bases))
+        self._set('separator', number.separator)
+        self._set('number_subkind', intern(number.subkind))
+        self._set('float_subkind', intern(number.float.subkind))
+
+        self._set('word_max_length', conf.word.max_length)
+        self._set('keywords', keyword_table(conf))
+        self._set('identifier', (self.kinds.word, intern(conf.word.subkind.upper())))
+        kinds = self.kinds
+        self._set('markers', MappingProxyType({
+            conf.comment.block.begin: (kinds.comment, intern(conf.comment.block.subkind), conf.comment.block.end,
+                                       conf.comment.include),
+            conf.comment.line: (kinds.comment, intern(conf.comment.subkind), None, conf.comment.include),
+            conf.document.block.begin: (kinds.documentation, intern(conf.document.block.subkind),
+                                        conf.document.block.end, conf.document.include),
+            conf.document.line: (kinds.documentation, intern(conf.document.subkind), None, conf.document.include),
+        }))
+
+        table = {operator: (self.kinds.operator, subkind, None, True) for operator, subkind in self.tokens.items()
+                 if operator and all(char in self.operators for char in operator)}
+        table.update(self.markers)
+        self._set('operator_table', MappingProxyType(table))
+        self._set('operator_trie', operator_trie(table))
+
+        self._set('names', tuple(intern(name) for name in token_names(conf)))
+        self._set('codes', MappingProxyType({name: code for code, name in enumerate(self.names)}))
+
+    # endregion (methods)
+
+
+# endregion (classes)
+# ---------------------------------------------------------
+# region FUNCTIONS
+
+
+def token_names(conf: JSOM) -> Tuple[str, ...]:
+    """Lists the kind and subkind names of a configuration, indexed by their integer code
+
+    Code 0 is the empty name, i.e. no subkind; then come the kinds and every
+    subkind, punctuation names included. The order only depends on the
+    configuration, so the codes generated in tokens.py match the ones tokens
+    carry as long as both come from the same configuration.
+
+    :param conf: The lexer configuration
+    :return: The names
+    """
+    names: list = ['']
+    names.extend(Kinds(**conf.kinds))
+    names.extend(conf.tokens.values())
+    names.extend(conf.string[quote].subkind for quote in conf.string.delimiters)
+    names.append(conf.keyword.subkind.upper())
+    names.extend(key_kind.upper() for key_kind in conf.keyword.subkinds)
+    names.append(conf.word.subkind.upper())
+    names.append(conf.number.subkind)
+    names.append(conf.number.float.subkind)
+    names.extend(conf.number.integer.base[char].subkind for char in conf.number.integer.base_chars)
+    names.extend((conf.comment.subkind, conf.comment.block.subkind, conf.document.subkind,
+                  conf.document.block.subkind))
+    return tuple(dict.fromkeys(names))
+
+
+def keyword_table(conf: JSOM) -> Mapping[str, Tuple[str, str]]:
+    """Maps every keyword to its (kind, subkind) pair
+
+    Reserved words take precedence over the other keyword subkinds, and later
+    subkinds over earlier ones. Every string is interned.
+
+    :param conf: The lexer configuration
+    :return: A read-only mapping
+    """
+    table: dict = {}
+    kind: str = intern(conf.kinds.keyword)
+    for key_kind in conf.keyword.subkinds:
+        if key_kind in conf.keyword:
+            for word in conf.keyword[key_kind]:
+                table[intern(word)] = (kind, intern(key_kind.upper()))
+    for word in conf.keyword.reserved:
+        table[intern(word)] = (kind, intern(conf.keyword.subkind.upper()))
+    return MappingProxyType(table)
+
+
+def operator_trie(table: Mapping[str, Tuple[str, str, Optional[str], bool]]) -> dict:
+    """Builds the character trie of the operators and comment markers
+
+    Every node maps the next character to its child node; the node ending an
+    entry also maps '' to the entry, which can never be a character. Scanning
+    walks it as far as the source allows and takes the last entry seen, so
+    the longest operator always wins.
+
+    :param table: Maps operators and markers to (kind, subkind, end marker, include)
+    :return: The root node, not to be modified
+    """
+    root: dict = {}
+    for operator, entry in table.items():
+        node = root
+        for char in operator:
+            node = node.setdefault(char, {})
+        node[''] = entry
+    return root
+
+# endregion (functions)
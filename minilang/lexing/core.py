@@ -31,9 +31,17 @@
 
 import os
 
+from sys import intern
+
 from minilang.utillities.jsom import JSOM
 from minilang.utillities.code import Source, SourceLocation
-from typing import Optional, Any, Callable, TypeVar, Union, Tuple, List
+from minilang.lexing.buffer import TokenBuffer
+from minilang.lexing.config import Kinds, LexerConfig, keyword_table, token_names
+from typing import TYPE_CHECKING, Optional, Any, Callable, TypeVar, Union, Tuple, List, FrozenSet, Iterator
+
+if TYPE_CHECKING:
+    # the scanner module imports this one
+    from minilang.lexing.scanner import Scanner
 
 # endregion (imports)
 # ---------------------------------------------------------
@@ -43,7 +51,8 @@ from typing import Optional, Any, Callable, TypeVar, Union, Tuple, List
 __all__ = [
     'Token',
     'Lexer',
-    'export_constants'
+    'export_constants',
+    'keyword_table',
 ]
 
 
@@ -56,6 +65,12 @@ F = Callable[[...], "Token"]
 
 TEMPLATE = """# -*- encoding: utf8 -*-
 
+# region IMPORTS
+
+from sys import intern
+
+# endregion (imports)
+
 # region EXPORTS
 
 __all__ = [
@@ -70,6 +85,13 @@ __all__ = [
 {}
 
 # endregion (constants)
+
+# region CODES
+
+
+{}
+
+# endregion (codes)
 """
 
 # endregion (constants)
@@ -90,6 +112,17 @@ class UnexpectedCharError(Error):
 
 
 class Token:
+    """A token of a source code
+
+    The value is sliced from the source the first time it is needed and kept;
+    the lexer gives words, delimiters and operators their value upfront,
+    interned, so equal values are usually the same string object. Kinds and
+    subkinds also come as integer codes; see ``LexerConfig.codes`` and the
+    ``TC_``/``SC_`` constants of tokens.py.
+    """
+
+    __slots__ = '_source', '_location', '_kind', '_slice', '_subkind', '_base', '_suffix', '_value', '_kind_code', \
+        '_subkind_code'
 
     def __init__(self, location: SourceLocation, kind: str, value_slice: slice, **kwargs):
         self._source: Source = location.source
@@ -99,6 +132,9 @@ class Token:
         self._subkind: str = kwargs.get('subkind', '')
         self._base: int = kwargs.get('base', 10)
         self._suffix: str = kwargs.get('suffix', '')
+        self._value: Optional[str] = kwargs.get('value')
+        self._kind_code: int = kwargs.get('kind_code', 0)
+        self._subkind_code: int = kwargs.get('subkind_code', 0)
 
     def __str__(self) -> str:
         return f"[ {self._kind} {self._subkind} {self.value} {self._location} ]"
@@ -119,9 +155,20 @@ class Token:
     def subkind(self):
         return self._subkind
 
+    @property
+    def kind_code(self) -> int:
+        return self._kind_code
+
+    @property
+    def subkind_code(self) -> int:
+        return self._subkind_code
+
     @property
     def value(self):
-        return self._source[self._slice]
+        value = self._value
+        if value is None:
+            value = self._value = self._source[self._slice]
+        return value
 
     @property
     def base(self):
@@ -131,65 +178,151 @@ class Token:
     def suffix(self):
         return self._suffix
 
+    def shift(self, delta: int) -> "Token":
+        """Moves the token by `delta` characters, after an edit of the code before it
+
+        :param delta: The change in length of the code
+        :return: This token
+        """
+        self._location.advance(delta)
+        if self._slice.start >= 0:
+            self._slice = slice(self._slice.start + delta, self._slice.stop + delta)
+        return self
+
 
 class Lexer:
+    """Scans a source code into tokens
 
-    def __init__(self, config: JSOM, source: Source, **kwargs):
-        self._config: JSOM = config
+    Keyword arguments: `scanner`, a compiled ``Scanner`` to delegate scanning
+    to; `on_unexpected`, the callback building the errors; `start`, the index
+    to start scanning at; `export`, to regenerate tokens.py; and `recover`.
+
+    Sources backed by bytes, see ``MappedSource``, are only scanned by a
+    ``Scanner``: the character-driven path counts one index per character.
+
+    By default scanning stops at the first error. In recovery mode the text
+    from the start of the failed token up to the next whitespace or delimiter
+    becomes an ERROR token and scanning goes on, so a single pass reports every
+    error; they are all kept in ``Lexer.errors``.
+    """
+
+    def __init__(self, config: Union[JSOM, LexerConfig], source: Source, **kwargs):
+        self._config: LexerConfig = LexerConfig.compile(config)
         self._source: Source = source
-        self._pos: SourceLocation = SourceLocation(source, slice(0, -1), -1, 1, 1)
-        self._char: str = ''
+        self._index: int = kwargs.get('start', 0)
+        self._char: Optional[str] = source[self._index] if self._index < len(source) else None
+        self._scanner: Optional["Scanner"] = kwargs.get('scanner')
+        if self._scanner is None and source.loaded and not isinstance(source.code, str):
+            raise TypeError(f"{source.filename} is read as bytes and can only be scanned by a Scanner")
+        self._error: Optional[Error] = None
+        self._errors: List[Error] = []
+        self._recover: bool = kwargs.get('recover', False)
         self._on_unexpected: Optional[Callable[[SourceLocation, str, Optional[str]], Any]] = kwargs.get('on_unexpected',
                                                                                                         on_unexpected)
         if kwargs.get('export', False):
-            export_constants(config)
+            export_constants(self._config.jsom)
+
+    @property
+    def config(self) -> LexerConfig:
+        return self._config
 
     @property
     def source(self) -> Source:
         return self._source
 
+    @property
+    def scanner(self) -> Optional["Scanner"]:
+        return self._scanner
+
+    @property
+    def recover(self) -> bool:
+        return self._recover
+
+    @property
+    def errors(self) -> List[Error]:
+        """Gets every error of the last scan; only recovery mode finds more than one"""
+        return self._errors
+
+    @property
+    def error(self) -> Optional[Error]:
+        """Gets the error that stopped the last scan, if any"""
+        return self._error
+
     def _kind_subkind(self, kind: str, subkind: Union[str, None]) -> Union[str, None]:
-        delim = self._config.get('subkind_delimiter')
+        delim = self._config.jsom.get('subkind_delimiter')
         if isinstance(delim, str) and subkind is not None and kind != subkind:
             return delim.join((kind, subkind))
         return kind
 
+    def _token(self, location: SourceLocation, kind: str, value_slice: slice, subkind: str = '', **kwargs) -> Token:
+        codes = self._config.codes
+        return Token(location, kind, value_slice, subkind=subkind, kind_code=codes[kind],
+                     subkind_code=codes.get(subkind, 0), **kwargs)
+
+    def _location(self) -> SourceLocation:
+        return SourceLocation(self._source, self._index)
+
     def _advance(self):
         """Advances the lexer to the next character
 
         :return: None
         :raises RuntimeError: if character _index is out of bounds
         """
-        self._pos.advance(self._char)
-        if self._pos.index >= len(self._source.code):
+        self._index += 1
+        if self._index >= len(self._source.code):
+            self._char = None
+        else:
+            self._char = self._source[self._index]
+
+    def _seek(self, index: int):
+        """Moves the lexer to a character at or after the current one
+
+        :param index: The index of the character
+        :return: None
+        """
+        self._index = index
+        if index >= len(self._source.code):
             self._char = None
         else:
-            self._char = self._source[self._pos.index]
+            self._char = self._source[index]
 
     def _scan_string(self) -> Token:
         """Scans and returns a STRING type of token
 
+        Jumps from one escape mark to the next with ``find``, instead of stepping
+        through every character of the string.
+
         :return: The token
         """
         quote: str = self._char
         conf = self._config
-        subkind: str = conf.string[quote].subkind
-        start: SourceLocation = self._pos.copy()
-        end: SourceLocation = start
-        self._advance()
-
-        while self._char is not None:
-            if self._char == conf.string.escape.mark:
-                self._advance()
-                self._advance()
-            elif self._char == quote:
-                self._advance()
-                end = self._pos.copy()
+        code: Union[str, bytes] = self._source.code
+        start: int = self._index
+        closing, escape = quote, conf.escape
+        if not isinstance(code, str):
+            closing, escape = closing.encode('utf-8'), escape.encode('utf-8')
+
+        index: int = start + 1
+        stop: int = code.find(closing, index)
+        while stop >= 0:
+            mark = code.find(escape, index, stop)
+            if mark < 0:
                 break
-            else:
-                self._advance()
+            # the escaped character may be the quote itself
+            index = mark + 2
+            if index > stop:
+                stop = code.find(closing, index)
+
+        if stop < 0:
+            # unterminated strings keep an empty slice
+            self._seek(len(code))
+            end = start
+        else:
+            end = stop + 1
+            self._seek(end)
 
-        return Token(start, conf.kinds.string, slice(start.index, end.index), subkind=subkind)
+        return self._token(SourceLocation(self._source, start), conf.kinds.string, slice(start, end),
+                           subkind=conf.quotes[quote])
 
     def _scan_number(self) -> Tuple[Union[Token, None], Union[Error, None]]:
         """Scans and returns a NUMBER type of token
@@ -197,236 +330,292 @@ class Lexer:
         :return: The token or an error
         """
         conf = self._config
-        start = self._pos.copy()
+        start = self._location()
         base = 10
-        subkind = conf.number.subkind
-        digits: str = '0123456789'
+        subkind = conf.number_subkind
+        digits: FrozenSet[str] = conf.digits
         has_decimal: bool = False
         has_other_base: bool = False
-        idx: int = 0
-        number: str = ''
         suffix: str = ''
 
-        while self._char is not None:
-            if idx == 0 and self._char == '0':
-                idx += 1
-                number += self._char
+        if self._char == '0':
+            self._advance()
+            number_base = conf.bases.get(self._char)
+            if number_base is not None:
+                digits = number_base.digit_set
+                subkind = number_base.subkind
+                base = number_base.radix
+                has_other_base = True
                 self._advance()
-                if self._char.lower() in conf.number.integer.base_chars.lower():
-                    digits = conf.number.integer.base[self._char].digits
-                    subkind = conf.number.integer.base[self._char].subkind
-                    base = len(digits)
-                    has_other_base = True
-                    idx += 1
-                    number += self._char
-                    self._advance()
-                    continue
 
-            if self._char.lower() in digits.lower():
-                idx += 1
-                number += self._char
+        while self._char is not None:
+            if self._char in digits:
                 self._advance()
 
-            elif self._char == conf.number.separator:
-                idx += 1
+            elif self._char == conf.separator:
                 self._advance()
 
             elif self._char == '.':
                 if has_other_base or has_decimal:
-                    return None, self._on_unexpected(self._pos.copy(), self._char)
+                    return None, self._on_unexpected(self._location(), self._char)
                 has_decimal = True
-                subkind = "FLOAT"
-                idx += 1
-                number += self._char
+                subkind = conf.float_subkind
                 self._advance()
 
             elif self._char.isalpha() and not has_other_base:
-                if has_other_base:
-                    return None, self._on_unexpected(self._pos.copy(), self._char, "Not base 10")
-                idx += 1
                 suffix += self._char
                 self._advance()
 
-            elif self._char in conf.whitespace.chars:
-                break
-
-            elif self._char in conf.delimiter.chars:
-                break
-
-            elif self._char in conf.operator.chars:
+            elif self._char in conf.terminators:
                 break
 
             else:
-                return None, self._on_unexpected(self._pos.copy(), self._char)
+                return None, self._on_unexpected(self._location(), self._char)
 
-        end = self._pos.index
-        token = Token(start, conf.kinds.number, slice(start.index, end), base=base, suffix=suffix, subkind=subkind)
+        end = self._index
+        token = self._token(start, conf.kinds.number, slice(start.index, end), subkind=subkind, base=base,
+                            suffix=suffix)
         return token, None
 
     def _scan_operator(self) -> Tuple[Union[Token, None], Union[Error, None]]:
         """Scans and returns a OPERATOR type of token
 
+        The longest operator or comment marker starting at the current character
+        is taken, walking the operator trie of the configuration; a character
+        starting none of them is an operator of its own, with no subkind.
+
         :return: The token
         """
         conf = self._config
-        start = self._pos.copy()
-        operator: str = ''
-        kind: str = conf.kinds.operator
-        subkind: Union[str, None]
-
-        while self._char is not None:
-            if self._char in conf.operator.chars:
-
-                operator += self._char
-                self._advance()
-
-                if len(operator) > conf.operator.max_length:
-                    return None, self._on_unexpected(self._pos.copy(), self._char)
-
-            else:
+        source: Source = self._source
+        length: int = len(source.code)
+        start: int = self._index
+        entry: Optional[Tuple[str, str, Optional[str], bool]] = None
+        stop: int = start + 1
+        node: Optional[dict] = conf.operator_trie
+        index: int = start
+
+        while index < length:
+            node = node.get(source[index])
+            if node is None:
                 break
-
-        if operator == conf.document.line:
-            end = self._scan_comment().index
-            kind = conf.kinds.documentation
-            subkind = conf.document.subkind
-            include = conf.document.include
-
-        elif operator == conf.document.block.begin:
-            end = self._scan_comment(conf.document.block.end).index
-            kind = conf.kinds.documentation
-            subkind = conf.document.block.subkind
-            include = conf.document.include
-
-        elif operator == conf.comment.line:
-            end = self._scan_comment().index
-            kind = conf.kinds.comment
-            subkind = conf.comment.subkind
-            include = conf.comment.include
-
-        elif operator == conf.comment.block.begin:
-            end = self._scan_comment(conf.comment.block.end).index
-            kind = conf.kinds.comment
-            subkind = conf.comment.block.subkind
-            include = conf.comment.include
-        else:
-            subkind = conf.tokens.get(operator, '')
-            end = self._pos.index
-            include = True
-
-        token = Token(start, kind, slice(start.index, end), subkind=subkind)
+            index += 1
+            if '' in node:
+                entry = node['']
+                stop = index
+
+        self._seek(stop)
+        if entry is None:
+            return self._token(SourceLocation(source, start), conf.kinds.operator, slice(start, stop), subkind='',
+                               value=intern(source[start:stop])), None
+
+        kind, subkind, terminator, include = entry
+        if kind == conf.kinds.operator:
+            return self._token(SourceLocation(source, start), kind, slice(start, stop), subkind=subkind,
+                               value=intern(source[start:stop])), None
+
+        end = self._scan_comment(terminator).index
         if not include:
-            token = None
-        return token, None
+            return None, None
+        return self._token(SourceLocation(source, start), kind, slice(start, end), subkind=subkind), None
 
     def _scan_comment(self, end: Union[str, None] = None) -> SourceLocation:
         """Scans a COMMENT type of token
 
+        Jumps straight past the ending marker, or to the end of the line, with
+        ``find``.
+
         :param end: An optional ending marker to match for block comments or None for _line comments
         :return: The position in the _source code where the comment ends
         """
-        comment: str = ''
-        while self._char is not None:
-            if self._char == '\n' and end is None:
-                break
-
-            comment += self._char
-            self._advance()
+        code: Union[str, bytes] = self._source.code
+        marker: Union[str, bytes] = '\n' if end is None else end
+        if not isinstance(code, str):
+            marker = marker.encode('utf-8')
 
-            if end is not None:
-                if comment.endswith(end):
-                    break
+        stop: int = code.find(marker, self._index)
+        if stop < 0:
+            stop = len(code)
+        elif end is not None:
+            stop += len(marker)
 
-        return self._pos.copy()
+        self._seek(stop)
+        return self._location()
 
     def _scan_word(self) -> Tuple[Union[Token, None], Union[Error, None]]:
         """Scans and returns a WORD type of token
 
         :return: The token returned after `fn` gets called or an error
         """
-        conf = self._config
-        start = self._pos.copy()
-        word: str = ''
-        subkind: str
+        start: int = self._index
+        max_length: int = self._config.word_max_length
 
-        while self._char is not None:
-            if not self._char.isalnum() or self._char == '_':
-                break
-            word += self._char
+        while self._char is not None and self._char.isalnum():
             self._advance()
 
-            if len(word) > conf.word.max_length:
-                return None, self._on_unexpected(self._pos.copy(), self._char, "Identifier is too long")
+            if self._index - start > max_length:
+                return None, self._on_unexpected(self._location(), self._char, "Identifier is too long")
 
-        kind = conf.kinds.word
-        subkind = conf.word.subkind
-        if word in conf.keyword.reserved:
-            kind = conf.kinds.keyword
-            subkind = conf.keyword.subkind
-        else:
-            for key_kind in conf.keyword.subkinds:
-                if key_kind in conf.keyword and word in conf.keyword[key_kind]:
-                    kind = conf.kinds.keyword
-                    subkind = key_kind
-
-        token = Token(start, kind, slice(start.index, self._pos.index), subkind=subkind.upper())
+        word: str = intern(self._source[start:self._index])
+        kind, subkind = self._config.keywords.get(word, self._config.identifier)
+        token = self._token(SourceLocation(self._source, start), kind, slice(start, self._index), subkind=subkind,
+                            value=word)
         return token, None
 
-    def gen_tokens(self) -> Tuple[List[Token], Optional[Error]]:
-        """Scans the _source code and returns a list of tokens
+    def _recover_from(self, start: int, error: Error) -> Token:
+        """Turns the text of a failed token into an ERROR token, in recovery mode
 
-        :return: The list of tokens or an error
+        The token spans from `start` to the next whitespace or delimiter, where
+        scanning resumes.
+
+        :param start: The index the failed token started at
+        :param error: The error
+        :return: The ERROR token
+        """
+        synchronizers = self._config.synchronizers
+        self._errors.append(error)
+        if self._index <= start:
+            self._advance()
+        while self._char is not None and self._char not in synchronizers:
+            self._advance()
+        return self._token(SourceLocation(self._source, start), self._config.kinds.error, slice(start, self._index))
+
+    def iter_tokens(self) -> Iterator[Token]:
+        """Scans the _source code, yielding tokens as they are found
+
+        Nothing is kept after a token is yielded, so consumers can overlap their
+        work with scanning. On error the generator stops early and the error is
+        left in ``Lexer.error``, unless in recovery mode.
+
+        :return: The token iterator
         """
-        tokens: List[Token] = []
-        token: Token
+        self._error = None
+        self._errors = []
         conf = self._config
 
+        if self._scanner is not None:
+            length = len(self._source)
+            codes = conf.codes
+            errors = self._errors if self._recover else None
+            rows = self._scanner.rows(self._source, self._on_unexpected, self._index, errors=errors)
+            for kind, subkind, start, end, base, suffix, value in rows:
+                if kind is None:
+                    self._error = subkind
+                    self._errors.append(subkind)
+                    return
+                location = SourceLocation(self._source, start if start >= 0 else length)
+                yield Token(location, kind, slice(start, end), subkind=subkind, base=base, suffix=suffix, value=value,
+                            kind_code=codes[kind], subkind_code=codes.get(subkind, 0))
+            if self._errors:
+                self._error = self._errors[0]
+            return
+
         while self._char is not None:
-            if self._char in conf.whitespace.chars:
-                start = self._pos.copy()
-                while self._char is not None and self._char in conf.whitespace.chars:
+            start: int = self._index
+            error: Optional[Error] = None
+
+            if self._char in conf.whitespace:
+                location = self._location()
+                while self._char is not None and self._char in conf.whitespace:
                     self._advance()
-                if conf.whitespace.include:
-                    token = Token(start, conf.kinds.whitespace, slice(start.index, self._pos.index))
-                    tokens.append(token)
+                if conf.include_whitespace:
+                    yield self._token(location, conf.kinds.whitespace, slice(start, self._index))
                 continue
 
-            if self._char in conf.string.delimiters:
-                tokens.append(self._scan_string())
+            if self._char in conf.quotes:
+                yield self._scan_string()
 
-            elif self._char in "0123456789":
+            elif self._char in conf.digits:
                 token, error = self._scan_number()
-                if error:
-                    return [], error
-                tokens.append(token)
+                if not error:
+                    yield token
 
-            elif self._char in conf.delimiter.chars:
+            elif self._char in conf.delimiters:
                 kind = conf.kinds.delimiter
                 subkind = conf.tokens.get(self._char, '')
-                token = Token(self._pos.copy(), kind, slice(self._pos.index, self._pos.index + 1), subkind=subkind)
-                tokens.append(token)
+                token = self._token(self._location(), kind, slice(self._index, self._index + 1), subkind=subkind,
+                                    value=self._char)
                 self._advance()
+                yield token
 
-            elif self._char in conf.operator.chars:
+            elif self._char in conf.operators:
                 token, error = self._scan_operator()
-                if error:
-                    return [], error
                 if token:
-                    tokens.append(token)
+                    yield token
 
             elif self._char.isalpha():
                 token, error = self._scan_word()
-                if error:
-                    return [], error
-                tokens.append(token)
+                if not error:
+                    yield token
 
             else:
-                error = on_unexpected(self._pos.copy(), self._char)
-                return [], error
+                error = self._on_unexpected(self._location(), self._char)
 
-        token = Token(self._pos.copy(), conf.kinds.eof, slice(-1, -1))
-        tokens.append(token)
-        return tokens, None
+            if error:
+                if not self._recover:
+                    self._error = error
+                    self._errors.append(error)
+                    return
+                yield self._recover_from(start, error)
+
+        if self._errors:
+            self._error = self._errors[0]
+        yield self._token(self._location(), conf.kinds.eof, slice(-1, -1), value='')
+
+    def gen_tokens(self) -> Tuple[List[Token], Optional[Error]]:
+        """Scans the _source code and returns a list of tokens
+
+        When the lexer was given a compiled ``Scanner`` the whole scan is delegated
+        to it; otherwise the source is scanned character by character. In
+        recovery mode all the tokens are returned along with the first error;
+        see ``Lexer.errors`` for the others.
+
+        :return: The list of tokens or an error
+        """
+        if self._scanner is not None:
+            self._errors = []
+            errors = self._errors if self._recover else None
+            tokens, self._error = self._scanner.scan(self._source, self._on_unexpected, self._index, errors)
+            if self._error and not self._errors:
+                self._errors.append(self._error)
+            return tokens, self._error
+
+        tokens: List[Token] = list(self.iter_tokens())
+        if self._error and not self._recover:
+            return [], self._error
+        return tokens, self._error
+
+    def recover_tokens(self) -> Tuple[List[Token], List[Error]]:
+        """Scans the whole _source code in recovery mode
+
+        :return: The list of tokens, ERROR tokens included, and the list of errors
+        """
+        recover, self._recover = self._recover, True
+        try:
+            tokens, _ = self.gen_tokens()
+        finally:
+            self._recover = recover
+        return tokens, list(self._errors)
+
+    def gen_buffer(self) -> Tuple[Optional[TokenBuffer], Optional[Error]]:
+        """Scans the _source code into a columnar token buffer
+
+        In recovery mode the buffer is returned along with the first error.
+
+        :return: The token buffer or an error
+        """
+        if self._scanner is not None:
+            self._errors = []
+            errors = self._errors if self._recover else None
+            buffer, self._error = self._scanner.scan_buffer(self._source, self._on_unexpected, self._index, errors)
+            if self._error and not self._errors:
+                self._errors.append(self._error)
+            return buffer, self._error
+
+        tokens, error = self.gen_tokens()
+        if error and not self._recover:
+            return None, error
+        return TokenBuffer.from_tokens(self._source, tokens, self._config.names), error
 
 # endregion (classes)
 # ---------------------------------------------------------
@@ -434,6 +623,15 @@ class Lexer:
 
 
 def export_constants(conf: JSOM):
+    """Generates the token constants module, tokens.py
+
+    Constants are interned, so they are the very strings the lexer gives its
+    tokens. The integer codes of kinds (TC_) and subkinds (SC_), punctuation
+    names included, follow them; see `token_names`.
+
+    :param conf: The lexer configuration
+    :return: None
+    """
     path = os.path.split(__file__)[0]
     src_file: str = os.path.join(path, 'tokens.py')
     exports: list[str] = []
@@ -441,40 +639,49 @@ def export_constants(conf: JSOM):
 
     for k, v in conf.kinds.items():
         exports.append(f"    'TK_{k.upper()}',")
-        consts.append(f"TK_{k.upper()} = '{v}'")
+        consts.append(f"TK_{k.upper()} = intern('{v}')")
 
     for k, v in conf.tokens.items():
         exports.append(f"    '{v}',")
-        consts.append(f"{v.upper()} = '{k}'")
+        consts.append(f"{v.upper()} = intern('{k}')")
 
     for k in conf.string.delimiters:
         v = conf.string[k].subkind
         exports.append(f"    'SK_{v.upper()}',")
-        consts.append(f"SK_{v.upper()} = '{v.upper()}'")
+        consts.append(f"SK_{v.upper()} = intern('{v.upper()}')")
 
     exports.append(f"    'SK_{conf.keyword.subkind.upper()}',")
-    consts.append(f"SK_{conf.keyword.subkind.upper()} = '{conf.keyword.subkind.upper()}'")
+    consts.append(f"SK_{conf.keyword.subkind.upper()} = intern('{conf.keyword.subkind.upper()}')")
     for v in conf.keyword[conf.keyword.subkind.lower()]:
         exports.append(f"    'KW_{v.upper()}',")
-        consts.append(f"KW_{v.upper()} = '{v}'")
+        consts.append(f"KW_{v.upper()} = intern('{v}')")
 
     for k in conf.keyword.subkinds:
         exports.append(f"    'SK_{k.upper()}',")
-        consts.append(f"SK_{k.upper()} = '{k.upper()}'")
+        consts.append(f"SK_{k.upper()} = intern('{k.upper()}')")
         for v in conf.keyword[k]:
             exports.append(f"    'KW_{v.upper()}',")
-            consts.append(f"KW_{v.upper()} = '{v}'")
+            consts.append(f"KW_{v.upper()} = intern('{v}')")
 
     exports.append(f"    'SK_{conf.word.subkind.upper()}',")
-    consts.append(f"SK_{conf.word.subkind.upper()} = '{conf.word.subkind.upper()}'")
+    consts.append(f"SK_{conf.word.subkind.upper()} = intern('{conf.word.subkind.upper()}')")
 
     exports.append(f"    'SK_{conf.number.subkind.upper()}',")
-    consts.append(f"SK_{conf.number.subkind.upper()} = '{conf.number.subkind.upper()}'")
+    consts.append(f"SK_{conf.number.subkind.upper()} = intern('{conf.number.subkind.upper()}')")
 
     exports.append(f"    'SK_{conf.number.float.subkind.upper()}',")
-    consts.append(f"SK_{conf.number.float.subkind.upper()} = '{conf.number.float.subkind.upper()}'")
-
-    code = TEMPLATE.format('\n'.join(exports), '\n'.join(consts))
+    consts.append(f"SK_{conf.number.float.subkind.upper()} = intern('{conf.number.float.subkind.upper()}')")
+
+    kinds = {name: key for key, name in Kinds(**conf.kinds)._asdict().items()}
+    codes: list[str] = []
+    for code, name in enumerate(token_names(conf)):
+        if not name:
+            continue
+        const = f"TC_{kinds[name].upper()}" if name in kinds else f"SC_{name.upper()}"
+        exports.append(f"    '{const}',")
+        codes.append(f"{const} = {code}")
+
+    code = TEMPLATE.format('\n'.join(exports), '\n'.join(consts), '\n'.join(codes))
 
     with open(src_file, 'w', encoding='utf8') as source:
         source.write(code)
@@ -0,0 +1,98 @@
+# -*- encoding: utf8 -*-
+# ------------------------------------------------------------------------------
+# incremental.py
+# Created on 18/10/2026
+#
+# The MIT License
+#
+#
+# Copyright 2022 Jorge A. Gomes
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# region IMPORTS
+
+from bisect import bisect_left
+
+from minilang.utillities.jsom import JSOM
+from minilang.utillities.code import Source
+from minilang.lexing.core import Token, Lexer, Error
+from typing import Optional, Tuple, List
+
+# endregion (imports)
+# ---------------------------------------------------------
+# region EXPORTS
+
+
+__all__ = [
+    'relex',
+]
+
+
+# endregion (exports)
+# ---------------------------------------------------------
+# region FUNCTIONS
+
+
+def relex(conf: JSOM, source: Source, tokens: List[Token], start: int, stop: int, text: str, **kwargs
+          ) -> Tuple[List[Token], Optional[Error]]:
+    """Applies an edit to a source and updates its tokens
+
+    Scanning restarts right after the last token that ends before the edit,
+    as neither that token nor the character that ended it are touched. It stops
+    as soon as a new token starts where an old token, moved by the edit, started:
+    the lexer keeps no state between tokens, so everything after that point is
+    the same as before and the old tokens are only shifted.
+
+    :param conf: The lexer configuration
+    :param source: The source the tokens were scanned from; it gets edited
+    :param tokens: The tokens of the source before the edit
+    :param start: The index of the first replaced character
+    :param stop: The index after the last replaced character
+    :param text: The replacement text
+    :param kwargs: Additional Lexer arguments, e.g. 'scanner' or 'on_unexpected'
+    :return: The new list of tokens or an error
+    """
+    # tokens scanned up to the EOF by an unterminated string have an empty value slice
+    keep = bisect_left(tokens, start, 0, max(len(tokens) - 1, 0), key=lambda t: t._slice.stop)
+    while keep and tokens[keep - 1]._slice.stop <= tokens[keep - 1]._slice.start:
+        keep -= 1
+    restart = tokens[keep - 1]._slice.stop if keep else 0
+
+    old = bisect_left(tokens, stop, keep, len(tokens), key=lambda t: t.location.index)
+    delta = source.replace(start, stop, text)
+    edited = start + len(text)
+    fresh: List[Token] = []
+
+    lexer = Lexer(conf, source, start=restart, **kwargs)
+    for token in lexer.iter_tokens():
+        index = token.location.index
+        if index >= edited:
+            while old < len(tokens) and tokens[old].location.index + delta < index:
+                old += 1
+            if old < len(tokens) and tokens[old].location.index + delta == index:
+                return tokens[:keep] + fresh + [t.shift(delta) for t in tokens[old:]], None
+        fresh.append(token)
+
+    if lexer.error:
+        return [], lexer.error
+    return tokens[:keep] + fresh, None
+
+# endregion (functions)
@@ -0,0 +1,461 @@
+# -*- encoding: utf8 -*-
+# ------------------------------------------------------------------------------
+# scanner.py
+# Created on 18/10/2026
+#
+# The MIT License
+#
+#
+# Copyright 2022 Jorge A. Gomes
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# region IMPORTS
+
+import re
+import sys
+
+from sys import intern
+
+from minilang.utillities.jsom import JSOM
+from minilang.utillities.code import Source, SourceLocation, code_point
+from minilang.lexing.core import Token, Error, on_unexpected
+from minilang.lexing.buffer import TokenBuffer
+from minilang.lexing.config import LexerConfig
+from typing import Optional, Callable, Iterable, Iterator, Union, Tuple, List, Dict, Set, FrozenSet
+
+# endregion (imports)
+# ---------------------------------------------------------
+# region EXPORTS
+
+
+__all__ = [
+    'Scanner',
+]
+
+
+# endregion (exports)
+# ---------------------------------------------------------
+# region CONSTANTS & ENUMS
+
+# words start with a letter and go on with letters and digits, as ``str.isalpha`` and ``str.isalnum``
+# tell them; ``[^\W_]`` is exactly ``str.isalnum``, see `_letter` for the letters
+WORD = r"(?P<word>{letter}[^\W_]*)"
+# bytes patterns only know ASCII letters; any byte of a multibyte UTF-8 sequence is taken as a letter, then
+# words and numbers holding such bytes are matched again as text, see `Scanner._narrow`
+BYTES_LETTER = r"(?:[^\W\d_]|[\x80-\xff])"
+BYTES_WORD = r"(?P<word>(?:[^\W\d_]|[\x80-\xff])(?:[^\W_]|[\x80-\xff])*)"
+
+# the letter class of text patterns, built on first use; see `_letter`
+_letter_class: Optional[str] = None
+
+# endregion (constants)
+# ---------------------------------------------------------
+# region CLASSES
+
+
+class Scanner:
+    """Precompiled scanning engine for a lexer configuration
+
+    The whole configuration is folded into a single master regular expression
+    with one named group per token class. Scanning a source is then a sequence of
+    ``pattern.match`` calls, one per token, instead of one interpreted step per
+    character. A scanner holds no per-source state and can be shared by every
+    ``Lexer`` using the same configuration.
+    """
+
+    __slots__ = '_config', '_text', '_binary', '_groups', '_strings', '_number_bases'
+
+    # region CLASSMETHODS
+
+    @classmethod
+    def compile(cls, config: Union[JSOM, LexerConfig]) -> "Scanner":
+        return cls(config)
+
+    # endregion
+
+    # region SPECIAL
+
+    def __init__(self, config: Union[JSOM, LexerConfig]):
+        conf: LexerConfig = LexerConfig.compile(config)
+        self._config: LexerConfig = conf
+        self._strings: Dict[str, Tuple[str, str]] = {}
+        self._number_bases: Dict[str, Tuple[int, str]] = {}
+
+        groups: List[str] = [f"(?P<ws>{_char_class(conf.whitespace)}+)"]
+
+        mark = re.escape(conf.escape)
+        for i, (quote, subkind) in enumerate(conf.quotes.items()):
+            name = f"s{i}"
+            q = re.escape(quote)
+            groups.append(f"(?P<{name}>{q}(?:{mark}[\\s\\S]?|[^{mark}{q}])*(?P<{name}e>{q})?)")
+            self._strings[name] = (f"{name}e", subkind)
+
+        # numbers come between strings and delimiters; their letters differ for bytes
+        rest: List[str] = [f"(?P<delimiter>{_char_class(conf.delimiters)})"]
+        # longest alternatives first, so the longest operator or marker wins
+        operators = sorted(conf.operator_table, key=len, reverse=True)
+        alternatives = [re.escape(operator) for operator in operators] + [_char_class(conf.operators)]
+        rest.append(f"(?P<operator>{'|'.join(alternatives)})")
+
+        self._groups: Tuple[List[str], List[str]] = groups, rest
+        letter = _letter()
+        self._text: _Tables = _Tables(
+            re.compile('|'.join(groups + self._number_groups(conf, letter) + rest + [WORD.format(letter=letter)])),
+            dict(conf.keywords),
+            dict(conf.operator_table),
+            dict(conf.tokens),
+            conf.terminators,
+            re.compile(_char_class(conf.synchronizers)),
+            '\n',
+            '.')
+        self._binary: Optional[_Tables] = None
+
+    # endregion
+
+    # region PROPERTIES
+
+    @property
+    def config(self) -> LexerConfig:
+        return self._config
+
+    # endregion
+
+    # region METHODS
+
+    def _tables(self, code: Union[str, bytes]) -> "_Tables":
+        """Gets the scanning tables matching the type of the source code
+
+        Tables for bytes-like code (see ``MappedSource``) are only built the first
+        time such a source is scanned.
+        """
+        if isinstance(code, str):
+            return self._text
+        if self._binary is None:
+            text = self._text
+            groups, rest = self._groups
+            numbers = self._number_groups(self._config, BYTES_LETTER)
+            self._binary = _Tables(
+                re.compile('|'.join(groups + numbers + rest + [BYTES_WORD]).encode('utf-8')),
+                {k.encode('utf-8'): v for k, v in text.keywords.items()},
+                {k.encode('utf-8'): (kind, subkind, end if end is None else end.encode('utf-8'), include)
+                 for k, (kind, subkind, end, include) in text.operators.items()},
+                {k.encode('utf-8'): v for k, v in text.tokens.items()},
+                frozenset(c.encode('utf-8') for c in text.terminators),
+                re.compile(text.synchronizer.pattern.encode('utf-8')),
+                b'\n',
+                b'.')
+        return self._binary
+
+    def _narrow(self, code: bytes, pos: int, end: int) -> int:
+        """Matches a bytes word or number again as text
+
+        Bytes patterns take every non-ASCII byte as a letter; the characters are
+        decoded and matched by the text pattern, so that the token ends where it
+        would in the decoded source.
+
+        :param code: The bytes-like source code
+        :param pos: The start of the token
+        :param end: The end of the token, as matched by the bytes pattern
+        :return: The end of the token; `pos` if it does not start with a letter or digit
+        """
+        chunk = code[pos:end]
+        if chunk.isascii():
+            return end
+        text = chunk.decode('utf-8', 'replace')
+        m = self._text.pattern.match(text)
+        if m is None or m.lastgroup not in ('word', 'number'):
+            return pos
+        return pos + len(text[:m.end()].encode('utf-8'))
+
+    def _number_groups(self, conf: LexerConfig, letter: str) -> List[str]:
+        """Builds the regular expression groups of NUMBER tokens
+
+        Base prefixed integers get one group per base, named after the base
+        character so the scanner can recover the digits and subkind afterwards.
+        Decimal numbers take letters as suffixes.
+
+        :param conf: The lexer configuration
+        :param letter: The letter class
+        :return: The groups, base prefixed ones first
+        """
+        sep = re.escape(conf.separator)
+        groups: List[str] = []
+        names: Set[str] = set()
+        for base in dict.fromkeys(conf.bases.values()):
+            name = f"n{base.char}"
+            if name in names:
+                continue
+            names.add(name)
+            groups.append(f"(?P<{name}>0[{base.char.lower()}{base.char.upper()}]"
+                          f"(?:{_char_class(base.digit_set)}|{sep})*)")
+            self._number_bases[name] = (base.radix, base.subkind)
+
+        tail = f"(?:[0-9]|{sep}|{letter})*"
+        groups.append(f"(?P<number>[0-9]{tail}(?:\\.{tail})?)")
+        return groups
+
+    def rows(self, source: Source, unexpected: Callable[..., Error] = on_unexpected, start: int = 0,
+             values: bool = True, errors: Optional[List[Error]] = None) -> Iterator[tuple]:
+        """Scans the source code, yielding one row per token
+
+        A row is a ``(kind, subkind, start, end, base, suffix, value)``
+        tuple; the token location index is ``start``, except for EOF, whose value
+        slice is empty. The value of words, delimiters and operators is given,
+        interned, unless `values` is false; it is None for the other tokens. On
+        error, a last ``(None, error, ...)`` row is yielded, unless an `errors`
+        list is given: then the error is added to it, the text up to the next
+        whitespace or delimiter is yielded as an ERROR row and scanning goes on.
+
+        :param source: The source code to scan
+        :param unexpected: The callback that builds the error for unexpected characters
+        :param start: The index to start scanning at
+        :param values: Whether to give the values of words, delimiters and operators
+        :param errors: The list collecting errors, in recovery mode
+        :return: The row iterator
+        """
+        code: Union[str, bytes] = source.code
+        is_text: bool = isinstance(code, str)
+        text_value: Callable = _text_value if values else _no_value
+        length: int = len(code)
+        tables: _Tables = self._tables(code)
+        match = tables.pattern.match
+        conf = self._config
+        kinds = conf.kinds
+        identifier = conf.identifier
+        keywords = tables.keywords
+        operators = tables.operators
+        unknown = (kinds.operator, '', None, True)
+        terminators = tables.terminators
+        tokens = tables.tokens
+        newline = tables.newline
+        pos: int = start
+
+        while pos < length:
+            m = match(code, pos)
+            error: Optional[Error] = None
+
+            if m is not None:
+                end = m.end()
+                if not is_text and m.lastgroup in ('word', 'number'):
+                    end = self._narrow(code, pos, end)
+
+            if m is None or end == pos:
+                error, index = unexpected(SourceLocation(source, pos), _char_at(code, pos)), pos + 1
+            else:
+                group = m.lastgroup
+
+                if group == 'word':
+                    index = _overlong(code, pos, end, conf.word_max_length)
+                    if index >= 0:
+                        error = unexpected(SourceLocation(source, index), _char_at(code, index),
+                                           "Identifier is too long")
+                    else:
+                        text = code[pos:end]
+                        kind, subkind = keywords.get(text, identifier)
+                        yield kind, subkind, pos, end, 10, '', text_value(text, is_text)
+
+                elif group == 'delimiter':
+                    text = code[pos:end]
+                    yield kinds.delimiter, tokens.get(text, ''), pos, end, 10, '', text_value(text, is_text)
+
+                elif group == 'operator':
+                    text = code[pos:end]
+                    kind, subkind, terminator, include = operators.get(text, unknown)
+                    if kind == kinds.operator:
+                        yield kind, subkind, pos, end, 10, '', text_value(text, is_text)
+                    else:
+                        if terminator is None:
+                            stop = code.find(newline, end)
+                            end = length if stop < 0 else stop
+                        else:
+                            stop = code.find(terminator, end)
+                            end = length if stop < 0 else stop + len(terminator)
+                        if include:
+                            yield kind, subkind, pos, end, 10, '', None
+
+                elif group == 'ws':
+                    if conf.include_whitespace:
+                        yield kinds.whitespace, '', pos, end, 10, '', None
+
+                elif group in self._strings:
+                    closing, subkind = self._strings[group]
+                    stop = end if m.start(closing) >= 0 else pos
+                    yield kinds.string, subkind, pos, stop, 10, '', None
+
+                else:
+                    # NUMBER: whatever follows must end the token, a second '.' included
+                    follow = code[end:end + 1]
+                    if follow and (follow == tables.dot or follow not in terminators):
+                        error, index = unexpected(SourceLocation(source, end), _char_at(code, end)), end
+                    else:
+                        text = code[pos:end]
+                        if not isinstance(text, str):
+                            text = text.decode('utf-8')
+                        if group in self._number_bases:
+                            base, subkind = self._number_bases[group]
+                            suffix = ''
+                        else:
+                            base = 10
+                            subkind = conf.number_subkind
+                            if '.' in text:
+                                subkind = conf.float_subkind
+                            suffix = '' if text.isdigit() else ''.join(c for c in text if c.isalpha())
+                        yield kinds.number, subkind, pos, end, base, suffix, None
+
+            if error is not None:
+                if errors is None:
+                    yield None, error, pos, index, 10, '', None
+                    return
+                # recovery: skip to the next whitespace or delimiter
+                errors.append(error)
+                found = tables.synchronizer.search(code, index)
+                end = length if found is None else found.start()
+                yield kinds.error, '', pos, end, 10, '', None
+
+            pos = end
+
+        yield kinds.eof, '', -1, -1, 10, '', ''
+
+    def scan(self, source: Source, unexpected: Callable[..., Error] = on_unexpected, start: int = 0,
+             errors: Optional[List[Error]] = None) -> Tuple[List[Token], Optional[Error]]:
+        """Scans the source code and returns a list of tokens
+
+        Produces the same tokens as the character driven scanning of ``Lexer``.
+
+        :param source: The source code to scan
+        :param unexpected: The callback that builds the error for unexpected characters
+        :param start: The index to start scanning at
+        :param errors: The list collecting errors, in recovery mode; see `rows`
+        :return: The list of tokens or an error; in recovery mode, all the tokens and the first error
+        """
+        length: int = len(source.code)
+        codes = self._config.codes
+        tokens: List[Token] = []
+        append = tokens.append
+
+        for kind, subkind, first, end, base, suffix, value in self.rows(source, unexpected, start, True, errors):
+            if kind is None:
+                return [], subkind
+            location = SourceLocation(source, first if first >= 0 else length)
+            append(Token(location, kind, slice(first, end), subkind=subkind, base=base, suffix=suffix, value=value,
+                         kind_code=codes[kind], subkind_code=codes.get(subkind, 0)))
+
+        return tokens, errors[0] if errors else None
+
+    def scan_buffer(self, source: Source, unexpected: Callable[..., Error] = on_unexpected, start: int = 0,
+                    errors: Optional[List[Error]] = None) -> Tuple[Optional[TokenBuffer], Optional[Error]]:
+        """Scans the source code straight into a columnar token buffer
+
+        :param source: The source code to scan
+        :param unexpected: The callback that builds the error for unexpected characters
+        :param start: The index to start scanning at
+        :param errors: The list collecting errors, in recovery mode; see `rows`
+        :return: The token buffer or an error; in recovery mode, the buffer and the first error
+        """
+        buffer: TokenBuffer = TokenBuffer(source, self._config.names)
+        append = buffer.append
+
+        for kind, subkind, first, end, base, suffix, _ in self.rows(source, unexpected, start, False, errors):
+            if kind is None:
+                return None, subkind
+            append(kind, subkind, first, end, base, suffix)
+
+        return buffer, errors[0] if errors else None
+
+    # endregion (methods)
+
+
+class _Tables:
+    """The compiled pattern and lookup tables for one type of source code (str or bytes)"""
+
+    __slots__ = 'pattern', 'keywords', 'operators', 'tokens', 'terminators', 'synchronizer', 'newline', 'dot'
+
+    def __init__(self, pattern: re.Pattern, keywords: dict, operators: dict, tokens: dict, terminators: FrozenSet,
+                 synchronizer: re.Pattern, newline: Union[str, bytes], dot: Union[str, bytes]):
+        self.pattern: re.Pattern = pattern
+        self.keywords: dict = keywords
+        self.operators: dict = operators
+        self.tokens: dict = tokens
+        self.terminators: FrozenSet = terminators
+        self.synchronizer: re.Pattern = synchronizer
+        self.newline: Union[str, bytes] = newline
+        self.dot: Union[str, bytes] = dot
+
+
+# endregion (classes)
+# ---------------------------------------------------------
+# region FUNCTIONS
+
+
+def _char_class(chars: Iterable[str]) -> str:
+    return '[' + ''.join(re.escape(c) for c in sorted(chars)) + ']'
+
+
+def _letter() -> str:
+    """Gets the regular expression class of the characters ``str.isalpha`` accepts
+
+    ``[^\\W\\d_]`` also takes the numeric characters that are not decimal
+    digits, like '²' or 'Ⅻ', which the character driven ``Lexer`` rejects;
+    they are excluded, one range at a time. Every code point is tested once,
+    the first time the class is needed.
+    """
+    global _letter_class
+    if _letter_class is None:
+        ranges: List[List[int]] = []
+        for code in range(0x80, sys.maxunicode + 1):
+            char = chr(code)
+            if char.isalnum() and not char.isalpha() and not char.isdecimal():
+                if ranges and ranges[-1][1] == code - 1:
+                    ranges[-1][1] = code
+                else:
+                    ranges.append([code, code])
+        excluded = ''.join(re.escape(chr(first)) if first == last else f"{re.escape(chr(first))}-{re.escape(chr(last))}"
+                           for first, last in ranges)
+        _letter_class = f"[^\\W\\d_{excluded}]"
+    return _letter_class
+
+
+def _overlong(code: Union[str, bytes], pos: int, end: int, limit: int) -> int:
+    """Gets the index a word longer than `limit` characters is reported at; -1 if it is not longer"""
+    if end - pos <= limit:
+        return -1
+    if isinstance(code, str):
+        return pos + limit + 1
+    chars = code[pos:end].decode('utf-8')
+    return -1 if len(chars) <= limit else pos + len(chars[:limit + 1].encode('utf-8'))
+
+
+def _text_value(text: Union[str, bytes], is_text: bool) -> str:
+    return intern(text if is_text else text.decode('utf-8'))
+
+
+def _no_value(text: Union[str, bytes], is_text: bool) -> None:
+    return None
+
+
+def _char_at(code: Union[str, bytes], index: int) -> Optional[str]:
+    char = code[index:index + 1]
+    if not char:
+        return None
+    return char if isinstance(char, str) else code_point(code, index)
+
+
+# endregion (functions)
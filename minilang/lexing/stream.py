@@ -31,10 +31,12 @@
 
 import sys
 
-from typing import Union, List, Callable, Any, Sized
+from typing import Union, List, Dict, Tuple, Callable, Any, Sized, Iterable, Iterator, Optional
 
 from minilang.utillities.code import Source, SourceLocation
+from minilang.utillities.error import TokenStreamError, UnexpectedTokenError, UnexpectedEndOfTokensError
 from minilang.lexing.core import Token, Lexer
+from minilang.lexing.buffer import TokenBuffer
 from minilang.utillities.jsom import JSOM
 
 # endregion (imports)
@@ -44,6 +46,8 @@ from minilang.utillities.jsom import JSOM
 
 __all__ = [
     'TokenStream',
+    'LazyTokenStream',
+    'mask',
 ]
 
 
@@ -53,16 +57,31 @@ __all__ = [
 
 
 class TokenStream(Sized):
+    """A cursor over the tokens of a source, with the predicates a parser needs
 
-    __slots__ = '_tokens', '_source', '_idx', '_on_unexpected', '_on_end_of_tokens', '_kind_delimiter'
+    Unexpected tokens and the end of tokens are handed to the `on_unexpected`
+    and `on_end_of_tokens` callbacks, if given. Otherwise, with `raises` set,
+    an ``UnexpectedTokenError`` or ``UnexpectedEndOfTokensError`` is raised,
+    which suits long-running processes; by default the error is printed and
+    the process exits.
 
-    def __init__(self, source: Source, tokens: List[Token], **kwargs):
-        self._tokens: List[Token] = tokens
+    Parsers backtrack with `mark` and `reset`. With `memo` set, `memoize` and
+    `speculate` keep the outcome of every (rule, token index) they run, so
+    trying alternatives never parses the same tokens twice with the same rule.
+    """
+
+    __slots__ = ('_tokens', '_source', '_idx', '_on_unexpected', '_on_end_of_tokens', '_kind_delimiter', '_raises',
+                 '_memo')
+
+    def __init__(self, source: Source, tokens: Union[List[Token], TokenBuffer], **kwargs):
+        self._tokens: Union[List[Token], TokenBuffer] = tokens
         self._source: Source = source
         self._idx: int = 0
         self._on_unexpected: Union[Callable[[Any, ...], None], None] = kwargs.get('on_unexpected')
         self._on_end_of_tokens: Union[Callable[[Source], Any], None] = kwargs.get('on_end_of_tokens')
         self._kind_delimiter: Union[str, None] = kwargs.get('kind_delimiter')
+        self._raises: bool = kwargs.get('raises', False)
+        self._memo: Optional[Dict[Tuple[Any, int], Tuple[Any, int]]] = {} if kwargs.get('memo') else None
 
     def __len__(self) -> int:
         return self._tokens.__len__()
@@ -79,6 +98,10 @@ class TokenStream(Sized):
         elif self._on_end_of_tokens:
             return self._on_end_of_tokens(self._source)
 
+        elif self._raises:
+            location = None if self._source is None else SourceLocation(self._source, len(self._source))
+            raise UnexpectedEndOfTokensError("Unexpected end of tokens", location)
+
         else:
             print("TokenStreamError: Unexpected end of tokens", file=sys.stderr)
             sys.exit(1)
@@ -95,6 +118,29 @@ class TokenStream(Sized):
     def source(self) -> Source:
         return self._source
 
+    @property
+    def raises(self) -> bool:
+        return self._raises
+
+    @property
+    def index(self) -> int:
+        return self._idx
+
+    @property
+    def memo(self) -> Optional[Dict[Tuple[Any, int], Tuple[Any, int]]]:
+        return self._memo
+
+    def _unexpected(self, expected: tuple, attribute: str, found: Any):
+        token = self._tokens[self._idx]
+        if self._on_unexpected:
+            self._on_unexpected(self._source, token, expected, attribute, found)
+        elif self._raises:
+            raise UnexpectedTokenError(f"Unexpected token {attribute} '{found}'", token.location, token, expected,
+                                       attribute, found)
+        else:
+            print(f"TokenStreamError: Unexpected token {attribute} {self.token}", file=sys.stderr)
+            sys.exit(1)
+
     def advance(self) -> bool:
         self._idx += 1
         return True
@@ -104,6 +150,77 @@ class TokenStream(Sized):
         self.advance()
         return token
 
+    def peek(self, n: int = 1) -> Optional[Token]:
+        """Gets the token `n` positions after the current one without advancing
+
+        :param n: The distance from the current token
+        :return: The token or None past the end of tokens
+        """
+        index = self._idx + n
+        if 0 <= index < self.__len__():
+            return self._tokens[index]
+        return None
+
+    def mark(self) -> int:
+        """Gets a checkpoint to go back to with `reset`
+
+        :return: The current token index
+        """
+        return self._idx
+
+    def reset(self, mark: int) -> None:
+        """Goes back, or forth, to a checkpoint
+
+        :param mark: A token index, as returned by `mark`
+        """
+        self._idx = mark
+
+    def memoize(self, rule: Callable[["TokenStream"], Any], key: Any = None) -> Any:
+        """Runs a rule at the current token, or replays its memoized outcome
+
+        The outcome is the result of the rule and the index it stopped at; a
+        replay moves the stream to that index. Without `memo`, the rule is just
+        run. Rules that raise are not memoized.
+
+        :param rule: The rule, which takes this stream
+        :param key: The key of the rule in the memo; the rule itself by default
+        :return: The result of the rule
+        """
+        if self._memo is None:
+            return rule(self)
+        entry = (rule if key is None else key, self._idx)
+        outcome = self._memo.get(entry)
+        if outcome is None:
+            outcome = self._memo[entry] = (rule(self), self._idx)
+        self._idx = outcome[1]
+        return outcome[0]
+
+    def speculate(self, rule: Callable[["TokenStream"], Any], key: Any = None) -> Any:
+        """Tries a rule, going back to the current token if it fails
+
+        A rule fails by returning None or, in a raising stream, by raising a
+        ``TokenStreamError``; failures are memoized too.
+
+        :param rule: The rule, which takes this stream
+        :param key: The key of the rule in the memo; the rule itself by default
+        :return: The result of the rule or None if it failed
+        """
+        start = self._idx
+        try:
+            result = self.memoize(rule, key)
+        except TokenStreamError:
+            result = None
+            if self._memo is not None:
+                self._memo[(rule if key is None else key, start)] = (None, start)
+        if result is None:
+            self._idx = start
+        return result
+
+    def forget(self) -> None:
+        """Clears the memo, e.g. between top level declarations"""
+        if self._memo is not None:
+            self._memo.clear()
+
     def is_token(self, *values: str) -> bool:
         return self._tokens[self._idx].value in values
 
@@ -115,11 +232,7 @@ class TokenStream(Sized):
     def expect_token(self, *values):
         if self.is_token(*values):
             return self.advance()
-        elif self._on_unexpected:
-            self._on_unexpected(self._source, self._tokens[self._idx], values, 'value', self.token.value)
-        else:
-            print(f"TokenStreamError: Unexpected token value {self.token}", file=sys.stderr)
-            sys.exit(1)
+        self._unexpected(values, 'value', self.token.value)
 
     def is_kind(self, *kinds: str) -> bool:
         if self._tokens[self._idx].kind in kinds:
@@ -134,11 +247,7 @@ class TokenStream(Sized):
     def expect_kind(self, *kinds):
         if self.is_kind(*kinds):
             return self.advance()
-        elif self._on_unexpected:
-            self._on_unexpected(self._source, self._tokens[self._idx], kinds, 'kind', self.token.kind)
-        else:
-            print(f"TokenStreamError: Unexpected token kind {self.token}", file=sys.stderr)
-            sys.exit(1)
+        self._unexpected(kinds, 'kind', self.token.kind)
 
     def is_subkind(self, *subkinds: str) -> bool:
         if self._tokens[self._idx].subkind in subkinds:
@@ -153,11 +262,108 @@ class TokenStream(Sized):
     def expect_subkind(self, *subkinds):
         if self.is_subkind(*subkinds):
             return self.advance()
-        elif self._on_unexpected:
-            self._on_unexpected(self._source, self._tokens[self._idx], subkinds, 'subkind', self.token.subkind)
-        else:
-            print(f"TokenStreamError: Unexpected token subkind {self.token}", file=sys.stderr)
-            sys.exit(1)
+        self._unexpected(subkinds, 'subkind', self.token.subkind)
+
+    def is_any(self, codes: int) -> bool:
+        """Tests the current token against a bitmask of kind and subkind codes; see `mask`
+
+        :param codes: The bitmask
+        :return: True if the kind or the subkind of the token is in the bitmask
+        """
+        token = self._tokens[self._idx]
+        return bool((codes >> token.kind_code | codes >> token.subkind_code) & 1)
+
+    def match_any(self, codes: int) -> bool:
+        if self.is_any(codes):
+            return self.advance()
+        return False
+
+    def expect_any(self, codes: int):
+        if self.is_any(codes):
+            return self.advance()
+        self._unexpected((codes,), 'code', self.token.kind_code)
+
+
+class TokenRing(Sized):
+    """Fixed size ring buffer of tokens pulled on demand from an iterator
+
+    Tokens are indexed by their absolute position in the stream; only the last
+    ``size`` pulled tokens are kept.
+    """
+
+    __slots__ = '_iterator', '_ring', '_size', '_count', '_exhausted'
+
+    def __init__(self, tokens: Iterable[Token], size: int):
+        self._iterator: Iterator[Token] = iter(tokens)
+        self._ring: List[Optional[Token]] = [None] * size
+        self._size: int = size
+        self._count: int = 0
+        self._exhausted: bool = False
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> Token:
+        if not self.fill(index):
+            raise IndexError("TokenRing index out of range")
+        if index < self._count - self._size:
+            raise IndexError(f"TokenRing index {index} is behind the lookahead window")
+        return self._ring[index % self._size]
+
+    def fill(self, index: int) -> bool:
+        """Pulls tokens until the one at `index` is available
+
+        :param index: The absolute token index
+        :return: False if the tokens ended before `index`
+        """
+        while self._count <= index and not self._exhausted:
+            try:
+                self._ring[self._count % self._size] = next(self._iterator)
+                self._count += 1
+            except StopIteration:
+                self._exhausted = True
+        return index < self._count
+
+
+class LazyTokenStream(TokenStream):
+    """A TokenStream that pulls its tokens from an iterator, e.g. `Lexer.iter_tokens()`
+
+    Only the current token and up to `lookahead` tokens after it are kept in
+    memory, so parsing overlaps with scanning and memory use stays flat no
+    matter the size of the source. For the same reason, `reset` can only go
+    back as far as the window reaches.
+    """
+
+    __slots__ = '_lookahead',
+
+    def __init__(self, source: Source, tokens: Iterable[Token], lookahead: int = 1, **kwargs):
+        super().__init__(source, TokenRing(tokens, lookahead + 1), **kwargs)
+        self._lookahead: int = lookahead
+
+    def __len__(self) -> int:
+        self._tokens.fill(self._idx)
+        return self._tokens.__len__()
+
+    @property
+    def lookahead(self) -> int:
+        return self._lookahead
+
+    def peek(self, n: int = 1) -> Optional[Token]:
+        """Gets the token `n` positions after the current one without advancing
+
+        :param n: The distance from the current token, up to `lookahead`
+        :return: The token or None past the end of tokens
+        """
+        if not 0 <= n <= self._lookahead:
+            raise ValueError(f"LazyTokenStream can peek at most {self._lookahead} tokens ahead")
+        if self._tokens.fill(self._idx + n):
+            return self._tokens[self._idx + n]
+        return None
+
+    def reset(self, mark: int) -> None:
+        if mark < self._tokens.__len__() - self._lookahead - 1:
+            raise ValueError(f"LazyTokenStream cannot reset to token {mark}, behind the lookahead window")
+        self._idx = mark
 
 
 # endregion (classes)
@@ -165,6 +371,18 @@ class TokenStream(Sized):
 # region FUNCTIONS
 
 
+def mask(*codes: int) -> int:
+    """Builds the bitmask of kind and subkind codes tested by `TokenStream.is_any`
+
+    :param codes: The ``TC_`` and ``SC_`` codes of tokens.py
+    :return: The bitmask
+    """
+    bits = 0
+    for code in codes:
+        bits |= 1 << code
+    return bits
+
+
 def main() -> int:
 
     conf: JSOM = JSOM.parse_file('./lexconf.json')
@@ -1,5 +1,11 @@
 # -*- encoding: utf8 -*-
 
+# region IMPORTS
+
+from sys import intern
+
+# endregion (imports)
+
 # region EXPORTS
 
 __all__ = [
@@ -13,6 +19,7 @@ __all__ = [
     'TK_COMMENT',
     'TK_DOCUMENTATION',
     'TK_EOF',
+    'TK_ERROR',
     'LPAREN',
     'RPAREN',
     'LBRACE',
@@ -33,6 +40,23 @@ __all__ = [
     'MUL',
     'DIV',
     'MOD',
+    'EQ',
+    'NE',
+    'LE',
+    'GE',
+    'RSHIFT',
+    'AND',
+    'OR',
+    'ADD_ASSIGN',
+    'SUB_ASSIGN',
+    'MUL_ASSIGN',
+    'DIV_ASSIGN',
+    'MOD_ASSIGN',
+    'LSHIFT_ASSIGN',
+    'RSHIFT_ASSIGN',
+    'AND_ASSIGN',
+    'OR_ASSIGN',
+    'XOR_ASSIGN',
     'SK_SINGLEQUOTE',
     'SK_DOUBLEQUOTE',
     'SK_TEMPLATE',
@@ -90,6 +114,72 @@ __all__ = [
     'SK_IDENTIFIER',
     'SK_INTEGER',
     'SK_FLOAT',
+    'TC_WHITESPACE',
+    'TC_WORD',
+    'TC_KEYWORD',
+    'TC_NUMBER',
+    'TC_DELIMITER',
+    'TC_OPERATOR',
+    'TC_STRING',
+    'TC_COMMENT',
+    'TC_DOCUMENTATION',
+    'TC_EOF',
+    'TC_ERROR',
+    'SC_LPAREN',
+    'SC_RPAREN',
+    'SC_LBRACE',
+    'SC_RBRACE',
+    'SC_LBRACKET',
+    'SC_RBRACKET',
+    'SC_COMMA',
+    'SC_DOT',
+    'SC_ASSIGN',
+    'SC_LSHIFT',
+    'SC_SEMICOLON',
+    'SC_COLON',
+    'SC_POINTER',
+    'SC_INCR',
+    'SC_DECR',
+    'SC_ADD',
+    'SC_SUB',
+    'SC_MUL',
+    'SC_DIV',
+    'SC_MOD',
+    'SC_EQ',
+    'SC_NE',
+    'SC_LE',
+    'SC_GE',
+    'SC_RSHIFT',
+    'SC_AND',
+    'SC_OR',
+    'SC_ADD_ASSIGN',
+    'SC_SUB_ASSIGN',
+    'SC_MUL_ASSIGN',
+    'SC_DIV_ASSIGN',
+    'SC_MOD_ASSIGN',
+    'SC_LSHIFT_ASSIGN',
+    'SC_RSHIFT_ASSIGN',
+    'SC_AND_ASSIGN',
+    'SC_OR_ASSIGN',
+    'SC_XOR_ASSIGN',
+    'SC_SINGLEQUOTE',
+    'SC_DOUBLEQUOTE',
+    'SC_TEMPLATE',
+    'SC_RESERVED',
+    'SC_ACCESS',
+    'SC_KEYVALUE',
+    'SC_QUALIFIER',
+    'SC_PRIMITIVE',
+    'SC_IDENTIFIER',
+    'SC_INTEGER',
+    'SC_FLOAT',
+    'SC_BINARY',
+    'SC_OCTAL',
+    'SC_HEX',
+    'SC_LINE',
+    'SC_BLOCK',
+    'SC_BRIEF',
+    'SC_LONG',
 ]
 
 # endregion (exports)
@@ -97,92 +187,182 @@ __all__ = [
 # region CONSTANTS
 
 
-TK_WHITESPACE = 'WS'
-TK_WORD = 'WORD'
-TK_KEYWORD = 'KEYWORD'
-TK_NUMBER = 'NUMBER'
-TK_DELIMITER = 'DELIMITER'
-TK_OPERATOR = 'OPERATOR'
-TK_STRING = 'STRING'
-TK_COMMENT = 'COMMENT'
-TK_DOCUMENTATION = 'DOCUMENTATION'
-TK_EOF = 'EOF'
-LPAREN = '('
-RPAREN = ')'
-LBRACE = '{'
-RBRACE = '}'
-LBRACKET = '['
-RBRACKET = ']'
-COMMA = ','
-DOT = '.'
-ASSIGN = '='
-LSHIFT = '<<'
-SEMICOLON = ';'
-COLON = ':'
-POINTER = '->'
-INCR = '++'
-DECR = '--'
-ADD = '+'
-SUB = '-'
-MUL = '*'
-DIV = '/'
-MOD = '%'
-SK_SINGLEQUOTE = 'SINGLEQUOTE'
-SK_DOUBLEQUOTE = 'DOUBLEQUOTE'
-SK_TEMPLATE = 'TEMPLATE'
-SK_RESERVED = 'RESERVED'
-KW_IMPORT = 'import'
-KW_GET = 'get'
-KW_SET = 'set'
-KW_IF = 'if'
-KW_ELIF = 'elif'
-KW_ELSE = 'else'
-KW_WHILE = 'while'
-KW_DO = 'do'
-KW_SWITCH = 'switch'
-KW_RETURN = 'return'
-KW_BREAK = 'break'
-KW_BREAKPOINT = 'breakpoint'
-KW_CONTINUE = 'continue'
-KW_REPEAT = 'repeat'
-KW_PRINT = 'print'
-KW_ASSERT = 'assert'
-SK_ACCESS = 'ACCESS'
-KW_PUBLIC = 'public'
-KW_PROTECTED = 'protected'
-KW_PRIVATE = 'private'
-SK_KEYVALUE = 'KEYVALUE'
-KW_NULL = 'null'
-KW_TRUE = 'true'
-KW_FALSE = 'false'
-KW_THIS = 'this'
-KW_SUPER = 'super'
-KW_BASE = 'base'
-KW_VALUE = 'value'
-SK_QUALIFIER = 'QUALIFIER'
-KW_STATIC = 'static'
-KW_UNBOUND = 'unbound'
-KW_FINAL = 'final'
-KW_ABSTRACT = 'abstract'
-KW_CONST = 'const'
-KW_READONLY = 'readonly'
-KW_OVERRIDE = 'override'
-KW_OVERLOAD = 'overload'
-SK_PRIMITIVE = 'PRIMITIVE'
-KW_I8 = 'i8'
-KW_I16 = 'i16'
-KW_I32 = 'i32'
-KW_I64 = 'i64'
-KW_U8 = 'u8'
-KW_U16 = 'u16'
-KW_U32 = 'u32'
-KW_U64 = 'u64'
-KW_F32 = 'f32'
-KW_F64 = 'f64'
-KW_BOOLEAN = 'boolean'
-KW_STRING = 'string'
-SK_IDENTIFIER = 'IDENTIFIER'
-SK_INTEGER = 'INTEGER'
-SK_FLOAT = 'FLOAT'
+TK_WHITESPACE = intern('WS')
+TK_WORD = intern('WORD')
+TK_KEYWORD = intern('KEYWORD')
+TK_NUMBER = intern('NUMBER')
+TK_DELIMITER = intern('DELIMITER')
+TK_OPERATOR = intern('OPERATOR')
+TK_STRING = intern('STRING')
+TK_COMMENT = intern('COMMENT')
+TK_DOCUMENTATION = intern('DOCUMENTATION')
+TK_EOF = intern('EOF')
+TK_ERROR = intern('ERROR')
+LPAREN = intern('(')
+RPAREN = intern(')')
+LBRACE = intern('{')
+RBRACE = intern('}')
+LBRACKET = intern('[')
+RBRACKET = intern(']')
+COMMA = intern(',')
+DOT = intern('.')
+ASSIGN = intern('=')
+LSHIFT = intern('<<')
+SEMICOLON = intern(';')
+COLON = intern(':')
+POINTER = intern('->')
+INCR = intern('++')
+DECR = intern('--')
+ADD = intern('+')
+SUB = intern('-')
+MUL = intern('*')
+DIV = intern('/')
+MOD = intern('%')
+EQ = intern('==')
+NE = intern('!=')
+LE = intern('<=')
+GE = intern('>=')
+RSHIFT = intern('>>')
+AND = intern('&&')
+OR = intern('||')
+ADD_ASSIGN = intern('+=')
+SUB_ASSIGN = intern('-=')
+MUL_ASSIGN = intern('*=')
+DIV_ASSIGN = intern('/=')
+MOD_ASSIGN = intern('%=')
+LSHIFT_ASSIGN = intern('<<=')
+RSHIFT_ASSIGN = intern('>>=')
+AND_ASSIGN = intern('&=')
+OR_ASSIGN = intern('|=')
+XOR_ASSIGN = intern('^=')
+SK_SINGLEQUOTE = intern('SINGLEQUOTE')
+SK_DOUBLEQUOTE = intern('DOUBLEQUOTE')
+SK_TEMPLATE = intern('TEMPLATE')
+SK_RESERVED = intern('RESERVED')
+KW_IMPORT = intern('import')
+KW_GET = intern('get')
+KW_SET = intern('set')
+KW_IF = intern('if')
+KW_ELIF = intern('elif')
+KW_ELSE = intern('else')
+KW_WHILE = intern('while')
+KW_DO = intern('do')
+KW_SWITCH = intern('switch')
+KW_RETURN = intern('return')
+KW_BREAK = intern('break')
+KW_BREAKPOINT = intern('breakpoint')
+KW_CONTINUE = intern('continue')
+KW_REPEAT = intern('repeat')
+KW_PRINT = intern('print')
+KW_ASSERT = intern('assert')
+SK_ACCESS = intern('ACCESS')
+KW_PUBLIC = intern('public')
+KW_PROTECTED = intern('protected')
+KW_PRIVATE = intern('private')
+SK_KEYVALUE = intern('KEYVALUE')
+KW_NULL = intern('null')
+KW_TRUE = intern('true')
+KW_FALSE = intern('false')
+KW_THIS = intern('this')
+KW_SUPER = intern('super')
+KW_BASE = intern('base')
+KW_VALUE = intern('value')
+SK_QUALIFIER = intern('QUALIFIER')
+KW_STATIC = intern('static')
+KW_UNBOUND = intern('unbound')
+KW_FINAL = intern('final')
+KW_ABSTRACT = intern('abstract')
+KW_CONST = intern('const')
+KW_READONLY = intern('readonly')
+KW_OVERRIDE = intern('override')
+KW_OVERLOAD = intern('overload')
+SK_PRIMITIVE = intern('PRIMITIVE')
+KW_I8 = intern('i8')
+KW_I16 = intern('i16')
+KW_I32 = intern('i32')
+KW_I64 = intern('i64')
+KW_U8 = intern('u8')
+KW_U16 = intern('u16')
+KW_U32 = intern('u32')
+KW_U64 = intern('u64')
+KW_F32 = intern('f32')
+KW_F64 = intern('f64')
+KW_BOOLEAN = intern('boolean')
+KW_STRING = intern('string')
+SK_IDENTIFIER = intern('IDENTIFIER')
+SK_INTEGER = intern('INTEGER')
+SK_FLOAT = intern('FLOAT')
 
 # endregion (constants)
+
+# region CODES
+
+
+TC_WHITESPACE = 1
+TC_WORD = 2
+TC_KEYWORD = 3
+TC_NUMBER = 4
+TC_DELIMITER = 5
+TC_OPERATOR = 6
+TC_STRING = 7
+TC_COMMENT = 8
+TC_DOCUMENTATION = 9
+TC_EOF = 10
+TC_ERROR = 11
+SC_LPAREN = 12
+SC_RPAREN = 13
+SC_LBRACE = 14
+SC_RBRACE = 15
+SC_LBRACKET = 16
+SC_RBRACKET = 17
+SC_COMMA = 18
+SC_DOT = 19
+SC_ASSIGN = 20
+SC_LSHIFT = 21
+SC_SEMICOLON = 22
+SC_COLON = 23
+SC_POINTER = 24
+SC_INCR = 25
+SC_DECR = 26
+SC_ADD = 27
+SC_SUB = 28
+SC_MUL = 29
+SC_DIV = 30
+SC_MOD = 31
+SC_EQ = 32
+SC_NE = 33
+SC_LE = 34
+SC_GE = 35
+SC_RSHIFT = 36
+SC_AND = 37
+SC_OR = 38
+SC_ADD_ASSIGN = 39
+SC_SUB_ASSIGN = 40
+SC_MUL_ASSIGN = 41
+SC_DIV_ASSIGN = 42
+SC_MOD_ASSIGN = 43
+SC_LSHIFT_ASSIGN = 44
+SC_RSHIFT_ASSIGN = 45
+SC_AND_ASSIGN = 46
+SC_OR_ASSIGN = 47
+SC_XOR_ASSIGN = 48
+SC_SINGLEQUOTE = 49
+SC_DOUBLEQUOTE = 50
+SC_TEMPLATE = 51
+SC_RESERVED = 52
+SC_ACCESS = 53
+SC_KEYVALUE = 54
+SC_QUALIFIER = 55
+SC_PRIMITIVE = 56
+SC_IDENTIFIER = 57
+SC_INTEGER = 58
+SC_FLOAT = 59
+SC_BINARY = 60
+SC_OCTAL = 61
+SC_HEX = 62
+SC_LINE = 63
+SC_BLOCK = 64
+SC_BRIEF = 65
+SC_LONG = 66
+
+# endregion (codes)
@@ -0,0 +1,338 @@
+# -*- encoding: utf8 -*-
+# ------------------------------------------------------------------------------
+# flat.py
+# Created on 18/10/2026
+#
+# The MIT License
+#
+#
+# Copyright 2022 Jorge A. Gomes
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# region IMPORTS
+
+import sys
+import mmap
+import struct
+
+from array import array
+
+from minilang.parsing.nodes import (
+    Node, Module, Class, Interface, Enum, Block, Import, Constant, Signature, Field, Variable, Parameter,
+    EnumMember, Property, Accessor, Function, Method, Operator, TypeName, FunctionType, If, While, DoWhile, Repeat,
+    Return, Print, Assert, Break, Continue, Breakpoint, Evaluate, Literal, Name, Member, Call, Index, Unary,
+    Postfix, Binary, Assign,
+)
+from typing import Optional, Any, Union, List, Dict, Tuple, Iterator, Sequence, Sized
+
+# endregion (imports)
+# ---------------------------------------------------------
+# region EXPORTS
+
+
+__all__ = [
+    'NK_NONE',
+    'NK_LIST',
+    'NODE_TYPES',
+    'NODE_KINDS',
+    'FlatTree',
+]
+
+
+# endregion (exports)
+# ---------------------------------------------------------
+# region CONSTANTS & ENUMS
+
+# rows standing for a missing optional child and for a list of children
+NK_NONE = 0
+NK_LIST = 1
+
+# the node kind codes are indices in this tuple
+NODE_TYPES: Tuple[Optional[type], ...] = (
+    None, list, Module, Class, Interface, Enum, Block, Import, Constant, Signature, Field, Variable, Parameter,
+    EnumMember, Property, Accessor, Function, Method, Operator, TypeName, FunctionType, If, While, DoWhile, Repeat,
+    Return, Print, Assert, Break, Continue, Breakpoint, Evaluate, Literal, Name, Member, Call, Index, Unary,
+    Postfix, Binary, Assign,
+)
+NODE_KINDS: Dict[type, int] = {node_type: kind for kind, node_type in enumerate(NODE_TYPES) if kind > NK_LIST}
+
+MAGIC = b'MLST'
+VERSION = 1
+
+# magic, version, byte order (1 for little endian), node count
+HEADER = struct.Struct('<4sHBxI')
+
+# array type codes of tokens, data, first children and next siblings; kinds go last, being a byte each
+COLUMN_TYPES = 'i', 'i', 'i', 'i'
+KIND_TYPE = 'B'
+
+# the data column holds the flags of declarations and, above them, the operator of operations
+OPERATOR_SHIFT = 16
+FLAGS_MASK = (1 << OPERATOR_SHIFT) - 1
+
+# endregion (constants)
+# ---------------------------------------------------------
+# region CLASSES
+
+
+class FlatTree(Sized):
+    """A syntax tree stored as rows of parallel typed arrays
+
+    Rows are in depth first order; each one holds the kind, the token index,
+    the data (flags and operator), and the rows of the first child and of the
+    next sibling, -1 if there is none. Children follow the `FIELDS` of their
+    node type, with ``NK_LIST`` rows grouping list fields and ``NK_NONE`` rows
+    standing for missing optional children, so `to_node` rebuilds the exact
+    object tree. Memory is a few bytes per row, without per-object overhead,
+    and a tree loaded with `load` reads straight from a memory map.
+    """
+
+    __slots__ = '_kinds', '_tokens', '_data', '_children', '_siblings'
+
+    # region CLASSMETHODS
+
+    @classmethod
+    def from_columns(cls, kinds: Sequence[int], tokens: Sequence[int], data: Sequence[int],
+                     children: Sequence[int], siblings: Sequence[int]) -> "FlatTree":
+        tree = cls.__new__(cls)
+        tree._kinds, tree._tokens, tree._data, tree._children, tree._siblings = kinds, tokens, data, children, siblings
+        return tree
+
+    @classmethod
+    def from_node(cls, root: Node) -> "FlatTree":
+        """Flattens an object tree
+
+        :param root: The root node, usually a Module
+        :return: The flat tree
+        """
+        tree = cls()
+        kinds, tokens, data, children, siblings = tree._kinds, tree._tokens, tree._data, tree._children, \
+            tree._siblings
+        last: List[int] = []
+        stack: List[Tuple[Any, int]] = [(root, -1)]
+
+        while stack:
+            item, parent = stack.pop()
+            row = len(kinds)
+            if item is None:
+                kinds.append(NK_NONE)
+                tokens.append(-1)
+                data.append(0)
+            elif isinstance(item, list):
+                kinds.append(NK_LIST)
+                tokens.append(-1)
+                data.append(0)
+                stack.extend((child, row) for child in reversed(item))
+            else:
+                kinds.append(NODE_KINDS[type(item)])
+                tokens.append(item.token)
+                data.append(getattr(item, 'flags', 0) | getattr(item, 'operator', 0) << OPERATOR_SHIFT)
+                stack.extend((getattr(item, field), row) for field in reversed(item.FIELDS))
+            children.append(-1)
+            siblings.append(-1)
+            last.append(-1)
+
+            # rows are added in depth first order, so siblings come in source order
+            if parent >= 0:
+                if last[parent] < 0:
+                    children[parent] = row
+                else:
+                    siblings[last[parent]] = row
+                last[parent] = row
+
+        return tree
+
+    @classmethod
+    def frombytes(cls, data: Union[bytes, mmap.mmap], token_count: Optional[int] = None) -> Optional["FlatTree"]:
+        """Reads a tree written by `tobytes`
+
+        The columns are views over `data`, not copies. They are checked once
+        here, so a corrupt tree is rejected instead of failing when walked:
+        kinds must be known, children and siblings must be later rows, and token
+        indices must be below `token_count`, if given.
+
+        :param data: The serialized tree
+        :param token_count: The number of tokens the tree was parsed from, if known
+        :return: The tree, or None if `data` is not a valid tree of this version and byte order
+        """
+        if len(data) < HEADER.size:
+            return None
+        magic, version, little, count = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION or little != (sys.byteorder == 'little'):
+            return None
+
+        view = memoryview(data)
+        offset = HEADER.size
+        columns = []
+        for typecode in COLUMN_TYPES + (KIND_TYPE,):
+            size = count * array(typecode).itemsize
+            if offset + size > len(data):
+                return None
+            columns.append(view[offset:offset + size].cast(typecode))
+            offset += size
+        tokens, values, children, siblings, kinds = columns
+        if count and (max(kinds) >= len(NODE_TYPES) or min(tokens) < -1
+                      or token_count is not None and max(tokens) >= token_count):
+            return None
+        # rows are in depth first order: links only go forward, which also rules out cycles
+        for row, (child, sibling) in enumerate(zip(children, siblings)):
+            if not (child == -1 or row < child < count) or not (sibling == -1 or row < sibling < count):
+                return None
+        return cls.from_columns(kinds, tokens, values, children, siblings)
+
+    @classmethod
+    def load(cls, filename: str) -> Optional["FlatTree"]:
+        """Loads a tree saved by `save` through a memory map
+
+        :param filename: The file name
+        :return: A read-only tree, or None if the file is missing or invalid
+        """
+        try:
+            with open(filename, 'rb') as file:
+                data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        return cls.frombytes(data)
+
+    # endregion
+
+    # region SPECIAL
+
+    def __init__(self):
+        self._kinds: Sequence[int] = array(KIND_TYPE)
+        self._tokens: Sequence[int] = array('i')
+        self._data: Sequence[int] = array('i')
+        self._children: Sequence[int] = array('i')
+        self._siblings: Sequence[int] = array('i')
+
+    def __len__(self) -> int:
+        return len(self._kinds)
+
+    def __str__(self) -> str:
+        return f"[ FlatTree | {len(self)} rows ]"
+
+    # endregion
+
+    # region PROPERTIES
+
+    @property
+    def columns(self) -> Tuple[Sequence[int], ...]:
+        return self._kinds, self._tokens, self._data, self._children, self._siblings
+
+    # endregion
+
+    # region METHODS
+
+    def kind(self, row: int) -> int:
+        return self._kinds[row]
+
+    def node_type(self, row: int) -> Optional[type]:
+        return NODE_TYPES[self._kinds[row]]
+
+    def token(self, row: int) -> int:
+        return self._tokens[row]
+
+    def flags(self, row: int) -> int:
+        return self._data[row] & FLAGS_MASK
+
+    def operator(self, row: int) -> int:
+        return self._data[row] >> OPERATOR_SHIFT
+
+    def first_child(self, row: int) -> int:
+        return self._children[row]
+
+    def next_sibling(self, row: int) -> int:
+        return self._siblings[row]
+
+    def children(self, row: int) -> Iterator[int]:
+        siblings = self._siblings
+        child = self._children[row]
+        while child >= 0:
+            yield child
+            child = siblings[child]
+
+    def to_node(self, source: Any = None, tokens: Optional[Sequence[Any]] = None) -> Optional[Node]:
+        """Rebuilds the object tree
+
+        :param source: The source of a Module root
+        :param tokens: The tokens of a Module root
+        :return: The root node
+        """
+        kinds, token_column, data = self._kinds, self._tokens, self._data
+        values: List[Any] = [None] * len(kinds)
+
+        # children come after their parent, so building backwards finds them all built
+        for row in range(len(kinds) - 1, -1, -1):
+            kind = kinds[row]
+            if kind == NK_NONE:
+                continue
+            if kind == NK_LIST:
+                values[row] = [values[child] for child in self.children(row)]
+                continue
+
+            node_type = NODE_TYPES[kind]
+            node = node_type.__new__(node_type)
+            node.token = token_column[row]
+            for field, child in zip(node_type.FIELDS, self.children(row)):
+                setattr(node, field, values[child])
+            flags, operator = _SCALARS[node_type]
+            if flags:
+                node.flags = data[row] & FLAGS_MASK
+            if operator:
+                node.operator = data[row] >> OPERATOR_SHIFT
+            if node_type is Module:
+                node.source = source
+                node.tokens = tokens
+            values[row] = node
+
+        return values[0] if values else None
+
+    def tobytes(self) -> bytes:
+        """Serializes the tree as its header and raw native columns"""
+        chunks: List[bytes] = [HEADER.pack(MAGIC, VERSION, sys.byteorder == 'little', len(self))]
+        for typecode, column in zip(COLUMN_TYPES + (KIND_TYPE,),
+                                    (self._tokens, self._data, self._children, self._siblings, self._kinds)):
+            chunks.append(column.tobytes() if isinstance(column, (array, memoryview))
+                          else array(typecode, column).tobytes())
+        return b''.join(chunks)
+
+    def save(self, filename: str) -> None:
+        with open(filename, 'wb') as file:
+            file.write(self.tobytes())
+
+    # endregion (methods)
+
+
+# endregion (classes)
+# ---------------------------------------------------------
+# region FUNCTIONS
+
+
+def _slots(node_type: type) -> set:
+    return {slot for klass in node_type.__mro__ for slot in getattr(klass, '__slots__', ())}
+
+
+# whether the nodes of each type have flags and an operator
+_SCALARS: Dict[type, Tuple[bool, bool]] = {
+    node_type: ('flags' in _slots(node_type), 'operator' in _slots(node_type)) for node_type in NODE_KINDS
+}
+
+# endregion (functions)
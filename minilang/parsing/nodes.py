@@ -0,0 +1,650 @@
+# -*- encoding: utf8 -*-
+# ------------------------------------------------------------------------------
+# nodes.py
+# Created on 18/10/2026
+#
+# The MIT License
+#
+#
+# Copyright 2022 Jorge A. Gomes
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# region IMPORTS
+
+from typing import Optional, Any, List, Dict, Tuple, Iterator, Sequence
+
+# endregion (imports)
+# ---------------------------------------------------------
+# region EXPORTS
+
+
+__all__ = [
+    'OPERATORS',
+    'OPERATOR_CODES',
+    'QUALIFIERS',
+    'Node',
+    'Scope',
+    'Module',
+    'Class',
+    'Interface',
+    'Enum',
+    'Block',
+    'Import',
+    'Constant',
+    'Signature',
+    'Field',
+    'Variable',
+    'Parameter',
+    'EnumMember',
+    'Property',
+    'Accessor',
+    'Routine',
+    'Function',
+    'Method',
+    'Operator',
+    'TypeName',
+    'FunctionType',
+    'If',
+    'While',
+    'DoWhile',
+    'Repeat',
+    'Return',
+    'Print',
+    'Assert',
+    'Break',
+    'Continue',
+    'Breakpoint',
+    'Evaluate',
+    'Literal',
+    'Name',
+    'Member',
+    'Call',
+    'Index',
+    'Unary',
+    'Postfix',
+    'Binary',
+    'Assign',
+    'walk',
+    'dump',
+]
+
+
+# endregion (exports)
+# ---------------------------------------------------------
+# region CONSTANTS & ENUMS
+
+# operators are stored in nodes as their index in this tuple
+OPERATORS: Tuple[str, ...] = (
+    '=', '+=', '-=', '*=', '/=', '%=', '<<=', '>>=', '&=', '|=', '^=',
+    'or', '||', 'and', '&&', '|', '^', '&', '==', '!=', '<', '>', '<=', '>=', '<<', '>>',
+    '+', '-', '*', '/', '%', 'not', '!', '~', '++', '--',
+)
+OPERATOR_CODES: Dict[str, int] = {operator: code for code, operator in enumerate(OPERATORS)}
+
+# qualifier and access level flags of declarations
+QF_PUBLIC = 1 << 0
+QF_PROTECTED = 1 << 1
+QF_PRIVATE = 1 << 2
+QF_STATIC = 1 << 3
+QF_UNBOUND = 1 << 4
+QF_FINAL = 1 << 5
+QF_ABSTRACT = 1 << 6
+QF_CONST = 1 << 7
+QF_READONLY = 1 << 8
+QF_OVERRIDE = 1 << 9
+QF_OVERLOAD = 1 << 10
+
+QUALIFIERS: Dict[str, int] = {
+    'public': QF_PUBLIC,
+    'protected': QF_PROTECTED,
+    'private': QF_PRIVATE,
+    'static': QF_STATIC,
+    'unbound': QF_UNBOUND,
+    'final': QF_FINAL,
+    'abstract': QF_ABSTRACT,
+    'const': QF_CONST,
+    'readonly': QF_READONLY,
+    'override': QF_OVERRIDE,
+    'overload': QF_OVERLOAD,
+}
+
+# endregion (constants)
+# ---------------------------------------------------------
+# region CLASSES
+
+
+class Node:
+    """Base class of the syntax tree nodes
+
+    Nodes hold the index of their token in the token sequence of the module,
+    not a copy of its location nor its value: a declaration holds its name
+    token, an operation its operator token, and so on. `FIELDS` names the
+    attributes holding child nodes, or lists of them, in source order.
+    """
+
+    __slots__ = 'token',
+
+    FIELDS: Tuple[str, ...] = ()
+
+    def __init__(self, token: int):
+        self.token: int = token
+
+    def __str__(self) -> str:
+        return f"[ {type(self).__name__} {self.token} ]"
+
+    def children(self) -> Iterator["Node"]:
+        for field in self.FIELDS:
+            child = getattr(self, field)
+            if isinstance(child, list):
+                yield from child
+            elif child is not None:
+                yield child
+
+
+# region SCOPES
+
+class Scope(Node):
+    """A node whose members are declared in its own scope"""
+
+    __slots__ = 'members',
+
+    FIELDS = 'members',
+
+    def __init__(self, token: int, members: List[Node]):
+        super().__init__(token)
+        self.members: List[Node] = members
+
+
+class Module(Scope):
+    """The root node; it keeps the source and tokens its nodes refer to"""
+
+    __slots__ = 'source', 'tokens'
+
+    def __init__(self, token: int, members: List[Node], source: Any, tokens: Sequence[Any]):
+        super().__init__(token, members)
+        self.source: Any = source
+        self.tokens: Sequence[Any] = tokens
+
+    def value(self, token: int) -> str:
+        """Gets the value of a token, e.g. the name of a declaration
+
+        :param token: The token index held by a node
+        :return: The token value
+        """
+        return self.tokens[token].value
+
+
+class Class(Scope):
+
+    __slots__ = 'bases', 'flags'
+
+    FIELDS = 'bases', 'members'
+
+    def __init__(self, token: int, bases: List["TypeName"], members: List[Node], flags: int = 0):
+        super().__init__(token, members)
+        self.bases: List[TypeName] = bases
+        self.flags: int = flags
+
+
+class Interface(Scope):
+
+    __slots__ = 'flags',
+
+    def __init__(self, token: int, members: List[Node], flags: int = 0):
+        super().__init__(token, members)
+        self.flags: int = flags
+
+
+class Enum(Scope):
+
+    __slots__ = 'type', 'flags'
+
+    FIELDS = 'type', 'members'
+
+    def __init__(self, token: int, type_: Node, members: List["EnumMember"], flags: int = 0):
+        super().__init__(token, members)
+        self.type: Node = type_
+        self.flags: int = flags
+
+
+class Block(Scope):
+    """A braced sequence of statements; its token is the opening brace"""
+
+    __slots__ = ()
+
+# endregion
+
+# region DECLARATIONS
+
+
+class Import(Node):
+    """import { Name, ... } -> "path"; its token is the import keyword"""
+
+    __slots__ = 'names', 'path'
+
+    FIELDS = 'names', 'path'
+
+    def __init__(self, token: int, names: List["Name"], path: "Literal"):
+        super().__init__(token)
+        self.names: List[Name] = names
+        self.path: Literal = path
+
+
+class Constant(Node):
+
+    __slots__ = 'type', 'value', 'flags'
+
+    FIELDS = 'type', 'value'
+
+    def __init__(self, token: int, type_: Node, value: Optional[Node], flags: int = 0):
+        super().__init__(token)
+        self.type: Node = type_
+        self.value: Optional[Node] = value
+        self.flags: int = flags
+
+
+class Signature(Node):
+    """A named function type, like `Name: (i32, i32) i32;`"""
+
+    __slots__ = 'type', 'flags'
+
+    FIELDS = 'type',
+
+    def __init__(self, token: int, type_: "FunctionType", flags: int = 0):
+        super().__init__(token)
+        self.type: FunctionType = type_
+        self.flags: int = flags
+
+
+class Field(Constant):
+
+    __slots__ = ()
+
+
+class Variable(Node):
+
+    __slots__ = 'type', 'value'
+
+    FIELDS = 'type', 'value'
+
+    def __init__(self, token: int, type_: Node, value: Optional[Node]):
+        super().__init__(token)
+        self.type: Node = type_
+        self.value: Optional[Node] = value
+
+
+class Parameter(Node):
+    """A routine parameter; its token is -1 if the parameter has a type only"""
+
+    __slots__ = 'type',
+
+    FIELDS = 'type',
+
+    def __init__(self, token: int, type_: Node):
+        super().__init__(token)
+        self.type: Node = type_
+
+
+class EnumMember(Node):
+
+    __slots__ = 'value',
+
+    FIELDS = 'value',
+
+    def __init__(self, token: int, value: Optional[Node]):
+        super().__init__(token)
+        self.value: Optional[Node] = value
+
+
+class Property(Node):
+
+    __slots__ = 'type', 'getter', 'setter', 'flags'
+
+    FIELDS = 'type', 'getter', 'setter'
+
+    def __init__(self, token: int, type_: Node, getter: Optional["Accessor"], setter: Optional["Accessor"],
+                 flags: int = 0):
+        super().__init__(token)
+        self.type: Node = type_
+        self.getter: Optional[Accessor] = getter
+        self.setter: Optional[Accessor] = setter
+        self.flags: int = flags
+
+
+class Accessor(Node):
+    """The get or set part of a property; its body is None if it is declared only"""
+
+    __slots__ = 'body',
+
+    FIELDS = 'body',
+
+    def __init__(self, token: int, body: Optional[Block]):
+        super().__init__(token)
+        self.body: Optional[Block] = body
+
+
+class Routine(Node):
+    """A function or method; its body is None if it is declared only
+
+    `result` is None for constructors.
+    """
+
+    __slots__ = 'parameters', 'result', 'body', 'flags'
+
+    FIELDS = 'parameters', 'result', 'body'
+
+    def __init__(self, token: int, parameters: List[Parameter], result: Optional[Node], body: Optional[Block],
+                 flags: int = 0):
+        super().__init__(token)
+        self.parameters: List[Parameter] = parameters
+        self.result: Optional[Node] = result
+        self.body: Optional[Block] = body
+        self.flags: int = flags
+
+
+class Function(Routine):
+
+    __slots__ = ()
+
+
+class Method(Routine):
+
+    __slots__ = ()
+
+
+class Operator(Routine):
+    """An operator method, like `+(other: i32): i32`; its token is the operator"""
+
+    __slots__ = 'operator',
+
+    def __init__(self, token: int, operator: int, parameters: List[Parameter], result: Optional[Node],
+                 body: Optional[Block], flags: int = 0):
+        super().__init__(token, parameters, result, body, flags)
+        self.operator: int = operator
+
+# endregion
+
+# region TYPES
+
+
+class TypeName(Node):
+    """A primitive type or a type referred to by name"""
+
+    __slots__ = ()
+
+
+class FunctionType(Node):
+    """(T, ...) R; its token is the opening parenthesis"""
+
+    __slots__ = 'parameters', 'result'
+
+    FIELDS = 'parameters', 'result'
+
+    def __init__(self, token: int, parameters: List[Node], result: Node):
+        super().__init__(token)
+        self.parameters: List[Node] = parameters
+        self.result: Node = result
+
+# endregion
+
+# region STATEMENTS
+
+
+class If(Node):
+    """if, with elif chains as nested Ifs in `otherwise`"""
+
+    __slots__ = 'condition', 'then', 'otherwise'
+
+    FIELDS = 'condition', 'then', 'otherwise'
+
+    def __init__(self, token: int, condition: Node, then: Block, otherwise: Optional[Node]):
+        super().__init__(token)
+        self.condition: Node = condition
+        self.then: Block = then
+        self.otherwise: Optional[Node] = otherwise
+
+
+class While(Node):
+
+    __slots__ = 'condition', 'body'
+
+    FIELDS = 'condition', 'body'
+
+    def __init__(self, token: int, condition: Node, body: Block):
+        super().__init__(token)
+        self.condition: Node = condition
+        self.body: Block = body
+
+
+class DoWhile(Node):
+
+    __slots__ = 'body', 'condition'
+
+    FIELDS = 'body', 'condition'
+
+    def __init__(self, token: int, body: Block, condition: Node):
+        super().__init__(token)
+        self.body: Block = body
+        self.condition: Node = condition
+
+
+class Repeat(Node):
+
+    __slots__ = 'count', 'body'
+
+    FIELDS = 'count', 'body'
+
+    def __init__(self, token: int, count: Node, body: Block):
+        super().__init__(token)
+        self.count: Node = count
+        self.body: Block = body
+
+
+class Return(Node):
+
+    __slots__ = 'value',
+
+    FIELDS = 'value',
+
+    def __init__(self, token: int, value: Optional[Node]):
+        super().__init__(token)
+        self.value: Optional[Node] = value
+
+
+class Print(Node):
+
+    __slots__ = 'values',
+
+    FIELDS = 'values',
+
+    def __init__(self, token: int, values: List[Node]):
+        super().__init__(token)
+        self.values: List[Node] = values
+
+
+class Assert(Node):
+
+    __slots__ = 'condition',
+
+    FIELDS = 'condition',
+
+    def __init__(self, token: int, condition: Node):
+        super().__init__(token)
+        self.condition: Node = condition
+
+
+class Break(Node):
+
+    __slots__ = ()
+
+
+class Continue(Node):
+
+    __slots__ = ()
+
+
+class Breakpoint(Node):
+
+    __slots__ = ()
+
+
+class Evaluate(Node):
+    """An expression used as a statement; its token is the first one of the expression"""
+
+    __slots__ = 'expression',
+
+    FIELDS = 'expression',
+
+    def __init__(self, token: int, expression: Node):
+        super().__init__(token)
+        self.expression: Node = expression
+
+# endregion
+
+# region EXPRESSIONS
+
+
+class Literal(Node):
+    """A number, a string, true, false or null"""
+
+    __slots__ = ()
+
+
+class Name(Node):
+    """An identifier, or one of this, super, base and value"""
+
+    __slots__ = ()
+
+
+class Member(Node):
+    """target.name; its token is the name, so lookups chain as nested Members"""
+
+    __slots__ = 'target',
+
+    FIELDS = 'target',
+
+    def __init__(self, token: int, target: Node):
+        super().__init__(token)
+        self.target: Node = target
+
+
+class Call(Node):
+    """target(arguments); its token is the opening parenthesis"""
+
+    __slots__ = 'target', 'arguments'
+
+    FIELDS = 'target', 'arguments'
+
+    def __init__(self, token: int, target: Node, arguments: List[Node]):
+        super().__init__(token)
+        self.target: Node = target
+        self.arguments: List[Node] = arguments
+
+
+class Index(Node):
+    """target[index]; its token is the opening bracket"""
+
+    __slots__ = 'target', 'index'
+
+    FIELDS = 'target', 'index'
+
+    def __init__(self, token: int, target: Node, index: Node):
+        super().__init__(token)
+        self.target: Node = target
+        self.index: Node = index
+
+
+class Unary(Node):
+
+    __slots__ = 'operator', 'operand'
+
+    FIELDS = 'operand',
+
+    def __init__(self, token: int, operator: int, operand: Node):
+        super().__init__(token)
+        self.operator: int = operator
+        self.operand: Node = operand
+
+
+class Postfix(Unary):
+
+    __slots__ = ()
+
+
+class Binary(Node):
+
+    __slots__ = 'operator', 'left', 'right'
+
+    FIELDS = 'left', 'right'
+
+    def __init__(self, token: int, operator: int, left: Node, right: Node):
+        super().__init__(token)
+        self.operator: int = operator
+        self.left: Node = left
+        self.right: Node = right
+
+
+class Assign(Binary):
+    """target = value, or a compound assignment like +="""
+
+    __slots__ = ()
+
+# endregion
+
+
+# endregion (classes)
+# ---------------------------------------------------------
+# region FUNCTIONS
+
+
+def walk(node: Node) -> Iterator[Node]:
+    """Iterates over a node and its descendants, depth first and in source order
+
+    :param node: The root node
+    :return: An iterator of nodes
+    """
+    stack: List[Node] = [node]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(reversed(list(node.children())))
+
+
+def dump(node: Node, tokens: Sequence[Any], indent: int = 0) -> str:
+    """Formats a node and its descendants, one per line
+
+    :param node: The root node
+    :param tokens: The tokens the node indices refer to
+    :param indent: The indentation of the root node
+    :return: The formatted tree
+    """
+    value = tokens[node.token].value if 0 <= node.token < len(tokens) else ''
+    operator = getattr(node, 'operator', None)
+    line = f"{'  ' * indent}{type(node).__name__} {value!r}"
+    if operator is not None:
+        line += f" {OPERATORS[operator]}"
+    lines = [line]
+    for child in node.children():
+        lines.append(dump(child, tokens, indent + 1))
+    return '\n'.join(lines)
+
+
+# endregion (functions)
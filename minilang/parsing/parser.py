@@ -0,0 +1,575 @@
+# -*- encoding: utf8 -*-
+# ------------------------------------------------------------------------------
+# parser.py
+# Created on 18/10/2026
+#
+# The MIT License
+#
+#
+# Copyright 2022 Jorge A. Gomes
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# region IMPORTS
+
+import os
+import sys
+
+from minilang.utillities.jsom import JSOM
+from minilang.utillities.code import Source
+from minilang.utillities.error import MinilangError, ParseError
+from minilang.lexing.core import Token, Lexer
+from minilang.lexing.buffer import TokenBuffer
+from minilang.lexing.stream import TokenStream
+from minilang.lexing.tokens import (
+    TC_NUMBER, TC_STRING, TC_OPERATOR, TC_EOF, SC_IDENTIFIER, SC_PRIMITIVE, SC_KEYVALUE, SC_QUALIFIER, SC_ACCESS,
+    SC_RESERVED, LPAREN, RPAREN, LBRACE, RBRACE, LBRACKET, RBRACKET, COMMA, DOT, ASSIGN, SEMICOLON, COLON, POINTER,
+    INCR, DECR, KW_IMPORT, KW_GET, KW_SET, KW_IF, KW_ELIF, KW_ELSE, KW_WHILE, KW_DO, KW_RETURN, KW_BREAK,
+    KW_BREAKPOINT, KW_CONTINUE, KW_REPEAT, KW_PRINT, KW_ASSERT, KW_THIS, KW_SUPER, KW_BASE, KW_VALUE,
+)
+from minilang.parsing.flat import FlatTree
+from minilang.parsing.nodes import (
+    OPERATOR_CODES, QUALIFIERS, Node, Module, Class, Interface, Enum, Block, Import, Constant, Signature, Field,
+    Variable, Parameter, EnumMember, Property, Accessor, Function, Method, Operator, TypeName, FunctionType, If,
+    While, DoWhile, Repeat, Return, Print, Assert, Break, Continue, Breakpoint, Evaluate, Literal, Name, Member,
+    Call, Index, Unary, Postfix, Binary, Assign, dump,
+)
+from typing import Optional, Union, List, Tuple, Callable
+
+# endregion (imports)
+# ---------------------------------------------------------
+# region EXPORTS
+
+
+__all__ = [
+    'Parser',
+]
+
+
+# endregion (exports)
+# ---------------------------------------------------------
+# region CONSTANTS & ENUMS
+
+LEXCONF: str = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'lexing', 'lexconf.json')
+
+# binding power of the binary operators; all of them are left associative
+PRECEDENCE = {
+    'or': 1, '||': 1,
+    'and': 2, '&&': 2,
+    '|': 3,
+    '^': 4,
+    '&': 5,
+    '==': 6, '!=': 6,
+    '<': 7, '>': 7, '<=': 7, '>=': 7,
+    '<<': 8, '>>': 8,
+    '+': 9, '-': 9,
+    '*': 10, '/': 10, '%': 10,
+}
+ASSIGNMENTS = frozenset(('=', '+=', '-=', '*=', '/=', '%=', '<<=', '>>=', '&=', '|=', '^='))
+PREFIX = frozenset(('-', '+', '!', '~', 'not', '++', '--'))
+
+# identifiers that are operators when found between operands or before one
+WORD_OPERATORS = frozenset(('and', 'or', 'not'))
+
+# key values that name an object instead of being a constant
+KEY_NAMES = frozenset((KW_THIS, KW_SUPER, KW_BASE, KW_VALUE))
+
+JUMPS = {KW_BREAK: Break, KW_CONTINUE: Continue, KW_BREAKPOINT: Breakpoint}
+
+# endregion (constants)
+# ---------------------------------------------------------
+# region CLASSES
+
+
+class Parser:
+    """Recursive-descent parser of a minilang module
+
+    Declarations and statements are told apart by their first two tokens, and
+    expressions are parsed by precedence climbing, so parsing never backtracks
+    and takes linear time. Nodes hold token indices; see ``nodes.Node``.
+    """
+
+    __slots__ = '_source', '_tokens', '_count', '_stream', '_statements'
+
+    def __init__(self, source: Source, tokens: Union[List[Token], TokenBuffer]):
+        self._source: Source = source
+        self._tokens: Union[List[Token], TokenBuffer] = tokens
+        self._count: int = len(tokens)
+        self._stream: TokenStream = TokenStream(source, tokens, raises=True)
+        self._statements: dict = {
+            KW_IF: self._if,
+            KW_WHILE: self._while,
+            KW_DO: self._do,
+            KW_REPEAT: self._repeat,
+            KW_RETURN: self._return,
+            KW_PRINT: self._print,
+            KW_ASSERT: self._assert,
+            KW_BREAK: self._jump,
+            KW_CONTINUE: self._jump,
+            KW_BREAKPOINT: self._jump,
+        }
+
+    # region METHODS
+
+    def parse(self) -> Tuple[Optional[Module], Optional[MinilangError]]:
+        """Parses the module
+
+        :return: The module node and None, or None and the first error found
+        """
+        try:
+            return self._module(), None
+        except MinilangError as error:
+            return None, error
+
+    def parse_flat(self) -> Tuple[Optional[FlatTree], Optional[MinilangError]]:
+        """Parses the module into a flat tree
+
+        The object tree is only kept while it is being flattened.
+
+        :return: The flat tree and None, or None and the first error found
+        """
+        module, error = self.parse()
+        if error:
+            return None, error
+        return FlatTree.from_node(module), None
+
+    def _fail(self, expected: str):
+        token = self._stream.token
+        raise ParseError(f"Expected {expected}, found '{token.value}'", token.location, self._stream.index)
+
+    def _peek_is(self, n: int, value: str) -> bool:
+        token = self._stream.peek(n)
+        return token is not None and token.value == value
+
+    def _sequence(self, item: Callable[[], Node], close: str) -> List[Node]:
+        # comma separated items up to the closing token; the opening one is already consumed
+        stream = self._stream
+        items: List[Node] = []
+        if stream.match_token(close):
+            return items
+        items.append(item())
+        while stream.match_token(COMMA):
+            items.append(item())
+        stream.expect_token(close)
+        return items
+
+    def _identifier(self) -> int:
+        stream = self._stream
+        if stream.token.subkind_code != SC_IDENTIFIER:
+            self._fail("an identifier")
+        index = stream.index
+        stream.advance()
+        return index
+
+    def _operator(self) -> Optional[str]:
+        """Gets the operator at the current token
+
+        :return: The operator, or None if the token is not a known operator
+        """
+        index = self._stream.index
+        if index >= self._count:
+            return None
+        token = self._tokens[index]
+        if token.kind_code != TC_OPERATOR:
+            if token.subkind_code == SC_IDENTIFIER and token.value in WORD_OPERATORS:
+                return token.value
+            return None
+        return token.value if token.value in OPERATOR_CODES else None
+
+    # region DECLARATIONS
+
+    def _module(self) -> Module:
+        stream = self._stream
+        members: List[Node] = []
+        while stream.token.kind_code != TC_EOF:
+            members.append(self._declaration())
+        return Module(0, members, self._source, self._tokens)
+
+    def _qualifiers(self) -> int:
+        stream = self._stream
+        flags = 0
+        while stream.token.subkind_code in (SC_QUALIFIER, SC_ACCESS):
+            flag = QUALIFIERS.get(stream.token.value)
+            if flag is None or flags & flag:
+                self._fail("a declaration")
+            flags |= flag
+            stream.advance()
+        return flags
+
+    def _declaration(self) -> Node:
+        stream = self._stream
+        if stream.is_token(KW_IMPORT):
+            return self._import()
+
+        flags = self._qualifiers()
+        token = self._identifier()
+
+        if stream.match_token(COLON):
+            if stream.is_token(LBRACE):
+                return Interface(token, self._members(), flags)
+            type_ = self._type()
+            if stream.is_token(LBRACE):
+                stream.advance()
+                return Enum(token, type_, self._sequence(self._enum_member, RBRACE), flags)
+            value = self._expression() if stream.match_token(ASSIGN) else None
+            stream.expect_token(SEMICOLON)
+            if value is None and isinstance(type_, FunctionType):
+                return Signature(token, type_, flags)
+            return Constant(token, type_, value, flags)
+
+        if stream.is_token(LPAREN):
+            parameters, result, body = self._routine()
+            return Function(token, parameters, result, body, flags)
+
+        bases: List[Node] = []
+        if stream.match_token(POINTER):
+            bases.append(TypeName(self._identifier()))
+            while stream.match_token(COMMA):
+                bases.append(TypeName(self._identifier()))
+        return Class(token, bases, self._members(), flags)
+
+    def _import(self) -> Import:
+        stream = self._stream
+        token = stream.index
+        stream.advance()
+        stream.expect_token(LBRACE)
+        names = self._sequence(lambda: Name(self._identifier()), RBRACE)
+        stream.expect_token(POINTER)
+        if stream.token.kind_code != TC_STRING:
+            self._fail("a module path")
+        path = Literal(stream.index)
+        stream.advance()
+        stream.expect_token(SEMICOLON)
+        return Import(token, names, path)
+
+    def _enum_member(self) -> EnumMember:
+        token = self._identifier()
+        return EnumMember(token, self._expression() if self._stream.match_token(ASSIGN) else None)
+
+    def _members(self) -> List[Node]:
+        stream = self._stream
+        stream.expect_token(LBRACE)
+        members: List[Node] = []
+        while not stream.match_token(RBRACE):
+            members.append(self._member())
+        return members
+
+    def _member(self) -> Node:
+        stream = self._stream
+        flags = self._qualifiers()
+        token = stream.index
+
+        if stream.token.kind_code == TC_OPERATOR:
+            operator = self._operator()
+            if operator is None:
+                self._fail("an operator")
+            stream.advance()
+            parameters, result, body = self._routine()
+            return Operator(token, OPERATOR_CODES[operator], parameters, result, body, flags)
+
+        self._identifier()
+        if stream.is_token(LPAREN):
+            parameters, result, body = self._routine()
+            return Method(token, parameters, result, body, flags)
+
+        stream.expect_token(COLON)
+        type_ = self._type()
+        if stream.is_token(LBRACE):
+            getter, setter = self._accessors()
+            return Property(token, type_, getter, setter, flags)
+        value = self._expression() if stream.match_token(ASSIGN) else None
+        stream.expect_token(SEMICOLON)
+        return Field(token, type_, value, flags)
+
+    def _accessors(self) -> Tuple[Optional[Accessor], Optional[Accessor]]:
+        stream = self._stream
+        stream.expect_token(LBRACE)
+        getter: Optional[Accessor] = None
+        setter: Optional[Accessor] = None
+        while not stream.match_token(RBRACE):
+            token = stream.index
+            if getter is None and stream.match_token(KW_GET):
+                getter = Accessor(token, self._body())
+            elif setter is None and stream.match_token(KW_SET):
+                setter = Accessor(token, self._body())
+            else:
+                self._fail("get or set")
+        return getter, setter
+
+    def _routine(self) -> Tuple[List[Parameter], Optional[Node], Optional[Block]]:
+        stream = self._stream
+        stream.expect_token(LPAREN)
+        parameters = self._sequence(self._parameter, RPAREN)
+        result = self._type() if stream.match_token(COLON) else None
+        return parameters, result, self._body()
+
+    def _parameter(self) -> Parameter:
+        stream = self._stream
+        if stream.token.subkind_code == SC_IDENTIFIER and self._peek_is(1, COLON):
+            token = stream.index
+            stream.advance()
+            stream.advance()
+            return Parameter(token, self._type())
+        return Parameter(-1, self._type())
+
+    def _type(self) -> Node:
+        stream = self._stream
+        token = stream.index
+        if stream.match_token(LPAREN):
+            parameters = self._sequence(self._type, RPAREN)
+            return FunctionType(token, parameters, self._type())
+        if stream.token.subkind_code not in (SC_PRIMITIVE, SC_IDENTIFIER):
+            self._fail("a type")
+        stream.advance()
+        return TypeName(token)
+
+    # endregion
+
+    # region STATEMENTS
+
+    def _body(self) -> Optional[Block]:
+        # the body of a routine or accessor, or None if it is only declared
+        return None if self._stream.match_token(SEMICOLON) else self._block()
+
+    def _block(self) -> Block:
+        stream = self._stream
+        token = stream.index
+        stream.expect_token(LBRACE)
+        statements: List[Node] = []
+        while not stream.match_token(RBRACE):
+            statements.append(self._statement())
+        return Block(token, statements)
+
+    def _statement(self) -> Node:
+        stream = self._stream
+        current = stream.token
+        if current.subkind_code == SC_RESERVED:
+            rule = self._statements.get(current.value)
+            if rule is None:
+                self._fail("a statement")
+            return rule()
+        if current.value == LBRACE:
+            return self._block()
+
+        token = stream.index
+        if current.subkind_code == SC_IDENTIFIER and self._peek_is(1, COLON):
+            stream.advance()
+            stream.advance()
+            type_ = self._type()
+            value = self._expression() if stream.match_token(ASSIGN) else None
+            stream.expect_token(SEMICOLON)
+            return Variable(token, type_, value)
+
+        expression = self._expression()
+        stream.expect_token(SEMICOLON)
+        return Evaluate(token, expression)
+
+    def _condition(self) -> Node:
+        stream = self._stream
+        stream.expect_token(LPAREN)
+        condition = self._expression()
+        stream.expect_token(RPAREN)
+        return condition
+
+    def _if(self) -> If:
+        # also parses elif, which has the same shape
+        stream = self._stream
+        token = stream.index
+        stream.advance()
+        condition = self._condition()
+        then = self._block()
+        otherwise: Optional[Node] = None
+        if stream.is_token(KW_ELIF):
+            otherwise = self._if()
+        elif stream.match_token(KW_ELSE):
+            otherwise = self._if() if stream.is_token(KW_IF) else self._block()
+        return If(token, condition, then, otherwise)
+
+    def _while(self) -> While:
+        token = self._stream.index
+        self._stream.advance()
+        condition = self._condition()
+        return While(token, condition, self._block())
+
+    def _do(self) -> DoWhile:
+        stream = self._stream
+        token = stream.index
+        stream.advance()
+        body = self._block()
+        stream.expect_token(KW_WHILE)
+        condition = self._condition()
+        stream.expect_token(SEMICOLON)
+        return DoWhile(token, body, condition)
+
+    def _repeat(self) -> Repeat:
+        token = self._stream.index
+        self._stream.advance()
+        count = self._condition()
+        return Repeat(token, count, self._block())
+
+    def _return(self) -> Return:
+        stream = self._stream
+        token = stream.index
+        stream.advance()
+        value = None if stream.is_token(SEMICOLON) else self._expression()
+        stream.expect_token(SEMICOLON)
+        return Return(token, value)
+
+    def _print(self) -> Print:
+        stream = self._stream
+        token = stream.index
+        stream.advance()
+        values = [self._expression()]
+        while stream.match_token(COMMA):
+            values.append(self._expression())
+        stream.expect_token(SEMICOLON)
+        return Print(token, values)
+
+    def _assert(self) -> Assert:
+        stream = self._stream
+        token = stream.index
+        stream.advance()
+        condition = self._expression()
+        stream.expect_token(SEMICOLON)
+        return Assert(token, condition)
+
+    def _jump(self) -> Node:
+        stream = self._stream
+        token = stream.index
+        node = JUMPS[stream.token.value](token)
+        stream.advance()
+        stream.expect_token(SEMICOLON)
+        return node
+
+    # endregion
+
+    # region EXPRESSIONS
+
+    def _expression(self) -> Node:
+        # assignments are right associative and bind the loosest
+        target = self._binary(1)
+        operator = self._operator()
+        if operator in ASSIGNMENTS:
+            token = self._stream.index
+            self._stream.advance()
+            return Assign(token, OPERATOR_CODES[operator], target, self._expression())
+        return target
+
+    def _binary(self, precedence: int) -> Node:
+        stream = self._stream
+        left = self._unary()
+        while True:
+            operator = self._operator()
+            current = PRECEDENCE.get(operator)
+            if current is None or current < precedence:
+                return left
+            token = stream.index
+            stream.advance()
+            left = Binary(token, OPERATOR_CODES[operator], left, self._binary(current + 1))
+
+    def _unary(self) -> Node:
+        operator = self._operator()
+        if operator in PREFIX:
+            token = self._stream.index
+            self._stream.advance()
+            return Unary(token, OPERATOR_CODES[operator], self._unary())
+        return self._postfix(self._primary())
+
+    def _primary(self) -> Node:
+        stream = self._stream
+        current = stream.token
+        token = stream.index
+        kind = current.kind_code
+        subkind = current.subkind_code
+
+        if kind == TC_NUMBER or kind == TC_STRING:
+            stream.advance()
+            return Literal(token)
+        if subkind == SC_IDENTIFIER:
+            stream.advance()
+            return Name(token)
+        if subkind == SC_KEYVALUE:
+            stream.advance()
+            return Name(token) if current.value in KEY_NAMES else Literal(token)
+        if stream.match_token(LPAREN):
+            expression = self._expression()
+            stream.expect_token(RPAREN)
+            return expression
+        self._fail("an expression")
+
+    def _postfix(self, target: Node) -> Node:
+        stream = self._stream
+        while True:
+            token = stream.index
+            value = stream.token.value
+            if value == DOT:
+                stream.advance()
+                target = Member(self._identifier(), target)
+            elif value == LPAREN:
+                stream.advance()
+                target = Call(token, target, self._sequence(self._expression, RPAREN))
+            elif value == LBRACKET:
+                stream.advance()
+                index = self._expression()
+                stream.expect_token(RBRACKET)
+                target = Index(token, target, index)
+            elif value == INCR or value == DECR:
+                stream.advance()
+                target = Postfix(token, OPERATOR_CODES[value], target)
+            else:
+                return target
+
+    # endregion
+
+    # endregion (methods)
+
+
+# endregion (classes)
+# ---------------------------------------------------------
+# region FUNCTIONS
+
+
+def main() -> int:
+
+    conf: JSOM = JSOM.parse_file(LEXCONF)
+    source: Source = Source.load(os.path.join(os.path.dirname(LEXCONF), '../../examples/testproj/src/main.txt'))
+    tokens, error = Lexer(conf, source).gen_tokens()
+    if error:
+        print(error.message, file=sys.stderr)
+        return 1
+
+    module, error = Parser(source, tokens).parse()
+    if error:
+        print(error, file=sys.stderr)
+        return 1
+
+    print(dump(module, tokens))
+    return 0
+
+
+# endregion (functions)
+# ---------------------------------------------------------
+# region ENTRYPOINT
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+# endregion (entrypoint)
@@ -0,0 +1,526 @@
+# -*- encoding: utf8 -*-
+# ------------------------------------------------------------------------------
+# bytecode.py
+# Created on 18/10/2026
+#
+# The MIT License
+#
+#
+# Copyright 2022 Jorge A. Gomes
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# region IMPORTS
+
+import os
+import struct
+
+from array import array
+
+from minilang.parsing.nodes import QF_STATIC
+from minilang.translating.opcodes import iter_instructions
+from typing import Optional, Any, List, Dict, Tuple
+
+# endregion (imports)
+# ---------------------------------------------------------
+# region EXPORTS
+
+
+__all__ = [
+    'BANK_INT',
+    'BANK_FLOAT',
+    'BANK_OBJECT',
+    'Routine',
+    'ClassInfo',
+    'CodeModule',
+]
+
+
+# endregion (exports)
+# ---------------------------------------------------------
+# region CONSTANTS & ENUMS
+
+MAGIC = b'MLBC'
+VERSION = 1
+HEADER = struct.Struct('<4sHxx')
+
+# the banks of a frame: integers and floats are kept unboxed in arrays, anything else in a list
+BANK_INT = 0
+BANK_FLOAT = 1
+BANK_OBJECT = 2
+# the integers an int bank holds: 64-bit signed, storing others is an overflow
+INT_MIN = -(1 << 63)
+INT_MAX = (1 << 63) - 1
+
+# routine kinds
+RK_FUNCTION = 0
+RK_METHOD = 1
+RK_CONSTRUCTOR = 2
+RK_GETTER = 3
+RK_SETTER = 4
+RK_OPERATOR = 5
+RK_INITIALIZER = 6      # the field initializers of a class, run on every new instance
+RK_MODULE = 7           # the module level code: constants and static fields
+
+# global kinds
+GK_CONSTANT = 0
+GK_FUNCTION = 1
+GK_CLASS = 2
+GK_ENUM = 3
+GK_INTERFACE = 4
+GK_SIGNATURE = 5
+
+_UNNAMED = {RK_CONSTRUCTOR: '<new>', RK_INITIALIZER: '<fields>', RK_MODULE: '<module>'}
+
+# constant tags
+_NONE = 0
+_FALSE = 1
+_TRUE = 2
+_INT = 3
+_BIGINT = 4
+_FLOAT = 5
+_STRING = 6
+
+_U8 = struct.Struct('<B')
+_U32 = struct.Struct('<I')
+_I32 = struct.Struct('<i')
+_I64 = struct.Struct('<q')
+_F64 = struct.Struct('<d')
+
+# endregion (constants)
+# ---------------------------------------------------------
+# region CLASSES
+
+
+class Routine:
+    """The bytecode of a function, method, accessor or initializer
+
+    Locals are resolved to slots at translation time: `frame` holds the size
+    of the int, float and object banks of the routine, and `parameters` the
+    (bank, slot) each argument is copied to. Instance routines keep `this` in
+    object slot 0. `lines` pairs instruction indices with the source line the
+    instructions from there on come from.
+    """
+
+    __slots__ = 'name', 'kind', 'owner', 'flags', 'parameters', 'frame', 'code', 'lines'
+
+    def __init__(self, name: str, kind: int, owner: str = '', flags: int = 0,
+                 parameters: Optional[List[Tuple[int, int]]] = None, frame: Tuple[int, int, int] = (0, 0, 0),
+                 code: Optional[array] = None, lines: Optional[array] = None):
+        self.name: str = name
+        self.kind: int = kind
+        self.owner: str = owner
+        self.flags: int = flags
+        self.parameters: List[Tuple[int, int]] = parameters or []
+        self.frame: Tuple[int, int, int] = frame
+        self.code: array = code if code is not None else array('B')
+        self.lines: array = lines if lines is not None else array('I')
+
+    def __str__(self) -> str:
+        owner = f"{self.owner}." if self.owner else ''
+        return f"[ Routine {owner}{self.name}/{self.arity} | {len(self.code)} bytes ]"
+
+    @property
+    def arity(self) -> int:
+        return len(self.parameters)
+
+    @property
+    def has_this(self) -> bool:
+        return self.kind not in (RK_FUNCTION, RK_MODULE) and not self.flags & QF_STATIC
+
+    def line_of(self, index: int) -> int:
+        """Gets the source line of an instruction
+
+        :param index: The instruction index
+        :return: The line, or 0 if unknown
+        """
+        line = 0
+        lines = self.lines
+        for position in range(0, len(lines), 2):
+            if lines[position] > index:
+                break
+            line = lines[position + 1]
+        return line
+
+
+class ClassInfo:
+    """A class of a module: its fields, accessors and routines
+
+    `fields` lists the instance fields declared by this class, as (name, bank)
+    pairs; the fields of base classes come first in an instance. `routines`
+    holds the indices of its methods, constructors and operators, whose name
+    and arity are in the routines themselves. Properties map to their getter
+    and setter routine indices, -1 when missing.
+    """
+
+    __slots__ = 'name', 'bases', 'flags', 'fields', 'statics', 'routines', 'properties', 'initializer'
+
+    def __init__(self, name: str, bases: Optional[List[str]] = None, flags: int = 0):
+        self.name: str = name
+        self.bases: List[str] = bases or []
+        self.flags: int = flags
+        self.fields: List[Tuple[str, int]] = []
+        self.statics: List[Tuple[str, int]] = []
+        self.routines: List[int] = []
+        self.properties: List[Tuple[str, int, int]] = []
+        self.initializer: int = -1
+
+    def __str__(self) -> str:
+        return f"[ ClassInfo {self.name} | {len(self.fields)} fields, {len(self.routines)} routines ]"
+
+
+class CodeModule:
+    """A translated module, and its binary artifact format
+
+    Instructions refer to the module tables by index: `constants` is the
+    constant pool, `names` the global and member names, and `refs` the
+    tuples of names and counts the calls and static members need. `globals`
+    lists the module level declarations as (name, kind, index) triples, the
+    index being a routine, class or enum index depending on the kind. `init`
+    is the routine setting the constants and static fields up.
+    """
+
+    __slots__ = 'filename', 'constants', 'names', 'refs', 'routines', 'classes', 'enums', 'globals', 'imports', \
+        'init', '_indices'
+
+    # region CLASSMETHODS
+
+    @classmethod
+    def frombytes(cls, data: Any) -> "CodeModule":
+        """Reads a module from its binary form
+
+        :param data: A bytes-like object, as returned by `tobytes`
+        :return: The module
+        :raises ValueError: if the data is not a valid module
+        """
+        view = memoryview(data)
+        if len(view) < HEADER.size:
+            raise ValueError("Truncated bytecode module")
+        magic, version = HEADER.unpack_from(view, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a bytecode module, or from another version")
+        reader = _Reader(view, HEADER.size)
+        try:
+            module = cls(reader.string())
+            module.constants = [reader.constant() for _ in range(reader.u32())]
+            module.names = [reader.string() for _ in range(reader.u32())]
+            module.refs = [tuple(reader.constant() for _ in range(reader.u8())) for _ in range(reader.u32())]
+            for _ in range(reader.u32()):
+                routine = Routine(reader.string(), reader.u8(), reader.string(), reader.u32())
+                routine.parameters = [(reader.u8(), reader.u32()) for _ in range(reader.u32())]
+                routine.frame = (reader.u32(), reader.u32(), reader.u32())
+                routine.code = array('B', reader.block())
+                routine.lines = array('I', (reader.u32() for _ in range(reader.u32())))
+                module.routines.append(routine)
+            for _ in range(reader.u32()):
+                info = ClassInfo(reader.string(), [reader.string() for _ in range(reader.u32())], reader.u32())
+                info.fields = [(reader.string(), reader.u8()) for _ in range(reader.u32())]
+                info.statics = [(reader.string(), reader.u8()) for _ in range(reader.u32())]
+                info.routines = [reader.u32() for _ in range(reader.u32())]
+                info.properties = [(reader.string(), reader.i32(), reader.i32()) for _ in range(reader.u32())]
+                info.initializer = reader.i32()
+                module.classes.append(info)
+            module.enums = [(reader.string(), [(reader.string(), reader.u32()) for _ in range(reader.u32())])
+                            for _ in range(reader.u32())]
+            module.globals = [(reader.string(), reader.u8(), reader.i32()) for _ in range(reader.u32())]
+            module.imports = [(reader.string(), [reader.string() for _ in range(reader.u32())])
+                              for _ in range(reader.u32())]
+            module.init = reader.i32()
+        except (struct.error, IndexError, UnicodeDecodeError) as exc:
+            raise ValueError(f"Invalid bytecode module: {exc}") from None
+        module._reindex()
+        return module
+
+    @classmethod
+    def load(cls, filename: str) -> "CodeModule":
+        """Loads a module artifact
+
+        :param filename: The artifact file
+        :return: The module
+        :raises OSError: if the file can't be read
+        :raises ValueError: if the file is not a valid module
+        """
+        with open(filename, 'rb') as file:
+            return cls.frombytes(file.read())
+
+    # endregion
+
+    # region SPECIAL
+
+    def __init__(self, filename: str = ''):
+        self.filename: str = filename
+        self.constants: List[Any] = []
+        self.names: List[str] = []
+        self.refs: List[Tuple[Any, ...]] = []
+        self.routines: List[Routine] = []
+        self.classes: List[ClassInfo] = []
+        self.enums: List[Tuple[str, List[Tuple[str, int]]]] = []
+        self.globals: List[Tuple[str, int, int]] = []
+        self.imports: List[Tuple[str, List[str]]] = []
+        self.init: int = -1
+        self._indices: Dict[Tuple[str, Any], int] = {}
+
+    def __str__(self) -> str:
+        return f"[ CodeModule {self.filename} | {len(self.routines)} routines, {len(self.classes)} classes ]"
+
+    # endregion
+
+    # region METHODS
+
+    def constant(self, value: Any) -> int:
+        """Adds a value to the constant pool, once
+
+        :param value: None, a boolean, an int, a float or a string
+        :return: Its index in the pool
+        """
+        # the type is part of the key, or True, 1 and 1.0 would be one constant
+        return self._index('constants', (type(value).__name__, value), value)
+
+    def name(self, name: str) -> int:
+        return self._index('names', name, name)
+
+    def ref(self, *items: Any) -> int:
+        return self._index('refs', items, items)
+
+    def _index(self, table: str, key: Any, value: Any) -> int:
+        index = self._indices.get((table, key))
+        if index is None:
+            values = getattr(self, table)
+            index = self._indices[(table, key)] = len(values)
+            values.append(value)
+        return index
+
+    def _reindex(self) -> None:
+        self._indices = {}
+        for table in ('constants', 'names', 'refs'):
+            for index, value in enumerate(getattr(self, table)):
+                key = (type(value).__name__, value) if table == 'constants' else value
+                self._indices.setdefault((table, key), index)
+
+    def lookup(self, name: str) -> List[Tuple[int, int]]:
+        """Finds the module level declarations of a name
+
+        :param name: The name
+        :return: The (kind, index) pairs, more than one for overloaded functions
+        """
+        return [(kind, index) for entry, kind, index in self.globals if entry == name]
+
+    def tobytes(self) -> bytes:
+        writer = _Writer()
+        writer.string(self.filename)
+        writer.u32(len(self.constants))
+        for value in self.constants:
+            writer.constant(value)
+        writer.u32(len(self.names))
+        for name in self.names:
+            writer.string(name)
+        writer.u32(len(self.refs))
+        for ref in self.refs:
+            writer.u8(len(ref))
+            for item in ref:
+                writer.constant(item)
+        writer.u32(len(self.routines))
+        for routine in self.routines:
+            writer.string(routine.name)
+            writer.u8(routine.kind)
+            writer.string(routine.owner)
+            writer.u32(routine.flags)
+            writer.u32(len(routine.parameters))
+            for bank, slot in routine.parameters:
+                writer.u8(bank)
+                writer.u32(slot)
+            for size in routine.frame:
+                writer.u32(size)
+            writer.block(routine.code.tobytes())
+            writer.u32(len(routine.lines))
+            for value in routine.lines:
+                writer.u32(value)
+        writer.u32(len(self.classes))
+        for info in self.classes:
+            writer.string(info.name)
+            writer.u32(len(info.bases))
+            for base in info.bases:
+                writer.string(base)
+            writer.u32(info.flags)
+            for fields in (info.fields, info.statics):
+                writer.u32(len(fields))
+                for name, bank in fields:
+                    writer.string(name)
+                    writer.u8(bank)
+            writer.u32(len(info.routines))
+            for index in info.routines:
+                writer.u32(index)
+            writer.u32(len(info.properties))
+            for name, getter, setter in info.properties:
+                writer.string(name)
+                writer.i32(getter)
+                writer.i32(setter)
+            writer.i32(info.initializer)
+        writer.u32(len(self.enums))
+        for name, members in self.enums:
+            writer.string(name)
+            writer.u32(len(members))
+            for member, index in members:
+                writer.string(member)
+                writer.u32(index)
+        writer.u32(len(self.globals))
+        for name, kind, index in self.globals:
+            writer.string(name)
+            writer.u8(kind)
+            writer.i32(index)
+        writer.u32(len(self.imports))
+        for path, names in self.imports:
+            writer.string(path)
+            writer.u32(len(names))
+            for name in names:
+                writer.string(name)
+        writer.i32(self.init)
+        return HEADER.pack(MAGIC, VERSION) + bytes(writer.data)
+
+    def save(self, filename: str) -> None:
+        """Writes the module artifact, through a temporary file so it is never left partial"""
+        os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
+        temp = f"{filename}.{os.getpid()}.tmp"
+        with open(temp, 'wb') as file:
+            file.write(self.tobytes())
+        os.replace(temp, filename)
+
+    def disassemble(self) -> str:
+        """Formats the routines of the module as text, one instruction per line"""
+        lines: List[str] = []
+        for number, routine in enumerate(self.routines):
+            owner = f"{routine.owner}." if routine.owner else ''
+            name = routine.name or _UNNAMED.get(routine.kind, '')
+            lines.append(f"routine {number} {owner}{name}/{routine.arity} "
+                         f"kind={routine.kind} frame={routine.frame} parameters={routine.parameters}")
+            for index, opname, argument in iter_instructions(routine.code):
+                lines.append(f"  {index:4} {opname:<20} {argument:<6} {self._describe(opname, argument)}")
+        return '\n'.join(lines)
+
+    def _describe(self, opname: str, argument: int) -> str:
+        if opname == 'LOAD_CONST':
+            return repr(self.constants[argument])
+        if opname in ('LOAD_GLOBAL', 'STORE_GLOBAL', 'GET_MEMBER', 'SET_MEMBER'):
+            return self.names[argument]
+        if opname in ('GET_STATIC', 'SET_STATIC', 'GET_SUPER', 'CALL_GLOBAL', 'CALL_METHOD', 'CALL_SUPER'):
+            return repr(self.refs[argument])
+        if opname == 'REPEAT_NEXT':
+            return f"slot {argument >> 16} -> {argument & 0xffff}"
+        if opname in ('JUMP', 'JUMP_IF_FALSE', 'JUMP_IF_TRUE', 'JUMP_IF_FALSE_OR_POP', 'JUMP_IF_TRUE_OR_POP'):
+            return f"-> {argument}"
+        return ''
+
+    # endregion (methods)
+
+
+class _Writer:
+
+    __slots__ = 'data',
+
+    def __init__(self):
+        self.data: bytearray = bytearray()
+
+    def u8(self, value: int) -> None:
+        self.data += _U8.pack(value)
+
+    def u32(self, value: int) -> None:
+        self.data += _U32.pack(value)
+
+    def i32(self, value: int) -> None:
+        self.data += _I32.pack(value)
+
+    def block(self, data: bytes) -> None:
+        self.u32(len(data))
+        self.data += data
+
+    def string(self, value: str) -> None:
+        self.block(value.encode('utf-8'))
+
+    def constant(self, value: Any) -> None:
+        if value is None:
+            self.u8(_NONE)
+        elif value is True or value is False:
+            self.u8(_TRUE if value else _FALSE)
+        elif isinstance(value, int):
+            if -1 << 63 <= value < 1 << 63:
+                self.u8(_INT)
+                self.data += _I64.pack(value)
+            else:
+                self.u8(_BIGINT)
+                self.string(str(value))
+        elif isinstance(value, float):
+            self.u8(_FLOAT)
+            self.data += _F64.pack(value)
+        elif isinstance(value, str):
+            self.u8(_STRING)
+            self.string(value)
+        else:
+            raise ValueError(f"Can't store a {type(value).__name__} constant")
+
+
+class _Reader:
+
+    __slots__ = 'view', 'offset'
+
+    def __init__(self, view: memoryview, offset: int = 0):
+        self.view: memoryview = view
+        self.offset: int = offset
+
+    def _unpack(self, layout: struct.Struct) -> Any:
+        value = layout.unpack_from(self.view, self.offset)[0]
+        self.offset += layout.size
+        return value
+
+    def u8(self) -> int:
+        return self._unpack(_U8)
+
+    def u32(self) -> int:
+        return self._unpack(_U32)
+
+    def i32(self) -> int:
+        return self._unpack(_I32)
+
+    def block(self) -> memoryview:
+        size = self.u32()
+        start = self.offset
+        if start + size > len(self.view):
+            raise IndexError("block past the end of the data")
+        self.offset += size
+        return self.view[start:start + size]
+
+    def string(self) -> str:
+        return str(self.block(), 'utf-8')
+
+    def constant(self) -> Any:
+        tag = self.u8()
+        if tag == _INT:
+            return self._unpack(_I64)
+        if tag == _STRING:
+            return self.string()
+        if tag == _FLOAT:
+            return self._unpack(_F64)
+        if tag == _BIGINT:
+            return int(self.string())
+        if tag in (_NONE, _FALSE, _TRUE):
+            return (None, False, True)[tag]
+        raise IndexError(f"unknown constant tag {tag}")
+
+
+# endregion (classes)
@@ -0,0 +1,193 @@
+# -*- encoding: utf8 -*-
+# ------------------------------------------------------------------------------
+# opcodes.py
+# Created on 18/10/2026
+#
+# The MIT License
+#
+#
+# Copyright 2022 Jorge A. Gomes
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# region IMPORTS
+
+from array import array
+
+from typing import List, Tuple, Iterator, Sequence
+
+# endregion (imports)
+# ---------------------------------------------------------
+# region EXPORTS
+
+
+__all__ = [
+    'OPNAMES',
+    'OPCODES',
+    'JUMPS',
+    'encode',
+    'decode',
+]
+
+
+# endregion (exports)
+# ---------------------------------------------------------
+# region CONSTANTS & ENUMS
+
+# Instructions are two bytes, an opcode and an argument byte, as in CPython's
+# wordcode; wider arguments are prefixed by EXTENDED_ARG instructions holding
+# their upper bytes. Jump targets are instruction indices, not byte offsets,
+# so EXTENDED_ARG prefixes never move them.
+
+NOP = 0
+EXTENDED_ARG = 1
+
+# stack
+POP = 2
+DUP = 3
+DUP_UNDER = 4           # a b -> b a b
+
+# constants and locals; locals live in one of the three banks of a frame
+LOAD_CONST = 5
+LOAD_INT = 6
+STORE_INT = 7
+LOAD_FLOAT = 8
+STORE_FLOAT = 9
+LOAD_OBJECT = 10
+STORE_OBJECT = 11
+INC_INT = 12
+DEC_INT = 13
+
+# module globals, by name index
+LOAD_GLOBAL = 14
+STORE_GLOBAL = 15
+
+# members, by name index or by reference index for (class, name) pairs
+GET_MEMBER = 16         # object -> value
+SET_MEMBER = 17         # object value ->
+GET_STATIC = 18
+SET_STATIC = 19         # value ->
+GET_SUPER = 20          # this -> value
+
+# calls, by reference index: (name, argc) or (class, name, argc)
+CALL_GLOBAL = 21
+CALL_METHOD = 22        # receiver args... -> result
+CALL_SUPER = 23         # this args... -> result
+RETURN = 24
+RETURN_NONE = 25
+
+# control flow
+JUMP = 26
+JUMP_IF_FALSE = 27
+JUMP_IF_TRUE = 28
+JUMP_IF_FALSE_OR_POP = 29
+JUMP_IF_TRUE_OR_POP = 30
+REPEAT_NEXT = 31        # argument: int slot << 16 | target; jumps when the count is spent, else decrements it
+
+# statements
+PRINT = 32
+ASSERT = 33
+
+# operators
+ADD = 34
+SUB = 35
+MUL = 36
+DIV = 37
+MOD = 38
+BIT_AND = 39
+BIT_OR = 40
+BIT_XOR = 41
+SHL = 42
+SHR = 43
+EQ = 44
+NE = 45
+LT = 46
+GT = 47
+LE = 48
+GE = 49
+NEG = 50
+POS = 51
+NOT = 52
+INVERT = 53
+
+OPNAMES: Tuple[str, ...] = (
+    'NOP', 'EXTENDED_ARG', 'POP', 'DUP', 'DUP_UNDER', 'LOAD_CONST', 'LOAD_INT', 'STORE_INT', 'LOAD_FLOAT',
+    'STORE_FLOAT', 'LOAD_OBJECT', 'STORE_OBJECT', 'INC_INT', 'DEC_INT', 'LOAD_GLOBAL', 'STORE_GLOBAL', 'GET_MEMBER',
+    'SET_MEMBER', 'GET_STATIC', 'SET_STATIC', 'GET_SUPER', 'CALL_GLOBAL', 'CALL_METHOD', 'CALL_SUPER', 'RETURN',
+    'RETURN_NONE', 'JUMP', 'JUMP_IF_FALSE', 'JUMP_IF_TRUE', 'JUMP_IF_FALSE_OR_POP', 'JUMP_IF_TRUE_OR_POP',
+    'REPEAT_NEXT', 'PRINT', 'ASSERT', 'ADD', 'SUB', 'MUL', 'DIV', 'MOD', 'BIT_AND', 'BIT_OR', 'BIT_XOR', 'SHL',
+    'SHR', 'EQ', 'NE', 'LT', 'GT', 'LE', 'GE', 'NEG', 'POS', 'NOT', 'INVERT',
+)
+OPCODES = {name: code for code, name in enumerate(OPNAMES)}
+
+JUMPS = frozenset((JUMP, JUMP_IF_FALSE, JUMP_IF_TRUE, JUMP_IF_FALSE_OR_POP, JUMP_IF_TRUE_OR_POP))
+
+# endregion (constants)
+# ---------------------------------------------------------
+# region FUNCTIONS
+
+
+def encode(instructions: Sequence[Tuple[int, int]]) -> array:
+    """Encodes instructions as wordcode
+
+    :param instructions: (opcode, argument) pairs; arguments are non-negative
+    :return: The bytes, two per instruction plus EXTENDED_ARG prefixes
+    """
+    code = array('B')
+    for opcode, argument in instructions:
+        if argument > 0xff:
+            shift = (argument.bit_length() - 1) // 8 * 8
+            while shift:
+                code.append(EXTENDED_ARG)
+                code.append(argument >> shift & 0xff)
+                shift -= 8
+        code.append(opcode)
+        code.append(argument & 0xff)
+    return code
+
+
+def decode(code: Sequence[int]) -> List[Tuple[int, int]]:
+    """Decodes wordcode, folding EXTENDED_ARG prefixes into the arguments
+
+    :param code: The bytes
+    :return: The (opcode, argument) pairs, indexed as jump targets are
+    """
+    instructions: List[Tuple[int, int]] = []
+    extended = 0
+    for index in range(0, len(code), 2):
+        opcode = code[index]
+        if opcode == EXTENDED_ARG:
+            extended = (extended | code[index + 1]) << 8
+            continue
+        instructions.append((opcode, extended | code[index + 1]))
+        extended = 0
+    return instructions
+
+
+def iter_instructions(code: Sequence[int]) -> Iterator[Tuple[int, str, int]]:
+    """Iterates over the decoded instructions, for disassembly
+
+    :param code: The bytes
+    :return: (index, opcode name, argument) triples
+    """
+    for index, (opcode, argument) in enumerate(decode(code)):
+        yield index, OPNAMES[opcode], argument
+
+# endregion (functions)
@@ -0,0 +1,312 @@
+# -*- encoding: utf8 -*-
+# ------------------------------------------------------------------------------
+# pyrun.py
+# Created on 18/10/2026
+#
+# The MIT License
+#
+#
+# Copyright 2022 Jorge A. Gomes
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# region IMPORTS
+
+import os
+import sys
+import math
+import traceback
+
+from minilang.utillities.error import MinilangError, ExecutionError
+from minilang.building.targets import PythonTarget, build_program, run_command
+from minilang.translating.bytecode import GK_FUNCTION, INT_MIN, INT_MAX
+from minilang.translating.pysource import PythonModule, identifier, overload
+from minilang.translating.vm import MIN_RECURSION_LIMIT, text_of
+from typing import Optional, Any, Callable, Iterable, Sequence, List, Dict, Tuple, TextIO
+
+# endregion (imports)
+# ---------------------------------------------------------
+# region EXPORTS
+
+
+__all__ = [
+    'run_modules',
+    'run_project',
+]
+
+
+# endregion (exports)
+# ---------------------------------------------------------
+# region CONSTANTS & ENUMS
+
+_NUMBERS = frozenset((int, float, bool))
+_INTEGERS = frozenset((int, bool))
+
+# endregion (constants)
+# ---------------------------------------------------------
+# region CLASSES
+
+
+class _Object:
+    """The base of translated classes without a base class"""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} instance>"
+
+    def new__0(self) -> "_Object":
+        # classes without constructors are constructed by their field initializers alone
+        return self
+
+
+class _Failure(Exception):
+    """What a failed assertion raises in translated code"""
+
+
+# endregion (classes)
+# ---------------------------------------------------------
+# region FUNCTIONS
+
+# The runtime helpers translated code calls where the types of the operands
+# are not known to be numbers; they do what the VM operator handlers do.
+
+
+def _add(left: Any, right: Any) -> Any:
+    try:
+        return left + right
+    except TypeError:
+        if type(left) is str or type(right) is str:
+            return text_of(left) + text_of(right)
+        raise
+
+
+def _idiv(left: int, right: int) -> int:
+    # integer division truncates toward zero
+    quotient = abs(left) // abs(right)
+    return -quotient if (left < 0) != (right < 0) else quotient
+
+
+def _imod(left: int, right: int) -> int:
+    # the remainder has the sign of the dividend, as the quotient truncates
+    remainder = abs(left) % abs(right)
+    return -remainder if left < 0 else remainder
+
+
+def _div(left: Any, right: Any) -> Any:
+    if type(left) in _INTEGERS and type(right) in _INTEGERS:
+        return _idiv(left, right)
+    return left / right
+
+
+def _mod(left: Any, right: Any) -> Any:
+    if type(left) in _INTEGERS and type(right) in _INTEGERS:
+        return _imod(left, right)
+    if type(left) in _NUMBERS and type(right) in _NUMBERS:
+        return math.fmod(left, right)
+    return left % right
+
+
+def _int(value: Any) -> int:
+    # a value stored in an int local, as the VM int banks store it: a 64-bit integer
+    if type(value) is int:
+        if INT_MIN <= value <= INT_MAX:
+            return value
+        raise OverflowError(value)
+    if isinstance(value, (bool, float)):
+        return _int(int(value))
+    raise ExecutionError(f"Can't store {text_of(value)} in an int variable")
+
+
+def _set(target: Any, name: str, value: Any) -> Any:
+    # an assignment to a member used as a value
+    setattr(target, name, value)
+    return value
+
+
+def _post(target: Any, name: str, increment: bool) -> Any:
+    # a postfix increment or decrement of a member used as a value
+    value = getattr(target, name)
+    setattr(target, name, value + 1 if increment else value - 1)
+    return value
+
+
+def _invoke(namespace: Dict[str, Any], name: str, *arguments: Any) -> Any:
+    # a call of an imported name whose module was not known when translated
+    function = namespace.get(overload(name, len(arguments)))
+    if function is not None:
+        return function(*arguments)
+    cls = namespace.get(identifier(name))
+    if isinstance(cls, type):
+        instance = cls()
+        return instance.new__0() if not arguments else getattr(instance, f"new__{len(arguments)}")(*arguments)
+    raise ExecutionError(f"Undefined function {name} taking {len(arguments)} arguments")
+
+
+def _fail(message: str) -> None:
+    raise _Failure(message)
+
+
+def _helpers(output: Optional[TextIO]) -> Dict[str, Any]:
+    """Gets the names translated code expects to find in its module namespace"""
+    def _print(*values: Any) -> None:
+        print(*(text_of(value) for value in values), file=output or sys.stdout)
+
+    return {
+        '_Object': _Object, '_NUMBERS': _NUMBERS, '_add': _add, '_idiv': _idiv, '_imod': _imod, '_div': _div,
+        '_mod': _mod, '_int': _int, '_set': _set, '_post': _post, '_invoke': _invoke, '_fail': _fail,
+        '_print': _print,
+    }
+
+
+def _find(loaded: List[Tuple[PythonModule, Dict[str, Any]]], path: str
+          ) -> Optional[Tuple[PythonModule, Dict[str, Any]]]:
+    path = path.replace(os.sep, '/')
+    for module, namespace in reversed(loaded):
+        key = os.path.splitext(module.filename)[0]
+        if key == path or key.endswith('/' + path):
+            return module, namespace
+    return None
+
+
+def _bind(module: PythonModule, namespace: Dict[str, Any], loaded: List[Tuple[PythonModule, Dict[str, Any]]]
+          ) -> None:
+    """Adds the names a module imports to its namespace, from the modules loaded before it"""
+    for path, names in module.info['imports']:
+        found = _find(loaded, path)
+        if found is None:
+            continue
+        imported, values = found
+        for name in names:
+            kind = imported.kind(name)
+            if kind == GK_FUNCTION:
+                for count in imported.info['functions'].get(name, ()):
+                    namespace[overload(name, count)] = values[overload(name, count)]
+            elif kind is not None:
+                namespace[identifier(name)] = values[identifier(name)]
+
+
+def _describe(exc: Exception) -> str:
+    if isinstance(exc, ZeroDivisionError):
+        return "Division by zero"
+    if isinstance(exc, RecursionError):
+        return "Stack overflow"
+    if isinstance(exc, OverflowError):
+        return "Integer overflow"
+    if isinstance(exc, (_Failure, ExecutionError)):
+        return str(exc.args[0]) if exc.args else type(exc).__name__
+    # missing names and members are told as the VM tells them, by their minilang names
+    name = getattr(exc, 'name', None)
+    if isinstance(exc, (NameError, AttributeError)) and name:
+        function, _, count = name.rpartition('__')
+        if isinstance(exc, NameError):
+            return f"Undefined function {function} taking {count} arguments" if count.isdigit() and function \
+                else f"Undefined name {name}"
+        target = text_of(getattr(exc, 'obj', None))
+        return f"{target} has no method {function} taking {count} arguments" if count.isdigit() and function \
+            else f"{target} has no member {name}"
+    return f"{type(exc).__name__}: {exc}"
+
+
+def _trace(exc: Exception, modules: Iterable[PythonModule]) -> List[str]:
+    """Lists the translated functions being run when an exception was raised, innermost first"""
+    paths = {module.path or f"<minilang {module.filename}>": module for module in modules}
+    trace: List[str] = []
+    for frame in reversed(traceback.extract_tb(exc.__traceback__)):
+        module = paths.get(frame.filename)
+        if module is not None:
+            name, _, count = frame.name.rpartition('__')
+            trace.append(f"{module.filename}:{module.line_of(frame.lineno)} in "
+                         f"{name if name and count.isdigit() else frame.name}")
+    return trace
+
+
+def run_modules(modules: Sequence[PythonModule], entry: str = 'main', arguments: Iterable[Any] = (),
+                output: Optional[TextIO] = None) -> Tuple[Any, Optional[MinilangError]]:
+    """Runs translated modules, in order, and calls a function of the last one
+
+    Each module runs in a namespace of its own, holding the runtime helpers and
+    what it imports from the modules before it.
+
+    :param modules: The modules, dependencies first
+    :param entry: The function name
+    :param arguments: Its arguments
+    :param output: Where `print` writes; standard output by default
+    :return: What the function returned and None, or None and the error that stopped the program
+    """
+    if not modules:
+        return None, ExecutionError("No modules to run")
+    arguments = list(arguments)
+    helpers = _helpers(output)
+    loaded: List[Tuple[PythonModule, Dict[str, Any]]] = []
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limit, MIN_RECURSION_LIMIT))
+    try:
+        for module in modules:
+            namespace: Dict[str, Any] = dict(helpers, __name__=f"minilang:{module.filename}")
+            _bind(module, namespace, loaded)
+            exec(module.compile(), namespace)
+            loaded.append((module, namespace))
+        function: Optional[Callable] = loaded[-1][1].get(overload(entry, len(arguments)))
+        if function is None:
+            return None, ExecutionError(f"No function {entry} taking {len(arguments)} arguments")
+        return function(*arguments), None
+    except SyntaxError as exc:
+        return None, ExecutionError(f"Invalid translation of {exc.filename}: {exc.msg}")
+    except (_Failure, ExecutionError, RecursionError, TypeError, ValueError, OverflowError, ZeroDivisionError,
+            AttributeError, KeyError, IndexError, NameError) as exc:
+        error = ExecutionError(_describe(exc))
+        # as in the VM, a stack overflow is not traced
+        error.trace = _trace(exc, modules) if not isinstance(exc, RecursionError) else []
+        return None, error
+    finally:
+        sys.setrecursionlimit(limit)
+
+
+def run_project(path: str, preset: str = 'default', entry: str = 'main', output: Optional[TextIO] = None
+                ) -> Tuple[Any, Optional[MinilangError]]:
+    """Builds a project to Python and runs its main module
+
+    :param path: The project directory or configuration file
+    :param preset: The build preset
+    :param entry: The function of the main module to call
+    :param output: Where `print` writes; standard output by default
+    :return: What the function returned and None, or None and the first error
+    """
+    modules, error = build_program(path, PythonTarget, preset)
+    if error:
+        return None, error
+    # the entry point is looked up in the last module
+    return run_modules(modules, entry, output=output)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    return run_command(sys.argv[1:] if argv is None else argv, PythonTarget, run_modules)
+
+
+# endregion (functions)
+# ---------------------------------------------------------
+# region ENTRYPOINT
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+# endregion (entrypoint)
@@ -0,0 +1,1084 @@
+# -*- encoding: utf8 -*-
+# ------------------------------------------------------------------------------
+# pysource.py
+# Created on 18/10/2026
+#
+# The MIT License
+#
+#
+# Copyright 2022 Jorge A. Gomes
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# region IMPORTS
+
+import os
+import sys
+import json
+import keyword
+import builtins
+import marshal
+import importlib.util
+
+from types import CodeType
+
+from minilang.utillities.jsom import JSOM
+from minilang.utillities.code import Source
+from minilang.utillities.error import MinilangError
+from minilang.lexing.core import Lexer
+from minilang.lexing.tokens import KW_THIS, KW_SUPER, KW_BASE
+from minilang.parsing.nodes import OPERATORS, QF_STATIC, Node, Module, Class, Interface, Enum, Block, Import, \
+    Constant, Variable, Property, Routine as RoutineNode, Function, Method, Operator, If, While, DoWhile, Repeat, \
+    Return, Print, Assert, Break, Continue, Evaluate, Literal, Name, Member, Call, Unary, Postfix, Binary, Assign
+from minilang.parsing.parser import Parser
+from minilang.translating.bytecode import BANK_OBJECT, GK_FUNCTION, GK_CLASS, GK_ENUM, GK_INTERFACE, INT_MIN, INT_MAX
+from minilang.translating.translator import BANK_DEFAULTS, INCREMENTS, MK_FIELD, MK_STATIC, MK_METHOD, \
+    MK_STATIC_METHOD, ClassSymbols, Translator, bank_of, default_of
+from typing import Optional, Any, List, Dict, Set, Tuple
+
+# endregion (imports)
+# ---------------------------------------------------------
+# region EXPORTS
+
+
+__all__ = [
+    'PythonModule',
+    'PythonTranslator',
+    'identifier',
+    'attribute',
+    'overload',
+]
+
+
+# endregion (exports)
+# ---------------------------------------------------------
+# region CONSTANTS & ENUMS
+
+LEXCONF = os.path.join(os.path.dirname(__file__), '../lexing/lexconf.json')
+
+# the first line of a translated module: this, then what importers need to know of it as JSON
+HEADER = '# minilang '
+
+# hash-based .pyc files, checked against the source (PEP 552)
+PYC_FLAGS = 0b11
+
+# the Python type of the values of each primitive type, where operators can be Python's own
+KINDS: Dict[str, str] = {
+    'i8': 'int', 'i16': 'int', 'i32': 'int', 'i64': 'int',
+    'u8': 'int', 'u16': 'int', 'u32': 'int', 'u64': 'int',
+    'f32': 'float', 'f64': 'float', 'boolean': 'bool', 'string': 'str',
+}
+NUMERIC = frozenset(('int', 'float', 'bool'))
+INTEGRAL = frozenset(('int', 'bool'))
+
+COMPARISONS = frozenset(('==', '!=', '<', '>', '<=', '>='))
+LOGICAL: Dict[str, str] = {'and': 'and', '&&': 'and', 'or': 'or', '||': 'or'}
+
+# the special methods operator methods back, and their reflected forms
+DUNDERS: Dict[str, Tuple[str, Optional[str]]] = {
+    '+': ('__add__', '__radd__'), '-': ('__sub__', '__rsub__'), '*': ('__mul__', '__rmul__'),
+    '/': ('__truediv__', '__rtruediv__'), '%': ('__mod__', '__rmod__'), '&': ('__and__', '__rand__'),
+    '|': ('__or__', '__ror__'), '^': ('__xor__', '__rxor__'), '<<': ('__lshift__', '__rlshift__'),
+    '>>': ('__rshift__', '__rrshift__'), '==': ('__eq__', None), '!=': ('__ne__', None), '<': ('__lt__', None),
+    '>': ('__gt__', None), '<=': ('__le__', None), '>=': ('__ge__', None),
+}
+UNARY_DUNDERS: Dict[str, str] = {'-': '__neg__', '+': '__pos__', '~': '__invert__'}
+OPERATOR_NAMES: Dict[str, str] = {
+    '+': 'add', '-': 'sub', '*': 'mul', '/': 'div', '%': 'mod', '&': 'and', '|': 'or', '^': 'xor', '<<': 'shl',
+    '>>': 'shr', '==': 'eq', '!=': 'ne', '<': 'lt', '>': 'gt', '<=': 'le', '>=': 'ge', '!': 'not', '~': 'invert',
+}
+
+# names minilang code can't take from Python: keywords, builtins, and the instance parameter
+RESERVED = frozenset(keyword.kwlist) | frozenset(dir(builtins)) | {'self'}
+
+INDENT = '    '
+
+# the forms of assignment targets, as told by `PythonTranslator._target`
+TF_NAME = 1
+TF_ATTRIBUTE = 2
+TF_LOCAL = 3
+
+# endregion (constants)
+# ---------------------------------------------------------
+# region CLASSES
+
+
+class PythonModule:
+    """A module translated to Python source
+
+    The first line of the source is a comment with what importers need to know
+    of the module as JSON: its file, imports, declarations and the minilang
+    line of each line of code. So the ``.py`` file is the whole artifact; the
+    ``.pyc`` file next to it only spares compiling it again.
+    """
+
+    __slots__ = 'info', 'body', 'path', '_code'
+
+    def __init__(self, info: Dict[str, Any], body: str, path: Optional[str] = None):
+        self.info: Dict[str, Any] = info
+        self.body: str = body
+        # the saved source, which compiled code refers to
+        self.path: Optional[str] = path
+        self._code: Optional[CodeType] = None
+
+    def __str__(self) -> str:
+        return f"[ PythonModule {self.filename} ]"
+
+    # region PROPERTIES
+
+    @property
+    def filename(self) -> str:
+        return self.info.get('filename', '')
+
+    @filename.setter
+    def filename(self, value: str) -> None:
+        self.info['filename'] = value
+
+    @property
+    def source(self) -> str:
+        return f"{HEADER}{json.dumps(self.info, separators=(',', ':'))}\n{self.body}"
+
+    # endregion
+
+    # region METHODS
+
+    def kind(self, name: str) -> Optional[int]:
+        """Gets the kind of a module level name: GK_FUNCTION, GK_CLASS..., or None if it isn't declared"""
+        return self.info['globals'].get(name)
+
+    def class_symbols(self, name: str) -> ClassSymbols:
+        info = self.info['classes'][name]
+        return ClassSymbols(list(info['bases']), dict(info['members']), set(info['constructors']))
+
+    def line_of(self, line: int) -> int:
+        """Gets the minilang line of a line of the source, or 0"""
+        lines = self.info['lines']
+        # the header is line 1
+        return lines[line - 2] if 2 <= line < len(lines) + 2 else 0
+
+    def compile(self) -> CodeType:
+        """Compiles the source, or loads it from the .pyc file next to the saved source if that is current
+
+        A .pyc file is written for the saved source on the first compile.
+
+        :return: The code object of the module
+        """
+        if self._code is not None:
+            return self._code
+        source = self.source.encode('utf-8')
+        code = self._cached(source) if self.path is not None else None
+        if code is None:
+            code = compile(source, self.path or f"<minilang {self.filename}>", 'exec', dont_inherit=True)
+            if self.path is not None:
+                self._cache(code, source)
+        self._code = code
+        return code
+
+    def _cached(self, source: bytes) -> Optional[CodeType]:
+        try:
+            with open(self.path + 'c', 'rb') as file:
+                data = file.read()
+        except OSError:
+            return None
+        if data[:4] != importlib.util.MAGIC_NUMBER or int.from_bytes(data[4:8], 'little') != PYC_FLAGS \
+                or data[8:16] != importlib.util.source_hash(source):
+            return None
+        try:
+            code = marshal.loads(data[16:])
+        except (EOFError, ValueError, TypeError):
+            return None
+        return code if isinstance(code, CodeType) else None
+
+    def _cache(self, code: CodeType, source: bytes) -> None:
+        filename = self.path + 'c'
+        temp = f"{filename}.{os.getpid()}.tmp"
+        try:
+            with open(temp, 'wb') as file:
+                file.write(importlib.util.MAGIC_NUMBER + PYC_FLAGS.to_bytes(4, 'little'))
+                file.write(importlib.util.source_hash(source) + marshal.dumps(code))
+            os.replace(temp, filename)
+        except OSError:
+            # a missing cache only costs a compile
+            pass
+
+    def save(self, filename: str) -> None:
+        """Writes the source, through a temporary file so it is never left partial"""
+        os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
+        temp = f"{filename}.{os.getpid()}.tmp"
+        with open(temp, 'w', encoding='utf-8', newline='\n') as file:
+            file.write(self.source)
+        os.replace(temp, filename)
+        if self.path != filename:
+            self.path = filename
+            self._code = None
+
+    @classmethod
+    def load(cls, filename: str) -> "PythonModule":
+        """Reads a saved module
+
+        :raise ValueError: If the file is not a translated module
+        """
+        with open(filename, 'r', encoding='utf-8', newline='\n') as file:
+            header = file.readline()
+            body = file.read()
+        if not header.startswith(HEADER):
+            raise ValueError(f"{filename} is not a translated minilang module")
+        info = json.loads(header[len(HEADER):])
+        if not isinstance(info, dict) or not {'globals', 'classes', 'lines'} <= info.keys():
+            raise ValueError(f"{filename} has no module information")
+        return cls(info, body, filename)
+
+    # endregion (methods)
+
+
+class _Body:
+    """The locals of the Python function being written
+
+    Python functions have a single scope, so a local declared in a block
+    where another of the same name is visible gets a Python name of its own.
+    """
+
+    __slots__ = 'scopes', 'this', 'constructor', 'function', 'globals', 'loops', 'hidden'
+
+    def __init__(self, this: bool, constructor: bool = False, function: bool = True):
+        self.scopes: List[Dict[str, Tuple[str, Optional[str]]]] = [{}]
+        self.this: bool = this
+        self.constructor: bool = constructor
+        # module initialization code is not in a function, so it needs no 'global' statements
+        self.function: bool = function
+        self.globals: Set[str] = set()
+        self.loops: int = 0
+        self.hidden: int = 0
+
+    def declare(self, name: str, kind: Optional[str]) -> str:
+        python = identifier(name)
+        visible = {local for scope in self.scopes for local, _ in scope.values()}
+        if python in visible:
+            count = 1
+            while f"{python}_{count}" in visible:
+                count += 1
+            python = f"{python}_{count}"
+        self.scopes[-1][name] = (python, kind)
+        return python
+
+    def lookup(self, name: str) -> Optional[Tuple[str, Optional[str]]]:
+        for scope in reversed(self.scopes):
+            found = scope.get(name)
+            if found is not None:
+                return found
+        return None
+
+    def temporary(self) -> str:
+        # names with a leading underscore are never taken by minilang names
+        self.hidden += 1
+        return f"_t{self.hidden}"
+
+
+class PythonTranslator(Translator):
+    """Translates the syntax tree of a module to Python source
+
+    Names resolve as they do for bytecode. Classes become Python classes with
+    ``__slots__``; overloads by argument count become functions and methods
+    named ``<name>__<count>``, and constructors ``new__<count>`` methods that
+    return the instance. Operator methods back Python's special methods.
+    Operators are Python's own where the types of the operands are known to be
+    numbers, and calls to the runtime helpers of ``pyrun`` otherwise, so
+    strings concatenate and integers divide as they do in minilang.
+    """
+
+    __slots__ = '_out', '_lines', '_indent', '_line_number', '_body', '_kinds', '_imported'
+
+    def __init__(self, module: Module, imports: Optional[Dict[str, Optional[PythonModule]]] = None):
+        super().__init__(module)
+        self._imports: Dict[str, Optional[PythonModule]] = imports or {}
+        self._out: List[str] = []
+        # the minilang line of each line of `_out`
+        self._lines: List[int] = []
+        self._indent: int = 0
+        self._line_number: int = 0
+        self._body: _Body = _Body(False, function=False)
+        # the Python types of module constants, where known
+        self._kinds: Dict[str, Optional[str]] = {}
+        self._imported: List[List[Any]] = []
+
+    # region METHODS
+
+    def translate(self) -> Tuple[Optional[PythonModule], Optional[MinilangError]]:
+        """Translates the module
+
+        :return: The translated module and None, or None and the first error found
+        """
+        try:
+            self._declare()
+            self._translate()
+        except MinilangError as error:
+            return None, error
+        return PythonModule(self._info(), '\n'.join(self._out) + '\n'), None
+
+    def _info(self) -> Dict[str, Any]:
+        members = self._module.members
+        functions: Dict[str, List[int]] = {}
+        for node in members:
+            if isinstance(node, Function):
+                functions.setdefault(self._value_of(node), []).append(len(node.parameters))
+        local = {self._value_of(node) for node in members if not isinstance(node, Import)}
+        return {
+            'filename': self._code.filename,
+            'imports': self._imported,
+            'globals': {name: kind for name, kind in self._globals.items() if name in local},
+            'functions': functions,
+            'classes': {name: {'bases': symbols.bases, 'members': symbols.members,
+                               'constructors': sorted(symbols.constructors)}
+                        for name, symbols in self._classes.items() if name in local},
+            'enums': {name: values for name, values in self._enums.items() if name in local},
+            'lines': self._lines,
+        }
+
+    def _emit(self, text: str) -> None:
+        self._out.append(INDENT * self._indent + text)
+        self._lines.append(self._line_number)
+
+    def _line(self, node: Node) -> None:
+        tokens = self._module.tokens
+        if 0 <= node.token < len(tokens):
+            self._line_number = tokens[node.token].location.line
+
+    # endregion
+
+    # region DECLARATIONS
+
+    def _import(self, node: Import) -> None:
+        path = self._string(node.path)
+        names = [self._value_of(name) for name in node.names]
+        self._imported.append([path, names])
+        imported = self._imports.get(path)
+        for name in names:
+            kind = imported.kind(name) if imported is not None else None
+            self._globals[name] = kind
+            if kind == GK_CLASS:
+                self._classes[name] = imported.class_symbols(name)
+            elif kind == GK_ENUM:
+                self._enums[name] = dict(imported.info['enums'][name])
+
+    def _static(self, owner: str, name: str) -> str:
+        """Gets the class that declares a static member, which holds its value, as Python"""
+        seen: Set[str] = set()
+        pending = [owner]
+        while pending:
+            current = pending.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            symbols = self._classes.get(current)
+            if symbols is None:
+                continue
+            if symbols.members.get(name) == MK_STATIC:
+                return identifier(current)
+            pending.extend(reversed(symbols.bases))
+        return identifier(owner)
+
+    def _class_order(self) -> List[Class]:
+        # Python classes need their bases defined first
+        classes = {self._value_of(node): node for node in self._module.members if isinstance(node, Class)}
+        ordered: List[Class] = []
+        seen: Set[str] = set()
+        for name in classes:
+            pending = [(name, False)]
+            while pending:
+                current, done = pending.pop()
+                if done:
+                    ordered.append(classes[current])
+                    continue
+                if current in seen or current not in classes:
+                    continue
+                seen.add(current)
+                pending.append((current, True))
+                pending.extend((self._value_of(base), False) for base in reversed(classes[current].bases))
+        return ordered
+
+    # endregion
+
+    # region ROUTINES
+
+    def _translate(self) -> None:
+        members = self._module.members
+        for node in members:
+            if isinstance(node, Constant):
+                self._kinds[self._value_of(node)] = KINDS.get(self._type_of(node.type))
+        for node in members:
+            if isinstance(node, Interface):
+                self._line(node)
+                self._emit(f"class {identifier(self._value_of(node))}:")
+                self._emit(f"{INDENT}__slots__ = ()")
+            elif isinstance(node, Enum):
+                self._line(node)
+                self._emit(f"class {identifier(self._value_of(node))}:")
+                self._emit(f"{INDENT}__slots__ = ()")
+                for member, value in self._enums[self._value_of(node)].items():
+                    self._emit(f"{INDENT}{attribute(member)} = {value!r}")
+        for node in self._class_order():
+            self._class_definition(node)
+        for node in members:
+            if isinstance(node, Function):
+                self._routine(node, overload(self._value_of(node), len(node.parameters)))
+        # module initialization: constants and static members, in order
+        self._body = _Body(False, function=False)
+        for node in members:
+            if isinstance(node, Constant):
+                self._line(node)
+                self._emit(f"{identifier(self._value_of(node))} = {self._initial(node)[0]}")
+            elif isinstance(node, Class):
+                self._class = self._value_of(node)
+                for member in node.members:
+                    if isinstance(member, Constant) and member.flags & QF_STATIC and member.value is not None:
+                        self._line(member)
+                        self._emit(f"{identifier(self._class)}.{attribute(self._value_of(member))} = "
+                                   f"{self._value(member.value)[0]}")
+                self._class = None
+
+    def _routine(self, node: RoutineNode, name: str, this: bool = False, constructor: bool = False,
+                 value_type: Optional[Node] = None) -> None:
+        """Writes a function, method, operator or accessor
+
+        :param this: Whether it is a member of a class
+        :param constructor: Whether it is a constructor, which returns the instance
+        :param value_type: The property type, for setters
+        """
+        static = getattr(node, 'flags', 0) & QF_STATIC
+        body = self._body = _Body(this and not static, constructor)
+        parameters = ['self'] if body.this else []
+        if value_type is not None:
+            parameters.append(body.declare('value', KINDS.get(self._type_of(value_type))))
+        for parameter in getattr(node, 'parameters', ()):
+            parameters.append(body.declare(self._value_of(parameter), KINDS.get(self._type_of(parameter.type))))
+        self._line(node)
+        if this and static:
+            self._emit('@staticmethod')
+        self._emit(f"def {name}({', '.join(parameters)}):")
+        start = len(self._out)
+        self._indent += 1
+        # the VM stores arguments in its frame banks, so int parameters are checked as int locals are
+        for python, kind in body.scopes[0].values():
+            self._check(python, None, None, kind)
+        if node.body is not None:
+            for statement in node.body.members:
+                self._statement(statement)
+        if constructor:
+            self._emit('return self')
+        elif len(self._out) == start:
+            self._emit('pass')
+        if body.globals:
+            self._out.insert(start, INDENT * self._indent + f"global {', '.join(sorted(body.globals))}")
+            self._lines.insert(start, self._lines[start])
+        self._indent -= 1
+
+    def _class_definition(self, node: Class) -> None:
+        name = self._value_of(node)
+        self._class = name
+        self._line(node)
+        bases: List[str] = []
+        base: Optional[str] = None
+        for base_node in node.bases:
+            base_name = self._value_of(base_node)
+            kind = self._globals.get(base_name, -1)
+            if kind == -1:
+                raise self._fail(f"Undefined base class '{base_name}'", base_node)
+            if kind == GK_INTERFACE:
+                bases.append(identifier(base_name))
+            elif base is None and kind in (GK_CLASS, None):
+                # as in the VM, the first class is the base class
+                base = base_name
+                bases.insert(0, identifier(base_name))
+        if base is None:
+            bases.insert(0, '_Object')
+        self._emit(f"class {identifier(name)}({', '.join(bases)}):")
+        self._indent += 1
+
+        fields: List[Node] = []
+        statics: List[Constant] = []
+        for member in node.members:
+            if isinstance(member, Constant):
+                (statics if member.flags & QF_STATIC else fields).append(member)
+            elif isinstance(member, Property) and (member.getter is None or member.getter.body is None) \
+                    and (member.setter is None or member.setter.body is None):
+                # an automatic property is a plain field
+                fields.append(member)
+        self._emit(f"__slots__ = {tuple(attribute(self._value_of(field)) for field in fields)!r}")
+        for member in statics:
+            self._line(member)
+            self._emit(f"{attribute(self._value_of(member))} = {default_of(self._type_of(member.type))!r}")
+
+        if fields or base is not None:
+            self._body = _Body(True)
+            self._line(node)
+            self._emit('def __init__(self):')
+            self._indent += 1
+            if base is not None:
+                self._emit(f"{identifier(base)}.__init__(self)")
+            for member in fields:
+                self._line(member)
+                if isinstance(member, Constant):
+                    value = self._initial(member)[0]
+                else:
+                    value = repr(BANK_DEFAULTS[bank_of(self._type_of(member.type))])
+                self._emit(f"self.{attribute(self._value_of(member))} = {value}")
+            if not fields and base is None:
+                self._emit('pass')
+            self._indent -= 1
+
+        # symbol -> argument count -> (method, whether its parameter only holds numbers)
+        operators: Dict[str, Dict[int, Tuple[str, bool]]] = {}
+        for member in node.members:
+            member_name = self._value_of(member)
+            if isinstance(member, Property):
+                getter, setter = member.getter, member.setter
+                if (getter is None or getter.body is None) and (setter is None or setter.body is None):
+                    continue
+                accessors = ['None', 'None']
+                if getter is not None and getter.body is not None:
+                    accessors[0] = f"get__{attribute(member_name)}"
+                    self._routine(getter, accessors[0], True)
+                if setter is not None and setter.body is not None:
+                    accessors[1] = f"set__{attribute(member_name)}"
+                    self._routine(setter, accessors[1], True, value_type=member.type)
+                self._emit(f"{attribute(member_name)} = property({', '.join(accessors)})")
+            elif isinstance(member, Operator):
+                symbol = OPERATORS[member.operator]
+                count = len(member.parameters)
+                method = f"op_{OPERATOR_NAMES.get(symbol, 'operator')}__{count}"
+                numeric = bool(member.parameters) and bank_of(self._type_of(member.parameters[0].type)) != BANK_OBJECT
+                operators.setdefault(symbol, {})[count] = (method, numeric)
+                self._routine(member, method, True)
+            elif isinstance(member, Method):
+                if member_name == name and member.result is None:
+                    self._routine(member, f"new__{len(member.parameters)}", True, True)
+                else:
+                    self._routine(member, overload(member_name, len(member.parameters)), True)
+        for symbol, overloads in operators.items():
+            self._special_methods(symbol, overloads)
+
+        self._indent -= 1
+        self._class = None
+
+    def _special_methods(self, symbol: str, overloads: Dict[int, Tuple[str, bool]]) -> None:
+        """Writes the special methods that call the operator methods of a symbol
+
+        As in the VM, a binary operator method with a second parameter is
+        called with False, or with True when the instance is the right operand,
+        and overloads whose parameter can't hold the operand are skipped.
+        """
+        if 0 in overloads and symbol in UNARY_DUNDERS:
+            self._emit(f"def {UNARY_DUNDERS[symbol]}(self):")
+            self._emit(f"{INDENT}return self.{overloads[0][0]}()")
+        dunder, reflected = DUNDERS.get(symbol, (None, None))
+        if dunder is None or not (1 in overloads or 2 in overloads):
+            return
+        for name, calls in ((dunder, ((2, 'other, False'), (1, 'other'))), (reflected, ((2, 'other, True'),))):
+            if name is None or not any(count in overloads for count, _ in calls):
+                continue
+            self._emit(f"def {name}(self, other):")
+            self._indent += 1
+            exhaustive = False
+            for count, arguments in calls:
+                if count not in overloads:
+                    continue
+                method, numeric = overloads[count]
+                if not numeric:
+                    self._emit(f"return self.{method}({arguments})")
+                    exhaustive = True
+                    break
+                self._emit('if type(other) in _NUMBERS:')
+                self._emit(f"{INDENT}return self.{method}({arguments})")
+            if not exhaustive:
+                self._emit('return NotImplemented')
+            self._indent -= 1
+
+    def _initial(self, node: Constant) -> Tuple[str, Optional[str]]:
+        # the value of a declaration, or the default value of its type
+        if node.value is not None:
+            return self._value(node.value)
+        type_name = self._type_of(node.type)
+        return repr(default_of(type_name)), KINDS.get(type_name)
+
+    # endregion
+
+    # region STATEMENTS
+
+    def _block(self, node: Block) -> None:
+        # a block statement only scopes its locals
+        body = self._body
+        body.scopes.append({})
+        for statement in node.members:
+            self._statement(statement)
+        body.scopes.pop()
+
+    def _suite(self, node: Block) -> None:
+        # the indented body of a compound statement
+        start = len(self._out)
+        self._indent += 1
+        self._block(node)
+        if len(self._out) == start:
+            self._emit('pass')
+        self._indent -= 1
+
+    def _loop(self, node: Block) -> None:
+        self._body.loops += 1
+        self._suite(node)
+        self._body.loops -= 1
+
+    def _variable(self, node: Variable) -> None:
+        declared = KINDS.get(self._type_of(node.type))
+        # the value is evaluated before the variable exists, so it may refer to an outer one
+        value, kind = self._initial(node)
+        name = self._body.declare(self._value_of(node), declared)
+        self._emit(f"{name} = {_coerce(value, kind, declared)}")
+        self._check(name, value, kind, declared)
+
+    def _evaluate(self, node: Evaluate) -> None:
+        expression = node.expression
+        if type(expression) is Assign:
+            self._assign(expression, False)
+        elif isinstance(expression, Unary) and OPERATORS[expression.operator] in INCREMENTS:
+            self._increment(expression, False)
+        else:
+            self._emit(self._value(expression)[0])
+
+    def _if(self, node: If, keyword_: str = 'if') -> None:
+        self._emit(f"{keyword_} {self._value(node.condition)[0]}:")
+        self._suite(node.then)
+        otherwise = node.otherwise
+        if otherwise is None:
+            return
+        self._line(otherwise)
+        if isinstance(otherwise, If):
+            self._if(otherwise, 'elif')
+            return
+        self._emit('else:')
+        self._suite(otherwise if isinstance(otherwise, Block) else Block(otherwise.token, [otherwise]))
+
+    def _while(self, node: While) -> None:
+        self._emit(f"while {self._value(node.condition)[0]}:")
+        self._loop(node.body)
+
+    def _do_while(self, node: DoWhile) -> None:
+        # the condition is skipped on the first pass only, so 'continue' still checks it
+        first = self._body.temporary()
+        self._emit(f"{first} = True")
+        self._emit(f"while {first} or {self._value(node.condition)[0]}:")
+        self._emit(f"{INDENT}{first} = False")
+        self._loop(node.body)
+
+    def _repeat(self, node: Repeat) -> None:
+        count, kind = self._value(node.count)
+        # the VM keeps the count in an int local
+        self._emit(f"for _ in range({_stored(count, 'int')}):")
+        self._loop(node.body)
+
+    def _return(self, node: Return) -> None:
+        body = self._body
+        if body.constructor:
+            if node.value is not None:
+                self._emit(self._value(node.value)[0])
+            self._emit('return self')
+        elif node.value is None:
+            self._emit('return')
+        else:
+            self._emit(f"return {self._value(node.value)[0]}")
+
+    def _print(self, node: Print) -> None:
+        self._emit(f"_print({', '.join(self._value(value)[0] for value in node.values)})")
+
+    def _assert(self, node: Assert) -> None:
+        self._emit(f"if not {self._value(node.condition)[0]}:")
+        self._emit(f"{INDENT}_fail('Assertion failed')")
+
+    def _break(self, node: Break) -> None:
+        if not self._body.loops:
+            raise self._fail("'break' outside of a loop", node)
+        self._emit('break')
+
+    def _continue(self, node: Continue) -> None:
+        if not self._body.loops:
+            raise self._fail("'continue' outside of a loop", node)
+        self._emit('continue')
+
+    # endregion
+
+    # region EXPRESSIONS
+
+    # Expressions translate to Python expressions, with the Python type of
+    # their values where it is known: 'int', 'float', 'bool', 'str' or None.
+
+    def _value(self, node: Node) -> Tuple[str, Optional[str]]:
+        handler = self._expressions.get(type(node))
+        if handler is None:
+            raise self._fail(f"Can't translate {type(node).__name__} expressions", node)
+        return handler(node)
+
+    def _literal(self, node: Literal) -> Tuple[str, Optional[str]]:
+        return _python_literal(self._constant(node))
+
+    def _this(self, node: Node) -> str:
+        if not self._body.this:
+            raise self._fail("'this' used outside of an instance routine", node)
+        return 'self'
+
+    def _name(self, node: Name) -> Tuple[str, Optional[str]]:
+        name = self._value_of(node)
+        if name in (KW_THIS, KW_SUPER, KW_BASE):
+            return self._this(node), None
+        local = self._body.lookup(name)
+        if local is not None:
+            return local
+        kind = self._member(self._class, name)
+        if kind == MK_STATIC:
+            return f"{self._static(self._class, name)}.{attribute(name)}", None
+        if kind in (MK_FIELD, MK_METHOD):
+            return f"{self._this(node)}.{attribute(name)}", None
+        if name not in self._globals:
+            raise self._fail(f"Undefined name '{name}'", node)
+        if self._globals[name] == GK_FUNCTION:
+            raise self._fail(f"Function '{name}' can only be called", node)
+        return identifier(name), self._kinds.get(name)
+
+    def _target(self, node: Node) -> Tuple[int, str, Any]:
+        """Resolves the target of an assignment
+
+        :return: TF_LOCAL or TF_NAME, the Python name and its Python type; or TF_ATTRIBUTE, the Python object
+            and attribute
+        """
+        body = self._body
+        if isinstance(node, Name):
+            name = self._value_of(node)
+            local = body.lookup(name)
+            if local is not None:
+                return TF_LOCAL, local[0], local[1]
+            if name in (KW_THIS, KW_SUPER, KW_BASE):
+                raise self._fail(f"Can't assign to '{name}'", node)
+            kind = self._member(self._class, name)
+            if kind == MK_STATIC:
+                return TF_ATTRIBUTE, self._static(self._class, name), attribute(name)
+            if kind in (MK_FIELD, MK_METHOD):
+                return TF_ATTRIBUTE, self._this(node), attribute(name)
+            if name not in self._globals:
+                raise self._fail(f"Undefined name '{name}'", node)
+            if body.function:
+                body.globals.add(identifier(name))
+            return TF_NAME, identifier(name), self._kinds.get(name)
+        if isinstance(node, Member):
+            name = self._value_of(node)
+            target = node.target
+            if isinstance(target, Name) and body.lookup(self._value_of(target)) is None:
+                owner = self._value_of(target)
+                if self._globals.get(owner, -1) == GK_CLASS:
+                    return TF_ATTRIBUTE, self._static(owner, name), attribute(name)
+            return TF_ATTRIBUTE, _operand(self._value(target)[0]), attribute(name)
+        raise self._fail(f"Can't assign to {type(node).__name__} expressions", node)
+
+    def _member_value(self, node: Member) -> Tuple[str, Optional[str]]:
+        target = node.target
+        name = self._value_of(node)
+        if isinstance(target, Name) and self._body.lookup(self._value_of(target)) is None:
+            owner = self._value_of(target)
+            if owner == KW_SUPER:
+                self._this(target)
+                return f"super().{attribute(name)}", None
+            values = self._enums.get(owner)
+            if values is not None and name in values:
+                return _python_literal(values[name])
+            if self._globals.get(owner, -1) == GK_CLASS:
+                return f"{self._static(owner, name)}.{attribute(name)}", None
+        return f"{_operand(self._value(target)[0])}.{attribute(name)}", None
+
+    def _call(self, node: Call) -> Tuple[str, Optional[str]]:
+        target = node.target
+        count = len(node.arguments)
+        arguments = ', '.join(self._value(argument)[0] for argument in node.arguments)
+        if isinstance(target, Name) and self._body.lookup(self._value_of(target)) is None:
+            name = self._value_of(target)
+            if name == KW_SUPER:
+                # the base constructor; classes without constructors take no arguments
+                this = self._this(target)
+                base = self._base(target)
+                return f"{identifier(base)}.new__{count}({', '.join(filter(None, (this, arguments)))})", None
+            kind = self._member(self._class, name)
+            if kind in (MK_METHOD, MK_FIELD):
+                return f"{self._this(target)}.{overload(name, count)}({arguments})", None
+            if kind == MK_STATIC_METHOD:
+                return f"{identifier(self._class)}.{overload(name, count)}({arguments})", None
+            if name not in self._globals:
+                raise self._fail(f"Undefined name '{name}'", target)
+            kind = self._globals[name]
+            if kind == GK_FUNCTION:
+                return f"{overload(name, count)}({arguments})", None
+            if kind == GK_CLASS:
+                if not count and not self._classes[name].constructors:
+                    return f"{identifier(name)}()", None
+                return f"{identifier(name)}().new__{count}({arguments})", None
+            if kind is None:
+                # an import of a module that was not given: a function or a class, told when run
+                extra = f", {arguments}" if arguments else ''
+                return f"_invoke(globals(), {name!r}{extra})", None
+            raise self._fail(f"'{name}' is not a function or a class", target)
+        if isinstance(target, Member):
+            name = self._value_of(target)
+            receiver = target.target
+            if isinstance(receiver, Name) and self._value_of(receiver) == KW_SUPER \
+                    and self._body.lookup(KW_SUPER) is None:
+                self._this(receiver)
+                return f"super().{overload(name, count)}({arguments})", None
+            return f"{_operand(self._value(receiver)[0])}.{overload(name, count)}({arguments})", None
+        raise self._fail("Only functions, methods and constructors can be called", node)
+
+    def _base(self, node: Node) -> str:
+        symbols = self._classes.get(self._class or '')
+        for base in symbols.bases if symbols is not None else ():
+            if self._globals.get(base, -1) in (GK_CLASS, None):
+                return base
+        raise self._fail(f"{self._class} has no base class", node)
+
+    def _unary(self, node: Unary) -> Tuple[str, Optional[str]]:
+        symbol = OPERATORS[node.operator]
+        if symbol in INCREMENTS:
+            return self._increment(node, True)
+        operand, kind = self._value(node.operand)
+        if symbol in ('not', '!'):
+            return f"(not {operand})", 'bool'
+        if symbol == '~':
+            return f"(~{operand})", 'int' if kind in INTEGRAL else None
+        return f"({symbol}{operand})", kind if kind in NUMERIC else None
+
+    def _postfix(self, node: Postfix) -> Tuple[str, Optional[str]]:
+        return self._increment(node, True)
+
+    def _binary(self, node: Binary) -> Tuple[str, Optional[str]]:
+        symbol = OPERATORS[node.operator]
+        left, left_kind = self._value(node.left)
+        right, right_kind = self._value(node.right)
+        if symbol in LOGICAL:
+            return f"({left} {LOGICAL[symbol]} {right})", left_kind if left_kind == right_kind else None
+        return _operation(symbol, left, right, left_kind, right_kind)
+
+    def _assign(self, node: Assign, keep: bool) -> Optional[Tuple[str, Optional[str]]]:
+        """Translates an assignment, as a statement, or as an expression if `keep` is set"""
+        symbol = OPERATORS[node.operator]
+        value, kind = self._value(node.right)
+        form, where, extra = self._target(node.left)
+        operator = symbol[:-1] if symbol != '=' else None
+        if form != TF_ATTRIBUTE:
+            if operator is not None:
+                value, kind = _operation(operator, where, value, extra, kind)
+            value = _coerce(value, kind, extra)
+            if not keep:
+                self._emit(f"{where} = {value}")
+                if form == TF_LOCAL:
+                    self._check(where, value, kind, extra)
+                return None
+            if form == TF_LOCAL:
+                value = _stored(value, extra)
+            return f"({where} := {value})", extra or kind
+        if not keep:
+            if operator is not None and not _simple(where):
+                temporary = self._body.temporary()
+                self._emit(f"{temporary} = {where}")
+                where = temporary
+            if operator is not None:
+                value = _operation(operator, f"{where}.{extra}", value, None, kind)[0]
+            self._emit(f"{where}.{extra} = {value}")
+            return None
+        if operator is None:
+            return f"_set({where}, {extra!r}, {value})", kind
+        holder = where
+        if not _simple(where):
+            where = self._body.temporary()
+            holder = f"({where} := {holder})"
+        return f"_set({holder}, {extra!r}, {_operation(operator, f'{where}.{extra}', value, None, kind)[0]})", None
+
+    def _increment(self, node: Unary, keep: bool) -> Optional[Tuple[str, Optional[str]]]:
+        sign = OPERATORS[node.operator][0]
+        form, where, extra = self._target(node.operand)
+        postfix = isinstance(node, Postfix)
+        if form != TF_ATTRIBUTE:
+            if not keep:
+                self._emit(f"{where} {sign}= 1")
+                if form == TF_LOCAL:
+                    self._check(where, None, extra, extra)
+                return None
+            value = f"{where} {sign} 1"
+            if form == TF_LOCAL:
+                value = _stored(value, extra)
+            if postfix:
+                return f"({where}, ({where} := {value}))[0]", extra
+            return f"({where} := {value})", extra
+        if not keep:
+            self._emit(f"{where}.{extra} {sign}= 1")
+            return None
+        if postfix:
+            return f"_post({where}, {extra!r}, {sign == '+'})", None
+        holder = where
+        if not _simple(where):
+            where = self._body.temporary()
+            holder = f"({where} := {holder})"
+        return f"_set({holder}, {extra!r}, {where}.{extra} {sign} 1)", None
+
+    def _check(self, name: str, value: Optional[str], kind: Optional[str], declared: Optional[str]) -> None:
+        """Writes the check of a value just stored in a local, for int locals
+
+        As in the VM int banks, values are converted to 64-bit integers, or the
+        store is an overflow. The range test is written inline, as calling
+        ``_int`` for every store costs twice as much, and values known to be
+        numbers, hence integers once stored, skip the type test.
+
+        :param name: The Python name of the local
+        :param value: The value stored, if it is known
+        :param kind: The Python type of the value, where known
+        :param declared: The Python type of the local
+        """
+        if declared != 'int' or value is not None and _in_range(value):
+            return
+        test = f"{INT_MIN} <= {name} <= {INT_MAX}"
+        self._emit(f"if not {test}:" if kind in NUMERIC else f"if type({name}) is not int or not {test}:")
+        self._emit(f"{INDENT}{name} = _int({name})")
+
+    # endregion (methods)
+
+
+# endregion (classes)
+# ---------------------------------------------------------
+# region FUNCTIONS
+
+
+def identifier(name: str) -> str:
+    """Gets the Python name of a minilang local or module level name
+
+    Names Python reserves get an underscore after them; names with one before
+    them get an 'm' before that, clear of the runtime helpers and of Python's
+    private name mangling.
+    """
+    if name.startswith('_'):
+        return 'm' + name
+    return name + '_' if name in RESERVED else name
+
+
+def attribute(name: str) -> str:
+    """Gets the Python attribute of a minilang member name"""
+    if name.startswith('__'):
+        return 'm' + name
+    return name + '_' if keyword.iskeyword(name) else name
+
+
+def overload(name: str, count: int) -> str:
+    """Gets the Python name of a function or method taking a number of arguments"""
+    return f"{attribute(name)}__{count}"
+
+
+def _python_literal(value: Any) -> Tuple[str, Optional[str]]:
+    kinds = {bool: 'bool', int: 'int', float: 'float', str: 'str'}
+    return repr(value), kinds.get(type(value))
+
+
+def _operand(text: str) -> str:
+    # number literals need parentheses before a '.'
+    return f"({text})" if text[:1].isdigit() else text
+
+
+def _simple(text: str) -> bool:
+    # whether an expression can be evaluated twice: names and attributes of names
+    return all(part.isidentifier() for part in text.split('.'))
+
+
+def _coerce(text: str, kind: Optional[str], declared: Optional[str]) -> str:
+    # numbers stored in variables of the other number type are converted, as the VM banks do
+    if declared == 'float' and kind in INTEGRAL:
+        return f"float({text})"
+    if declared == 'int' and kind in ('float', 'bool'):
+        return f"int({text})"
+    return text
+
+
+def _in_range(text: str) -> bool:
+    # whether a value is an int literal an int local can hold
+    return text.isdigit() and INT_MIN <= int(text) <= INT_MAX
+
+
+def _stored(text: str, declared: Optional[str]) -> str:
+    # a value stored in a local by an expression, checked by `_int` if the local is an int one; see `_check`
+    return f"_int({text})" if declared == 'int' and not _in_range(text) else text
+
+
+def _operation(symbol: str, left: str, right: str, left_kind: Optional[str], right_kind: Optional[str]
+               ) -> Tuple[str, Optional[str]]:
+    """Translates a binary operator, as Python's own where the operand types allow it"""
+    numeric = left_kind in NUMERIC and right_kind in NUMERIC
+    integral = left_kind in INTEGRAL and right_kind in INTEGRAL
+    if symbol in COMPARISONS:
+        return f"({left} {symbol} {right})", 'bool'
+    if symbol == '+':
+        if left_kind == right_kind == 'str':
+            return f"({left} + {right})", 'str'
+        if not numeric:
+            # strings concatenate with the text of anything
+            return f"_add({left}, {right})", 'str' if 'str' in (left_kind, right_kind) else None
+    if symbol in ('/', '%'):
+        name = 'div' if symbol == '/' else 'mod'
+        if integral:
+            return f"_i{name}({left}, {right})", 'int'
+        if numeric and symbol == '/':
+            return f"({left} / {right})", 'float'
+        return f"_{name}({left}, {right})", 'float' if numeric else None
+    if integral:
+        return f"({left} {symbol} {right})", 'int'
+    if numeric and symbol in ('+', '-', '*'):
+        return f"({left} {symbol} {right})", 'float'
+    return f"({left} {symbol} {right})", None
+
+
+def main() -> int:
+
+    conf: JSOM = JSOM.parse_file(LEXCONF)
+    source: Source = Source.load(os.path.join(os.path.dirname(LEXCONF), '../../examples/testproj/src/main.txt'))
+    tokens, error = Lexer(conf, source).gen_tokens()
+    if error:
+        print(error.message, file=sys.stderr)
+        return 1
+
+    module, error = Parser(source, tokens).parse()
+    if error:
+        print(error, file=sys.stderr)
+        return 1
+
+    python, error = PythonTranslator(module).translate()
+    if error:
+        print(error, file=sys.stderr)
+        return 1
+
+    print(python.source)
+    return 0
+
+
+# endregion (functions)
+# ---------------------------------------------------------
+# region ENTRYPOINT
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+# endregion (entrypoint)
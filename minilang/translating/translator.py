@@ -0,0 +1,952 @@
+# -*- encoding: utf8 -*-
+# ------------------------------------------------------------------------------
+# translator.py
+# Created on 18/10/2026
+#
+# The MIT License
+#
+#
+# Copyright 2022 Jorge A. Gomes
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# region IMPORTS
+
+import os
+import sys
+
+from array import array
+
+from minilang.utillities.jsom import JSOM
+from minilang.utillities.code import Source
+from minilang.utillities.error import MinilangError, TranslateError
+from minilang.lexing.core import Lexer
+from minilang.lexing.tokens import TC_NUMBER, TC_STRING, KW_THIS, KW_SUPER, KW_BASE, KW_TRUE, KW_FALSE, KW_NULL, \
+    SK_FLOAT
+from minilang.parsing.nodes import OPERATORS, OPERATOR_CODES, QF_STATIC, Node, Module, Class, Interface, Enum, \
+    Block, Import, Constant, Signature, Variable, Property, Routine as RoutineNode, Function, Method, Operator, \
+    TypeName, If, While, DoWhile, Repeat, Return, Print, Assert, Break, Continue, Breakpoint, Evaluate, Literal, \
+    Name, Member, Call, Unary, Postfix, Binary, Assign
+from minilang.parsing.parser import Parser
+from minilang.translating import opcodes as op
+from minilang.translating.bytecode import BANK_INT, BANK_FLOAT, BANK_OBJECT, RK_FUNCTION, RK_METHOD, \
+    RK_CONSTRUCTOR, RK_GETTER, RK_SETTER, RK_OPERATOR, RK_INITIALIZER, RK_MODULE, GK_CONSTANT, GK_FUNCTION, \
+    GK_CLASS, GK_ENUM, GK_INTERFACE, GK_SIGNATURE, Routine, ClassInfo, CodeModule
+from typing import Optional, Any, Callable, List, Dict, Set, Tuple
+
+# endregion (imports)
+# ---------------------------------------------------------
+# region EXPORTS
+
+
+__all__ = [
+    'ClassSymbols',
+    'Translator',
+    'bank_of',
+]
+
+
+# endregion (exports)
+# ---------------------------------------------------------
+# region CONSTANTS & ENUMS
+
+LEXCONF = os.path.join(os.path.dirname(__file__), '../lexing/lexconf.json')
+
+# the frame bank of each primitive type; booleans stay objects so they print as such
+BANKS: Dict[str, int] = {
+    'i8': BANK_INT, 'i16': BANK_INT, 'i32': BANK_INT, 'i64': BANK_INT,
+    'u8': BANK_INT, 'u16': BANK_INT, 'u32': BANK_INT, 'u64': BANK_INT,
+    'f32': BANK_FLOAT, 'f64': BANK_FLOAT,
+}
+
+# the value of a declaration without one, by type
+DEFAULTS: Dict[str, Any] = {'boolean': False, 'string': ''}
+BANK_DEFAULTS: Tuple[Any, ...] = (0, 0.0, None)
+
+BINARY: Dict[str, int] = {
+    '+': op.ADD, '-': op.SUB, '*': op.MUL, '/': op.DIV, '%': op.MOD,
+    '&': op.BIT_AND, '|': op.BIT_OR, '^': op.BIT_XOR, '<<': op.SHL, '>>': op.SHR,
+    '==': op.EQ, '!=': op.NE, '<': op.LT, '>': op.GT, '<=': op.LE, '>=': op.GE,
+}
+UNARY: Dict[str, int] = {'-': op.NEG, '+': op.POS, 'not': op.NOT, '!': op.NOT, '~': op.INVERT}
+LOGICAL: Dict[str, int] = {'and': op.JUMP_IF_FALSE_OR_POP, '&&': op.JUMP_IF_FALSE_OR_POP,
+                           'or': op.JUMP_IF_TRUE_OR_POP, '||': op.JUMP_IF_TRUE_OR_POP}
+# compound assignments, e.g. '+=', map to their operator
+COMPOUND: Dict[int, int] = {OPERATOR_CODES[operator]: BINARY[operator[:-1]]
+                            for operator in OPERATORS if operator.endswith('=') and operator[:-1] in BINARY}
+INCREMENTS: Dict[str, int] = {'++': op.ADD, '--': op.SUB}
+
+LOADS = (op.LOAD_INT, op.LOAD_FLOAT, op.LOAD_OBJECT)
+STORES = (op.STORE_INT, op.STORE_FLOAT, op.STORE_OBJECT)
+
+ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', '0': '\0'}
+
+# members of classes, as told by `Translator._member`
+MK_FIELD = 1
+MK_STATIC = 2
+MK_METHOD = 3
+MK_STATIC_METHOD = 4
+
+MAX_TARGET = 0xffff
+
+# endregion (constants)
+# ---------------------------------------------------------
+# region CLASSES
+
+
+class _Frame:
+    """Assigns the locals of a routine to bank slots
+
+    The slots of a block are released when it ends, so sibling blocks share
+    them; the frame size of each bank is the most slots in use at once.
+    """
+
+    __slots__ = 'scopes', 'used', 'sizes'
+
+    def __init__(self):
+        self.scopes: List[Dict[str, Tuple[int, int]]] = [{}]
+        self.used: List[int] = [0, 0, 0]
+        self.sizes: List[int] = [0, 0, 0]
+
+    def declare(self, name: Optional[str], bank: int) -> int:
+        slot = self.used[bank]
+        self.used[bank] += 1
+        self.sizes[bank] = max(self.sizes[bank], self.used[bank])
+        if name is not None:
+            self.scopes[-1][name] = (bank, slot)
+        return slot
+
+    def lookup(self, name: str) -> Optional[Tuple[int, int]]:
+        for scope in reversed(self.scopes):
+            found = scope.get(name)
+            if found is not None:
+                return found
+        return None
+
+    def push(self) -> List[int]:
+        self.scopes.append({})
+        return list(self.used)
+
+    def pop(self, used: List[int]) -> None:
+        self.scopes.pop()
+        self.used = used
+
+
+class _Builder:
+    """The instructions of the routine being translated
+
+    Jump targets are instruction indices, so forward jumps are emitted with a
+    placeholder and patched once the target is known.
+    """
+
+    __slots__ = 'routine', 'frame', 'instructions', 'lines', 'loops', 'this'
+
+    def __init__(self, routine: Routine, this: bool):
+        self.routine: Routine = routine
+        self.frame: _Frame = _Frame()
+        self.instructions: List[List[int]] = []
+        self.lines: List[int] = []
+        # (continue target or None, continue jumps to patch, break jumps to patch) of the enclosing loops
+        self.loops: List[Tuple[Optional[int], List[int], List[int]]] = []
+        self.this: bool = this
+        if this:
+            self.frame.declare(None, BANK_OBJECT)
+
+    @property
+    def label(self) -> int:
+        return len(self.instructions)
+
+    def emit(self, opcode: int, argument: int = 0) -> int:
+        self.instructions.append([opcode, argument])
+        return len(self.instructions) - 1
+
+    def patch(self, index: int, target: Optional[int] = None) -> None:
+        target = self.label if target is None else target
+        if target > MAX_TARGET:
+            raise TranslateError(f"Routine {self.routine.name} is too long")
+        instruction = self.instructions[index]
+        if instruction[0] == op.REPEAT_NEXT:
+            instruction[1] = instruction[1] & ~MAX_TARGET | target
+        else:
+            instruction[1] = target
+
+    def line(self, line: int) -> None:
+        if not self.lines or self.lines[-1] != line:
+            if self.lines and self.lines[-2] == self.label:
+                self.lines[-1] = line
+            else:
+                self.lines.extend((self.label, line))
+
+    def finish(self) -> Routine:
+        routine = self.routine
+        end = self.label
+        # falling off the end, or jumping past it, returns nothing
+        if not self.instructions or self.instructions[-1][0] not in (op.RETURN, op.RETURN_NONE) or any(
+                argument == end if opcode in op.JUMPS else opcode == op.REPEAT_NEXT and argument & MAX_TARGET == end
+                for opcode, argument in self.instructions):
+            self.emit(op.RETURN_NONE)
+        routine.frame = tuple(self.frame.sizes)
+        routine.code = op.encode(self.instructions)
+        routine.lines = array('I', self.lines)
+        return routine
+
+
+class ClassSymbols:
+    """What the translator knows of a class, to resolve the names used in its methods"""
+
+    __slots__ = 'bases', 'members', 'constructors'
+
+    def __init__(self, bases: List[str], members: Dict[str, int], constructors: Set[int]):
+        self.bases: List[str] = bases
+        self.members: Dict[str, int] = members
+        # the argument counts of its constructors
+        self.constructors: Set[int] = constructors
+
+
+class Translator:
+    """Translates the syntax tree of a module to bytecode
+
+    Locals resolve to frame slots, globals and members to name indices, and
+    literals to the constant pool. Module declarations may be used before they
+    are declared. Imported names resolve through the translated modules they
+    come from, if given; otherwise they are left to the VM to link.
+    """
+
+    __slots__ = '_module', '_imports', '_code', '_globals', '_classes', '_enums', '_builder', '_class', \
+        '_statements', '_expressions'
+
+    def __init__(self, module: Module, imports: Optional[Dict[str, Optional[CodeModule]]] = None):
+        self._module: Module = module
+        self._imports: Dict[str, Optional[CodeModule]] = imports or {}
+        self._code: CodeModule = CodeModule(getattr(module.source, 'filename', '') or '')
+        # module level names, with their kind; None for imported names whose module is unknown
+        self._globals: Dict[str, Optional[int]] = {}
+        self._classes: Dict[str, ClassSymbols] = {}
+        self._enums: Dict[str, Dict[str, Any]] = {}
+        self._builder: Optional[_Builder] = None
+        self._class: Optional[str] = None
+        self._statements: Dict[type, Callable[[Any], None]] = {
+            Block: self._block,
+            Variable: self._variable,
+            Evaluate: self._evaluate,
+            If: self._if,
+            While: self._while,
+            DoWhile: self._do_while,
+            Repeat: self._repeat,
+            Return: self._return,
+            Print: self._print,
+            Assert: self._assert,
+            Break: self._break,
+            Continue: self._continue,
+            Breakpoint: lambda node: None,
+        }
+        self._expressions: Dict[type, Callable[[Any], None]] = {
+            Literal: self._literal,
+            Name: self._name,
+            Member: self._member_value,
+            Call: self._call,
+            Unary: self._unary,
+            Postfix: self._postfix,
+            Binary: self._binary,
+            Assign: lambda node: self._assign(node, True),
+        }
+
+    # region METHODS
+
+    def translate(self) -> Tuple[Optional[CodeModule], Optional[MinilangError]]:
+        """Translates the module
+
+        :return: The translated module and None, or None and the first error found
+        """
+        try:
+            self._declare()
+            self._translate()
+        except MinilangError as error:
+            return None, error
+        return self._code, None
+
+    def _fail(self, message: str, node: Node) -> TranslateError:
+        token = node.token
+        tokens = self._module.tokens
+        location = tokens[token].location if 0 <= token < len(tokens) else None
+        return TranslateError(message, location, node)
+
+    def _value_of(self, node: Node) -> str:
+        return self._module.value(node.token)
+
+    def _type_of(self, node: Optional[Node]) -> str:
+        return self._value_of(node) if isinstance(node, TypeName) else ''
+
+    # endregion
+
+    # region DECLARATIONS
+
+    def _declare(self) -> None:
+        # collects the module level names first, so they can be used before their declaration
+        code = self._code
+        for node in self._module.members:
+            if isinstance(node, Import):
+                self._import(node)
+                continue
+            name = self._value_of(node)
+            if isinstance(node, Class):
+                self._globals[name] = GK_CLASS
+                self._classes[name] = self._symbols(node)
+            elif isinstance(node, Enum):
+                self._globals[name] = GK_ENUM
+                self._enums[name] = self._enum(node)
+                code.enums.append((name, [(member, code.constant(value))
+                                          for member, value in self._enums[name].items()]))
+                code.globals.append((name, GK_ENUM, len(code.enums) - 1))
+            elif isinstance(node, Function):
+                self._globals[name] = GK_FUNCTION
+            elif isinstance(node, Constant):
+                self._globals[name] = GK_CONSTANT
+                code.globals.append((name, GK_CONSTANT, -1))
+            elif isinstance(node, Interface):
+                self._globals[name] = GK_INTERFACE
+                code.globals.append((name, GK_INTERFACE, -1))
+            elif isinstance(node, Signature):
+                self._globals[name] = GK_SIGNATURE
+                code.globals.append((name, GK_SIGNATURE, -1))
+
+    def _import(self, node: Import) -> None:
+        path = self._string(node.path)
+        names = [self._value_of(name) for name in node.names]
+        self._code.imports.append((path, names))
+        imported = self._imports.get(path)
+        for name in names:
+            kinds = imported.lookup(name) if imported is not None else []
+            if not kinds:
+                self._globals[name] = None
+                continue
+            kind, index = kinds[0]
+            self._globals[name] = kind
+            if kind == GK_CLASS:
+                self._classes[name] = self._imported_symbols(imported, imported.classes[index])
+            elif kind == GK_ENUM:
+                self._enums[name] = {member: imported.constants[constant]
+                                     for member, constant in imported.enums[index][1]}
+
+    def _symbols(self, node: Class) -> ClassSymbols:
+        members: Dict[str, int] = {}
+        constructors: Set[int] = set()
+        for member in node.members:
+            name = self._value_of(member)
+            static = getattr(member, 'flags', 0) & QF_STATIC
+            if isinstance(member, (Constant, Property)):
+                members[name] = MK_STATIC if static else MK_FIELD
+            elif isinstance(member, Method) and name == self._value_of(node) and member.result is None:
+                constructors.add(len(member.parameters))
+            elif isinstance(member, Method):
+                members[name] = MK_STATIC_METHOD if static else MK_METHOD
+        return ClassSymbols([self._value_of(base) for base in node.bases], members, constructors)
+
+    @staticmethod
+    def _imported_symbols(module: CodeModule, info: ClassInfo) -> ClassSymbols:
+        members: Dict[str, int] = {}
+        constructors: Set[int] = set()
+        for name, _ in info.fields:
+            members[name] = MK_FIELD
+        for name, _, _ in info.properties:
+            members[name] = MK_FIELD
+        for name, _ in info.statics:
+            members[name] = MK_STATIC
+        for index in info.routines:
+            routine = module.routines[index]
+            if routine.kind == RK_METHOD:
+                members[routine.name] = MK_STATIC_METHOD if routine.flags & QF_STATIC else MK_METHOD
+            elif routine.kind == RK_CONSTRUCTOR:
+                constructors.add(routine.arity)
+        return ClassSymbols(list(info.bases), members, constructors)
+
+    def _member(self, owner: Optional[str], name: str) -> Optional[int]:
+        """Finds a member of a class or of its bases
+
+        :return: The member kind, MK_FIELD for unknown names of classes with unknown bases, or None
+        """
+        seen: Set[str] = set()
+        pending = [owner] if owner is not None else []
+        unknown = False
+        while pending:
+            current = pending.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            symbols = self._classes.get(current)
+            if symbols is None:
+                # an interface, or a class of a module that was not given
+                unknown = unknown or self._globals.get(current, None) is None
+                continue
+            kind = symbols.members.get(name)
+            if kind is not None:
+                return kind
+            pending.extend(reversed(symbols.bases))
+        return MK_FIELD if unknown and name not in self._globals else None
+
+    def _enum(self, node: Enum) -> Dict[str, Any]:
+        values: Dict[str, Any] = {}
+        following = 0
+        for member in node.members:
+            if member.value is not None:
+                following = self._fold(member.value, values)
+            values[self._value_of(member)] = following
+            following += 1
+        return values
+
+    def _fold(self, node: Node, scope: Dict[str, Any]) -> Any:
+        # evaluates the constant expressions of enumerations
+        if isinstance(node, Literal):
+            return self._constant(node)
+        if isinstance(node, Name) and self._value_of(node) in scope:
+            return scope[self._value_of(node)]
+        if isinstance(node, Member) and isinstance(node.target, Name):
+            values = self._enums.get(self._value_of(node.target), {})
+            if self._value_of(node) in values:
+                return values[self._value_of(node)]
+        if isinstance(node, Unary) and OPERATORS[node.operator] in ('-', '+', '~'):
+            value = self._fold(node.operand, scope)
+            return {'-': -value, '+': value, '~': ~value}[OPERATORS[node.operator]]
+        if isinstance(node, Binary) and OPERATORS[node.operator] in BINARY:
+            left, right = self._fold(node.left, scope), self._fold(node.right, scope)
+            symbol = OPERATORS[node.operator]
+            try:
+                return {
+                    '+': lambda: left + right, '-': lambda: left - right, '*': lambda: left * right,
+                    '/': lambda: left // right, '%': lambda: left % right, '&': lambda: left & right,
+                    '|': lambda: left | right, '^': lambda: left ^ right, '<<': lambda: left << right,
+                    '>>': lambda: left >> right,
+                }[symbol]()
+            except (KeyError, TypeError, ZeroDivisionError):
+                pass
+        raise self._fail("Enumeration values must be constant", node)
+
+    # endregion
+
+    # region ROUTINES
+
+    def _translate(self) -> None:
+        code = self._code
+        module_init = self._start(Routine('', RK_MODULE), False)
+        for node in self._module.members:
+            name = self._value_of(node) if not isinstance(node, Import) else ''
+            if isinstance(node, Function):
+                code.globals.append((name, GK_FUNCTION, self._routine(node, RK_FUNCTION, name)))
+            elif isinstance(node, Class):
+                code.classes.append(self._class_info(node, module_init))
+                code.globals.append((name, GK_CLASS, len(code.classes) - 1))
+            elif isinstance(node, Constant):
+                self._builder = module_init
+                self._line(node)
+                self._initial(node)
+                module_init.emit(op.STORE_GLOBAL, code.name(name))
+        code.routines.append(module_init.finish())
+        code.init = len(code.routines) - 1
+
+    def _start(self, routine: Routine, this: bool) -> _Builder:
+        self._builder = _Builder(routine, this)
+        return self._builder
+
+    def _routine(self, node: RoutineNode, kind: int, name: str, value_type: Optional[Node] = None) -> int:
+        """Translates a function, method, operator or accessor
+
+        :param value_type: The property type, for setters
+        :return: The routine index
+        """
+        flags = getattr(node, 'flags', 0)
+        builder = self._start(Routine(name, kind, self._class or '', flags),
+                              kind != RK_FUNCTION and not flags & QF_STATIC)
+        parameters = builder.routine.parameters
+        if kind == RK_SETTER:
+            bank = bank_of(self._type_of(value_type))
+            parameters.append((bank, builder.frame.declare('value', bank)))
+        for parameter in getattr(node, 'parameters', ()):
+            bank = bank_of(self._type_of(parameter.type))
+            parameters.append((bank, builder.frame.declare(self._value_of(parameter), bank)))
+        if node.body is not None:
+            self._line(node)
+            for statement in node.body.members:
+                self._statement(statement)
+        self._code.routines.append(builder.finish())
+        return len(self._code.routines) - 1
+
+    def _class_info(self, node: Class, module_init: _Builder) -> ClassInfo:
+        name = self._value_of(node)
+        code = self._code
+        info = ClassInfo(name, [self._value_of(base) for base in node.bases], node.flags)
+        self._class = name
+        initializer: Optional[_Builder] = None
+        for member in node.members:
+            member_name = self._value_of(member)
+            if isinstance(member, Constant):
+                bank = bank_of(self._type_of(member.type))
+                if member.flags & QF_STATIC:
+                    info.statics.append((member_name, bank))
+                    self._builder = module_init
+                    self._line(member)
+                    self._initial(member)
+                    module_init.emit(op.SET_STATIC, code.ref(name, member_name))
+                    continue
+                info.fields.append((member_name, bank))
+                # new instances hold the default of each bank, so only other values need initializing
+                if member.value is not None or default_of(self._type_of(member.type)) != BANK_DEFAULTS[bank]:
+                    if initializer is None:
+                        initializer = _Builder(Routine('', RK_INITIALIZER, name), True)
+                    self._builder = initializer
+                    self._line(member)
+                    initializer.emit(op.LOAD_OBJECT, 0)
+                    self._initial(member)
+                    initializer.emit(op.SET_MEMBER, code.name(member_name))
+            elif isinstance(member, Property):
+                getter, setter = member.getter, member.setter
+                if (getter is None or getter.body is None) and (setter is None or setter.body is None):
+                    # an automatic property is a plain field
+                    info.fields.append((member_name, bank_of(self._type_of(member.type))))
+                    continue
+                info.properties.append((
+                    member_name,
+                    self._routine(getter, RK_GETTER, member_name) if getter is not None and getter.body else -1,
+                    self._routine(setter, RK_SETTER, member_name, member.type)
+                    if setter is not None and setter.body else -1,
+                ))
+            elif isinstance(member, Operator):
+                info.routines.append(self._routine(member, RK_OPERATOR, OPERATORS[member.operator]))
+            elif isinstance(member, Method):
+                if member_name == name and member.result is None:
+                    info.routines.append(self._routine(member, RK_CONSTRUCTOR, ''))
+                else:
+                    info.routines.append(self._routine(member, RK_METHOD, member_name))
+        if initializer is not None:
+            code.routines.append(initializer.finish())
+            info.initializer = len(code.routines) - 1
+        self._class = None
+        return info
+
+    def _initial(self, node: Constant) -> None:
+        # the value of a declaration, or the default value of its type
+        if node.value is not None:
+            self._value(node.value)
+        else:
+            self._builder.emit(op.LOAD_CONST, self._code.constant(default_of(self._type_of(node.type))))
+
+    def _line(self, node: Node) -> None:
+        tokens = self._module.tokens
+        if 0 <= node.token < len(tokens):
+            self._builder.line(tokens[node.token].location.line)
+
+    # endregion
+
+    # region STATEMENTS
+
+    def _statement(self, node: Node) -> None:
+        handler = self._statements.get(type(node))
+        if handler is None:
+            raise self._fail(f"Can't translate {type(node).__name__} statements", node)
+        self._line(node)
+        handler(node)
+
+    def _block(self, node: Block) -> None:
+        frame = self._builder.frame
+        used = frame.push()
+        for statement in node.members:
+            self._statement(statement)
+        frame.pop(used)
+
+    def _variable(self, node: Variable) -> None:
+        type_name = self._type_of(node.type)
+        bank = bank_of(type_name)
+        # the value is evaluated before the variable exists, so it may refer to an outer one
+        self._initial(node)
+        self._builder.emit(STORES[bank], self._builder.frame.declare(self._value_of(node), bank))
+
+    def _evaluate(self, node: Evaluate) -> None:
+        expression = node.expression
+        if type(expression) is Assign:
+            self._assign(expression, False)
+        elif isinstance(expression, Unary) and OPERATORS[expression.operator] in INCREMENTS:
+            self._increment(expression, False)
+        else:
+            self._value(expression)
+            self._builder.emit(op.POP)
+
+    def _if(self, node: If) -> None:
+        builder = self._builder
+        self._value(node.condition)
+        otherwise = builder.emit(op.JUMP_IF_FALSE)
+        self._block(node.then)
+        if node.otherwise is None:
+            builder.patch(otherwise)
+            return
+        end = builder.emit(op.JUMP)
+        builder.patch(otherwise)
+        self._statement(node.otherwise)
+        builder.patch(end)
+
+    def _loop(self, body: Block, top: Optional[int]) -> Tuple[List[int], List[int]]:
+        builder = self._builder
+        loop = (top, [], [])
+        builder.loops.append(loop)
+        self._block(body)
+        builder.loops.pop()
+        return loop[1], loop[2]
+
+    def _while(self, node: While) -> None:
+        builder = self._builder
+        top = builder.label
+        self._value(node.condition)
+        end = builder.emit(op.JUMP_IF_FALSE)
+        _, breaks = self._loop(node.body, top)
+        builder.emit(op.JUMP, top)
+        for jump in [end] + breaks:
+            builder.patch(jump)
+
+    def _do_while(self, node: DoWhile) -> None:
+        builder = self._builder
+        top = builder.label
+        continues, breaks = self._loop(node.body, None)
+        for jump in continues:
+            builder.patch(jump)
+        self._value(node.condition)
+        builder.emit(op.JUMP_IF_TRUE, top)
+        for jump in breaks:
+            builder.patch(jump)
+
+    def _repeat(self, node: Repeat) -> None:
+        # the count is evaluated once, into a hidden int slot that REPEAT_NEXT counts down
+        builder = self._builder
+        self._value(node.count)
+        slot = builder.frame.declare(None, BANK_INT)
+        if slot > MAX_TARGET:
+            raise self._fail("Too many locals", node)
+        builder.emit(op.STORE_INT, slot)
+        top = builder.emit(op.REPEAT_NEXT, slot << 16)
+        _, breaks = self._loop(node.body, top)
+        builder.emit(op.JUMP, top)
+        for jump in [top] + breaks:
+            builder.patch(jump)
+
+    def _return(self, node: Return) -> None:
+        if node.value is None:
+            self._builder.emit(op.RETURN_NONE)
+        else:
+            self._value(node.value)
+            self._builder.emit(op.RETURN)
+
+    def _print(self, node: Print) -> None:
+        for value in node.values:
+            self._value(value)
+        self._builder.emit(op.PRINT, len(node.values))
+
+    def _assert(self, node: Assert) -> None:
+        self._value(node.condition)
+        self._builder.emit(op.ASSERT)
+
+    def _break(self, node: Break) -> None:
+        if not self._builder.loops:
+            raise self._fail("'break' outside of a loop", node)
+        self._builder.loops[-1][2].append(self._builder.emit(op.JUMP))
+
+    def _continue(self, node: Continue) -> None:
+        builder = self._builder
+        if not builder.loops:
+            raise self._fail("'continue' outside of a loop", node)
+        top, continues, _ = builder.loops[-1]
+        if top is None:
+            continues.append(builder.emit(op.JUMP))
+        else:
+            builder.emit(op.JUMP, top)
+
+    # endregion
+
+    # region EXPRESSIONS
+
+    def _value(self, node: Node) -> None:
+        handler = self._expressions.get(type(node))
+        if handler is None:
+            raise self._fail(f"Can't translate {type(node).__name__} expressions", node)
+        handler(node)
+
+    def _literal(self, node: Literal) -> None:
+        self._builder.emit(op.LOAD_CONST, self._code.constant(self._constant(node)))
+
+    def _constant(self, node: Literal) -> Any:
+        token = self._module.tokens[node.token]
+        value: str = token.value
+        if token.kind_code == TC_STRING:
+            return self._string(node)
+        if token.kind_code == TC_NUMBER:
+            # the suffix is the letters of the token, maybe followed by a width, as in 10i32; the lexer
+            # takes letters anywhere after the first digit though, and base prefixes without digits
+            digits = value.replace('_', '')
+            if token.suffix:
+                index = digits.find(token.suffix)
+                width = digits[index + len(token.suffix):]
+                if index < 0 or width and not width.isdigit():
+                    raise self._fail(f"Invalid number '{value}'", node)
+                digits = digits[:index]
+            try:
+                if token.subkind == SK_FLOAT:
+                    return float(digits)
+                return int(digits[2:] if token.base != 10 else digits, token.base)
+            except ValueError:
+                raise self._fail(f"Invalid number '{value}'", node) from None
+        constants = {KW_TRUE: True, KW_FALSE: False, KW_NULL: None}
+        if value in constants:
+            return constants[value]
+        raise self._fail(f"Unknown literal '{value}'", node)
+
+    def _string(self, node: Literal) -> str:
+        value: str = self._value_of(node)[1:-1]
+        if '\\' not in value:
+            return value
+        parts: List[str] = []
+        index = 0
+        while index < len(value):
+            char = value[index]
+            if char == '\\' and index + 1 < len(value):
+                index += 1
+                char = ESCAPES.get(value[index], value[index])
+            parts.append(char)
+            index += 1
+        return ''.join(parts)
+
+    def _this(self, node: Node) -> None:
+        if not self._builder.this:
+            raise self._fail("'this' used outside of an instance routine", node)
+        self._builder.emit(op.LOAD_OBJECT, 0)
+
+    def _name(self, node: Name) -> None:
+        if self._value_of(node) in (KW_THIS, KW_SUPER, KW_BASE):
+            self._this(node)
+            return
+        load, _, argument, _ = self._access(node)
+        self._builder.emit(load, argument)
+
+    def _access(self, node: Node) -> Tuple[int, int, int, bool]:
+        """Resolves the target of a load or store, emitting the object of members
+
+        :return: The load and store opcodes, their argument, and whether an object was emitted
+        """
+        builder = self._builder
+        code = self._code
+        if isinstance(node, Name):
+            name = self._value_of(node)
+            local = builder.frame.lookup(name)
+            if local is not None:
+                return LOADS[local[0]], STORES[local[0]], local[1], False
+            kind = self._member(self._class, name)
+            if kind == MK_STATIC:
+                return op.GET_STATIC, op.SET_STATIC, code.ref(self._class, name), False
+            if kind in (MK_FIELD, MK_METHOD):
+                self._this(node)
+                return op.GET_MEMBER, op.SET_MEMBER, code.name(name), True
+            if name not in self._globals:
+                raise self._fail(f"Undefined name '{name}'", node)
+            return op.LOAD_GLOBAL, op.STORE_GLOBAL, code.name(name), False
+        if isinstance(node, Member):
+            name = self._value_of(node)
+            target = node.target
+            if isinstance(target, Name) and builder.frame.lookup(self._value_of(target)) is None:
+                owner = self._value_of(target)
+                if self._globals.get(owner, -1) == GK_CLASS:
+                    return op.GET_STATIC, op.SET_STATIC, code.ref(owner, name), False
+            self._value(target)
+            return op.GET_MEMBER, op.SET_MEMBER, code.name(name), True
+        raise self._fail(f"Can't assign to {type(node).__name__} expressions", node)
+
+    def _member_value(self, node: Member) -> None:
+        builder = self._builder
+        target = node.target
+        if isinstance(target, Name) and builder.frame.lookup(self._value_of(target)) is None:
+            owner = self._value_of(target)
+            if owner == KW_SUPER:
+                self._this(target)
+                builder.emit(op.GET_SUPER, self._code.ref(self._class or '', self._value_of(node)))
+                return
+            values = self._enums.get(owner)
+            if values is not None and self._value_of(node) in values:
+                builder.emit(op.LOAD_CONST, self._code.constant(values[self._value_of(node)]))
+                return
+        load, _, argument, _ = self._access(node)
+        builder.emit(load, argument)
+
+    def _call(self, node: Call) -> None:
+        builder = self._builder
+        code = self._code
+        target = node.target
+        count = len(node.arguments)
+        if isinstance(target, Name) and builder.frame.lookup(self._value_of(target)) is None:
+            name = self._value_of(target)
+            if name == KW_SUPER:
+                # the base constructor
+                self._this(target)
+                self._arguments(node)
+                builder.emit(op.CALL_SUPER, code.ref(self._class or '', '', count))
+                return
+            kind = self._member(self._class, name)
+            if kind in (MK_METHOD, MK_FIELD):
+                self._this(target)
+                self._arguments(node)
+                builder.emit(op.CALL_METHOD, code.ref(name, count))
+                return
+            if kind == MK_STATIC_METHOD:
+                builder.emit(op.LOAD_GLOBAL, code.name(self._class))
+                self._arguments(node)
+                builder.emit(op.CALL_METHOD, code.ref(name, count))
+                return
+            if name not in self._globals:
+                raise self._fail(f"Undefined name '{name}'", target)
+            self._arguments(node)
+            builder.emit(op.CALL_GLOBAL, code.ref(name, count))
+            return
+        if isinstance(target, Member):
+            name = self._value_of(target)
+            if isinstance(target.target, Name) and self._value_of(target.target) == KW_SUPER \
+                    and builder.frame.lookup(KW_SUPER) is None:
+                self._this(target.target)
+                self._arguments(node)
+                builder.emit(op.CALL_SUPER, code.ref(self._class or '', name, count))
+                return
+            self._value(target.target)
+            self._arguments(node)
+            builder.emit(op.CALL_METHOD, code.ref(name, count))
+            return
+        raise self._fail("Only functions, methods and constructors can be called", node)
+
+    def _arguments(self, node: Call) -> None:
+        for argument in node.arguments:
+            self._value(argument)
+
+    def _unary(self, node: Unary) -> None:
+        symbol = OPERATORS[node.operator]
+        if symbol in INCREMENTS:
+            self._increment(node, True)
+            return
+        self._value(node.operand)
+        self._builder.emit(UNARY[symbol])
+
+    def _postfix(self, node: Postfix) -> None:
+        self._increment(node, True)
+
+    def _binary(self, node: Binary) -> None:
+        builder = self._builder
+        symbol = OPERATORS[node.operator]
+        self._value(node.left)
+        if symbol in LOGICAL:
+            jump = builder.emit(LOGICAL[symbol])
+            self._value(node.right)
+            builder.patch(jump)
+            return
+        self._value(node.right)
+        builder.emit(BINARY[symbol])
+
+    def _assign(self, node: Assign, keep: bool) -> None:
+        if node.operator == OPERATOR_CODES['=']:
+            self._update(node.left, None, node.right, keep, False)
+        else:
+            self._update(node.left, COMPOUND[node.operator], node.right, keep, False)
+
+    def _increment(self, node: Unary, keep: bool) -> None:
+        builder = self._builder
+        operator = INCREMENTS[OPERATORS[node.operator]]
+        operand = node.operand
+        if not keep and isinstance(operand, Name):
+            local = builder.frame.lookup(self._value_of(operand))
+            if local is not None and local[0] == BANK_INT:
+                builder.emit(op.INC_INT if operator == op.ADD else op.DEC_INT, local[1])
+                return
+        self._update(operand, operator, None, keep, isinstance(node, Postfix))
+
+    def _update(self, target: Node, operator: Optional[int], value: Optional[Node], keep: bool, postfix: bool
+                ) -> None:
+        """Stores a value, or the result of an operator, in a variable, field or global
+
+        :param operator: The operator applied to the current value and `value`, or None to store `value`
+        :param value: The value; one if None, for increments
+        :param keep: Whether to leave the stored value on the stack, or the old one for postfix increments
+        """
+        builder = self._builder
+        load, store, argument, member = self._access(target)
+        if operator is not None:
+            if member:
+                builder.emit(op.DUP)
+            builder.emit(load, argument)
+        if keep and postfix:
+            builder.emit(op.DUP_UNDER if member else op.DUP)
+        if value is not None:
+            self._value(value)
+        else:
+            builder.emit(op.LOAD_CONST, self._code.constant(1))
+        if operator is not None:
+            builder.emit(operator)
+        if keep and not postfix:
+            builder.emit(op.DUP_UNDER if member else op.DUP)
+        builder.emit(store, argument)
+
+    # endregion (methods)
+
+
+# endregion (classes)
+# ---------------------------------------------------------
+# region FUNCTIONS
+
+
+def bank_of(type_name: str) -> int:
+    """Gets the frame bank of the values of a type: BANK_INT, BANK_FLOAT or BANK_OBJECT"""
+    return BANKS.get(type_name, BANK_OBJECT)
+
+
+def default_of(type_name: str) -> Any:
+    return DEFAULTS.get(type_name, BANK_DEFAULTS[bank_of(type_name)])
+
+
+def main() -> int:
+
+    conf: JSOM = JSOM.parse_file(LEXCONF)
+    source: Source = Source.load(os.path.join(os.path.dirname(LEXCONF), '../../examples/testproj/src/main.txt'))
+    tokens, error = Lexer(conf, source).gen_tokens()
+    if error:
+        print(error.message, file=sys.stderr)
+        return 1
+
+    module, error = Parser(source, tokens).parse()
+    if error:
+        print(error, file=sys.stderr)
+        return 1
+
+    code, error = Translator(module).translate()
+    if error:
+        print(error, file=sys.stderr)
+        return 1
+
+    print(code.disassemble())
+    print(f"{len(code.tobytes())} bytes")
+    return 0
+
+
+# endregion (functions)
+# ---------------------------------------------------------
+# region ENTRYPOINT
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+# endregion (entrypoint)
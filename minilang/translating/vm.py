@@ -0,0 +1,987 @@
+# -*- encoding: utf8 -*-
+# ------------------------------------------------------------------------------
+# vm.py
+# Created on 18/10/2026
+#
+# The MIT License
+#
+#
+# Copyright 2022 Jorge A. Gomes
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# region IMPORTS
+
+import os
+import sys
+import math
+
+from array import array
+
+from minilang.utillities.error import MinilangError, ExecutionError
+from minilang.building.targets import BytecodeTarget, build_program, run_command
+from minilang.translating import opcodes as op
+from minilang.translating.bytecode import BANK_INT, BANK_FLOAT, BANK_OBJECT, RK_METHOD, RK_CONSTRUCTOR, \
+    RK_OPERATOR, GK_FUNCTION, GK_CLASS, GK_ENUM, Routine, ClassInfo, CodeModule
+from typing import Optional, Any, Callable, Iterable, List, Dict, Tuple, TextIO
+
+# endregion (imports)
+# ---------------------------------------------------------
+# region EXPORTS
+
+
+__all__ = [
+    'Instance',
+    'Machine',
+    'run_project',
+    'text_of',
+]
+
+
+# endregion (exports)
+# ---------------------------------------------------------
+# region CONSTANTS & ENUMS
+
+# each minilang call takes a few Python frames
+MIN_RECURSION_LIMIT = 20000
+
+BANK_DEFAULTS: Tuple[Any, ...] = (0, 0.0, None)
+
+# the operator method each operator opcode calls on instances
+OPERATOR_SYMBOLS: Dict[int, str] = {
+    op.ADD: '+', op.SUB: '-', op.MUL: '*', op.DIV: '/', op.MOD: '%', op.BIT_AND: '&', op.BIT_OR: '|',
+    op.BIT_XOR: '^', op.SHL: '<<', op.SHR: '>>', op.EQ: '==', op.NE: '!=', op.LT: '<', op.GT: '>', op.LE: '<=',
+    op.GE: '>=', op.NEG: '-', op.POS: '+', op.NOT: '!', op.INVERT: '~',
+}
+
+_NUMBERS = frozenset((int, float, bool))
+_INTEGERS = frozenset((int, bool))
+_ORDERED = frozenset((int, float, bool, str))
+
+# endregion (constants)
+# ---------------------------------------------------------
+# region CLASSES
+
+
+class Instance:
+    """An object of a minilang class; its fields are laid out by the class, base class fields first"""
+
+    __slots__ = 'cls', 'fields'
+
+    def __init__(self, cls: "_Class", fields: List[Any]):
+        self.cls: _Class = cls
+        self.fields: List[Any] = fields
+
+    def __repr__(self) -> str:
+        return f"<{self.cls.name} instance>"
+
+
+class _Namespace:
+    """The values of an enumeration"""
+
+    __slots__ = 'name', 'values'
+
+    def __init__(self, name: str, values: Dict[str, Any]):
+        self.name: str = name
+        self.values: Dict[str, Any] = values
+
+    def __repr__(self) -> str:
+        return f"<enum {self.name}>"
+
+
+class _Class:
+    """A linked class: the layout of its instances and its routines, inherited ones included"""
+
+    __slots__ = 'name', 'info', 'module', 'base', 'offsets', 'defaults', 'getters', 'setters', 'methods', \
+        'operators', 'constructors', 'initializers', 'statics', 'linked'
+
+    def __init__(self, info: ClassInfo, module: "_Module"):
+        self.name: str = info.name
+        self.info: ClassInfo = info
+        self.module: _Module = module
+        self.base: Optional[_Class] = None
+        self.offsets: Dict[str, int] = {}
+        self.defaults: List[Any] = []
+        self.getters: Dict[str, _Function] = {}
+        self.setters: Dict[str, _Function] = {}
+        self.methods: Dict[Tuple[str, int], _Function] = {}
+        self.operators: Dict[Tuple[str, int], _Function] = {}
+        self.constructors: Dict[int, _Function] = {}
+        self.initializers: List[_Function] = []
+        self.statics: Dict[str, Any] = {}
+        self.linked: bool = False
+
+    def __repr__(self) -> str:
+        return f"<class {self.name}>"
+
+    def holder(self, name: str) -> Optional[Dict[str, Any]]:
+        """Finds the static storage of a name, in this class or in its bases"""
+        cls = self
+        while cls is not None:
+            if name in cls.statics:
+                return cls.statics
+            cls = cls.base
+        return None
+
+
+class _Frame(list):
+    """The activation record of a routine: its operand stack, which it is, and its local banks
+
+    Frames are sized once from the routine's frame offsets and pooled, so
+    calls reuse them rather than allocating.
+    """
+
+    __slots__ = 'ints', 'floats', 'objects', 'banks', 'result'
+
+    def __init__(self, sizes: Tuple[int, int, int]):
+        super().__init__()
+        self.ints: array = array('q', bytes(8 * sizes[BANK_INT]))
+        self.floats: array = array('d', bytes(8 * sizes[BANK_FLOAT]))
+        self.objects: List[Any] = [None] * sizes[BANK_OBJECT]
+        self.banks: Tuple[Any, Any, Any] = (self.ints, self.floats, self.objects)
+        self.result: Any = None
+
+
+class _Function:
+    """A routine, linked to its module and class; its code is decoded on its first call"""
+
+    __slots__ = 'routine', 'module', 'owner', 'name', 'arity', 'this', 'parameters', 'code', 'pool'
+
+    def __init__(self, routine: Routine, module: "_Module", owner: Optional[_Class] = None):
+        self.routine: Routine = routine
+        self.module: _Module = module
+        self.owner: Optional[_Class] = owner
+        self.name: str = f"{routine.owner}.{routine.name}" if routine.owner else routine.name
+        self.arity: int = routine.arity
+        self.this: bool = routine.has_this
+        self.parameters: List[Tuple[int, int]] = routine.parameters
+        self.code: Optional[List[Tuple[Callable, Any]]] = None
+        self.pool: List[_Frame] = []
+
+    def __repr__(self) -> str:
+        return f"<routine {self.name}/{self.arity}>"
+
+
+class _Module:
+    """A linked module: its globals, its functions by name and arity, and the modules of its imports"""
+
+    __slots__ = 'code', 'globals', 'functions', 'classes', 'routines', 'aliases', 'key'
+
+    def __init__(self, code: CodeModule):
+        self.code: CodeModule = code
+        self.globals: Dict[str, Any] = {}
+        self.functions: Dict[Tuple[str, int], _Function] = {}
+        self.classes: Dict[str, _Class] = {}
+        self.routines: List[Optional[_Function]] = [None] * len(code.routines)
+        # imported names, mapped to the module defining them
+        self.aliases: Dict[str, _Module] = {}
+        self.key: str = os.path.splitext(code.filename.replace(os.sep, '/'))[0]
+
+    def owner(self, name: str) -> "_Module":
+        """Gets the module defining a global name"""
+        return self.aliases.get(name, self)
+
+
+class Machine:
+    """Runs translated modules
+
+    Modules are linked when added: classes get their instance layout and
+    their inherited routines, and imports are bound to the modules defining
+    them. Each routine is decoded on its first call into (handler, argument)
+    pairs, the handlers being bound methods of the machine looked up by
+    opcode in a dispatch table, and the arguments resolved ahead of time:
+    constants to their value, calls to the routine or class they call, and
+    so on. Locals live in the int, float and object banks of pooled frames,
+    sized from the translator's frame offsets.
+    """
+
+    __slots__ = '_modules', '_output', '_handlers'
+
+    def __init__(self, modules: Iterable[CodeModule] = (), output: Optional[TextIO] = None):
+        self._modules: List[_Module] = []
+        self._output: Optional[TextIO] = output
+        handlers: List[Optional[Callable]] = [None] * len(op.OPNAMES)
+        for code, name in enumerate(op.OPNAMES):
+            handlers[code] = getattr(self, f"_op_{name.lower()}", None)
+        self._handlers: List[Optional[Callable]] = handlers
+        for module in modules:
+            self.add(module)
+
+    def __str__(self) -> str:
+        return f"[ Machine | {len(self._modules)} modules ]"
+
+    # region METHODS
+
+    def add(self, code: CodeModule) -> None:
+        """Links a module; the modules it imports must have been added before"""
+        module = _Module(code)
+        for index, routine in enumerate(code.routines):
+            if not routine.owner:
+                module.routines[index] = _Function(routine, module)
+        for name, kind, index in code.globals:
+            if kind == GK_FUNCTION:
+                module.functions[(name, code.routines[index].arity)] = module.routines[index]
+            elif kind == GK_CLASS:
+                info = code.classes[index]
+                cls = module.classes[name] = module.globals[name] = _Class(info, module)
+                positions = info.routines + [info.initializer]
+                for _, getter, setter in info.properties:
+                    positions.extend((getter, setter))
+                for position in positions:
+                    if position >= 0:
+                        module.routines[position] = _Function(code.routines[position], module, cls)
+            elif kind == GK_ENUM:
+                enum_name, members = code.enums[index]
+                module.globals[name] = _Namespace(enum_name, {member: code.constants[constant]
+                                                              for member, constant in members})
+        for path, names in code.imports:
+            imported = self._find(path)
+            if imported is None:
+                continue
+            for name in names:
+                defining = imported.owner(name)
+                module.aliases[name] = defining
+                if name in defining.classes:
+                    module.classes[name] = defining.classes[name]
+                for (function, arity), value in defining.functions.items():
+                    if function == name:
+                        module.functions[(name, arity)] = value
+        for cls in module.classes.values():
+            self._link(cls, [])
+        self._modules.append(module)
+
+    def _find(self, path: str) -> Optional[_Module]:
+        path = path.replace(os.sep, '/')
+        for module in reversed(self._modules):
+            if module.key == path or module.key.endswith('/' + path):
+                return module
+        return None
+
+    def _link(self, cls: _Class, linking: List[_Class]) -> None:
+        # lays a class out after its base class
+        if cls.linked:
+            return
+        if cls in linking:
+            raise ExecutionError(f"Class {cls.name} inherits from itself")
+        info = cls.info
+        module = cls.module
+        for name in info.bases:
+            base = module.classes.get(name)
+            if base is not None:
+                self._link(base, linking + [cls])
+                cls.base = base
+                break
+        base = cls.base
+        if base is not None:
+            cls.offsets.update(base.offsets)
+            cls.defaults.extend(base.defaults)
+            cls.getters.update(base.getters)
+            cls.setters.update(base.setters)
+            cls.methods.update(base.methods)
+            cls.operators.update(base.operators)
+            cls.initializers.extend(base.initializers)
+        for name, bank in info.fields:
+            cls.offsets[name] = len(cls.defaults)
+            cls.defaults.append(BANK_DEFAULTS[bank])
+        for name, bank in info.statics:
+            cls.statics[name] = BANK_DEFAULTS[bank]
+        for name, getter, setter in info.properties:
+            if getter >= 0:
+                cls.getters[name] = module.routines[getter]
+            if setter >= 0:
+                cls.setters[name] = module.routines[setter]
+        for index in info.routines:
+            function = module.routines[index]
+            kind = function.routine.kind
+            if kind == RK_CONSTRUCTOR:
+                cls.constructors[function.arity] = function
+            elif kind == RK_OPERATOR:
+                cls.operators[(function.routine.name, function.arity)] = function
+            elif kind == RK_METHOD:
+                cls.methods[(function.routine.name, function.arity)] = function
+        if info.initializer >= 0:
+            cls.initializers.append(module.routines[info.initializer])
+        cls.linked = True
+
+    def run(self, entry: str = 'main', arguments: Iterable[Any] = ()) -> Tuple[Any, Optional[MinilangError]]:
+        """Initializes the modules and calls a function of the last one
+
+        :param entry: The function name
+        :param arguments: Its arguments
+        :return: What the function returned and None, or None and the error that stopped the program
+        """
+        if not self._modules:
+            return None, ExecutionError("No modules to run")
+        arguments = list(arguments)
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(max(limit, MIN_RECURSION_LIMIT))
+        try:
+            for module in self._modules:
+                if module.code.init >= 0:
+                    self._call(module.routines[module.code.init], None, [])
+            function = self._modules[-1].functions.get((entry, len(arguments)))
+            if function is None:
+                return None, ExecutionError(f"No function {entry} taking {len(arguments)} arguments")
+            return self._call(function, None, arguments), None
+        except ExecutionError as error:
+            return None, error
+        except RecursionError:
+            return None, ExecutionError("Stack overflow")
+        finally:
+            sys.setrecursionlimit(limit)
+
+    def _call(self, function: _Function, this: Any, arguments: List[Any]) -> Any:
+        """Runs a routine in a frame of its pool"""
+        code = function.code
+        if code is None:
+            code = self._decode(function)
+        pool = function.pool
+        frame = pool.pop() if pool else _Frame(function.routine.frame)
+        if function.this:
+            frame.objects[0] = this
+        banks = frame.banks
+        for (bank, slot), value in zip(function.parameters, arguments):
+            try:
+                banks[bank][slot] = value
+            except TypeError:
+                banks[bank][slot] = self._convert(bank, value)
+        pc = 0
+        try:
+            while pc >= 0:
+                handler, argument = code[pc]
+                pc = handler(frame, argument, pc + 1)
+        except ExecutionError as error:
+            frame.clear()
+            error.trace.append(self._where(function, pc))
+            raise
+        except (TypeError, ValueError, OverflowError, ZeroDivisionError, AttributeError, KeyError, IndexError) as exc:
+            frame.clear()
+            error = ExecutionError(self._describe(exc))
+            error.trace.append(self._where(function, pc))
+            raise error from None
+        result = frame.result
+        frame.result = None
+        pool.append(frame)
+        return result
+
+    @staticmethod
+    def _convert(bank: int, value: Any) -> Any:
+        if bank == BANK_INT and isinstance(value, (bool, float)):
+            return int(value)
+        if bank == BANK_FLOAT and isinstance(value, bool):
+            return float(value)
+        raise ExecutionError(f"Can't store {text_of(value)} in {'an int' if bank == BANK_INT else 'a float'} variable")
+
+    @staticmethod
+    def _where(function: _Function, pc: int) -> str:
+        return f"{function.module.code.filename}:{function.routine.line_of(pc)} in {function.name}"
+
+    @staticmethod
+    def _describe(exc: Exception) -> str:
+        if isinstance(exc, ZeroDivisionError):
+            return "Division by zero"
+        if isinstance(exc, OverflowError):
+            return "Integer overflow"
+        return f"{type(exc).__name__}: {exc}"
+
+    def _decode(self, function: _Function) -> List[Tuple[Callable, Any]]:
+        """Decodes the code of a routine into handlers and resolved arguments"""
+        module = function.module
+        code = module.code
+        handlers = self._handlers
+        decoded: List[Tuple[Callable, Any]] = []
+        for opcode, argument in op.decode(function.routine.code):
+            handler = handlers[opcode]
+            try:
+                argument = self._resolve(opcode, argument, function)
+            except ExecutionError as error:
+                handler, argument = self._op_fail, error.message
+            if handler is None:
+                handler, argument = self._op_fail, f"Unknown opcode {opcode} in {code.filename}"
+            decoded.append((handler, argument))
+        function.code = decoded
+        return decoded
+
+    def _resolve(self, opcode: int, argument: int, function: _Function) -> Any:
+        module = function.module
+        code = module.code
+        if opcode == op.LOAD_CONST:
+            return code.constants[argument]
+        if opcode in (op.LOAD_GLOBAL, op.STORE_GLOBAL):
+            name = code.names[argument]
+            return module.owner(name).globals, name
+        if opcode in (op.GET_MEMBER, op.SET_MEMBER):
+            return code.names[argument]
+        if opcode in (op.GET_STATIC, op.SET_STATIC):
+            owner, name = code.refs[argument]
+            cls = module.classes.get(owner)
+            holder = cls.holder(name) if cls is not None else None
+            if holder is None:
+                raise ExecutionError(f"Undefined static member {owner}.{name}")
+            return holder, name
+        if opcode == op.GET_SUPER:
+            owner, name = code.refs[argument]
+            return self._base(module, owner), name
+        if opcode == op.CALL_GLOBAL:
+            name, count = code.refs[argument]
+            target = module.functions.get((name, count)) or module.classes.get(name)
+            if target is None:
+                raise ExecutionError(f"Undefined function {name} taking {count} arguments")
+            return target, count
+        if opcode == op.CALL_METHOD:
+            name, count = code.refs[argument]
+            return (name, count), count
+        if opcode == op.CALL_SUPER:
+            owner, name, count = code.refs[argument]
+            base = self._base(module, owner)
+            target = base.constructors.get(count) if not name else base.methods.get((name, count))
+            if target is None and (name or count):
+                raise ExecutionError(f"{base.name} has no {name or 'constructor'} taking {count} arguments")
+            return target, count
+        if opcode == op.REPEAT_NEXT:
+            return argument >> 16, argument & 0xffff
+        return argument
+
+    @staticmethod
+    def _base(module: _Module, owner: str) -> _Class:
+        cls = module.classes.get(owner)
+        if cls is None or cls.base is None:
+            raise ExecutionError(f"{owner} has no base class")
+        return cls.base
+
+    def _new(self, cls: _Class, arguments: List[Any]) -> Instance:
+        instance = Instance(cls, list(cls.defaults))
+        for initializer in cls.initializers:
+            self._call(initializer, instance, [])
+        constructor = cls.constructors.get(len(arguments))
+        if constructor is not None:
+            self._call(constructor, instance, arguments)
+        elif arguments or cls.constructors:
+            raise ExecutionError(f"{cls.name} has no constructor taking {len(arguments)} arguments")
+        return instance
+
+    def _invoke(self, target: Any, arguments: List[Any]) -> Any:
+        # what CALL_GLOBAL calls: a function, or a class to instantiate
+        if type(target) is _Function:
+            return self._call(target, None, arguments)
+        return self._new(target, arguments)
+
+    def _get(self, target: Any, name: str) -> Any:
+        if type(target) is Instance:
+            cls = target.cls
+            offset = cls.offsets.get(name)
+            if offset is not None:
+                return target.fields[offset]
+            getter = cls.getters.get(name)
+            if getter is not None:
+                return self._call(getter, target, [])
+            target = cls
+        if type(target) is _Class:
+            holder = target.holder(name)
+            if holder is not None:
+                return holder[name]
+        elif type(target) is _Namespace and name in target.values:
+            return target.values[name]
+        raise ExecutionError(f"{text_of(target)} has no member {name}")
+
+    def _set(self, target: Any, name: str, value: Any) -> None:
+        if type(target) is Instance:
+            cls = target.cls
+            offset = cls.offsets.get(name)
+            if offset is not None:
+                target.fields[offset] = value
+                return
+            setter = cls.setters.get(name)
+            if setter is not None:
+                self._call(setter, target, [value])
+                return
+            target = cls
+        if type(target) is _Class:
+            holder = target.holder(name)
+            if holder is not None:
+                holder[name] = value
+                return
+        raise ExecutionError(f"{text_of(target)} has no member {name} to set")
+
+    def _operator(self, opcode: int, left: Any, right: Any) -> Any:
+        """Applies an operator to values that are not both numbers, through the operator methods of instances
+
+        A binary operator method of the left operand is called with the right
+        one, and with False if it takes a second 'reversed' parameter; failing
+        that, the method of the right operand is called with the left one and
+        True. Overloads whose parameter can't hold the operand are skipped.
+        """
+        symbol = OPERATOR_SYMBOLS[opcode]
+        if type(left) is Instance:
+            operators = left.cls.operators
+            function = operators.get((symbol, 2))
+            if function is not None and _accepts(function, right):
+                return self._call(function, left, [right, False])
+            function = operators.get((symbol, 1))
+            if function is not None and _accepts(function, right):
+                return self._call(function, left, [right])
+        if type(right) is Instance:
+            function = right.cls.operators.get((symbol, 2))
+            if function is not None and _accepts(function, left):
+                return self._call(function, right, [left, True])
+        if opcode == op.ADD and (type(left) is str or type(right) is str):
+            return text_of(left) + text_of(right)
+        if opcode == op.EQ:
+            return left == right
+        if opcode == op.NE:
+            # without a != method, the == method decides
+            return not self._operator(op.EQ, left, right)
+        raise ExecutionError(f"Unsupported operands for {symbol}: {text_of(left)} and {text_of(right)}")
+
+    def _unary_operator(self, opcode: int, operand: Any) -> Any:
+        symbol = OPERATOR_SYMBOLS[opcode]
+        if type(operand) is Instance:
+            function = operand.cls.operators.get((symbol, 0))
+            if function is not None:
+                return self._call(function, operand, [])
+        raise ExecutionError(f"Unsupported operand for unary {symbol}: {text_of(operand)}")
+
+    # endregion
+
+    # region HANDLERS
+
+    # Each handler takes the frame, the resolved argument and the index of
+    # the next instruction, and returns the index of the instruction to run
+    # next, or -1 to return from the routine.
+
+    def _op_fail(self, frame: _Frame, message: str, following: int) -> int:
+        raise ExecutionError(message)
+
+    def _op_nop(self, frame: _Frame, argument: int, following: int) -> int:
+        return following
+
+    def _op_pop(self, frame: _Frame, argument: int, following: int) -> int:
+        frame.pop()
+        return following
+
+    def _op_dup(self, frame: _Frame, argument: int, following: int) -> int:
+        frame.append(frame[-1])
+        return following
+
+    def _op_dup_under(self, frame: _Frame, argument: int, following: int) -> int:
+        top = frame[-1]
+        frame[-1] = frame[-2]
+        frame[-2] = top
+        frame.append(top)
+        return following
+
+    def _op_load_const(self, frame: _Frame, value: Any, following: int) -> int:
+        frame.append(value)
+        return following
+
+    def _op_load_int(self, frame: _Frame, slot: int, following: int) -> int:
+        frame.append(frame.ints[slot])
+        return following
+
+    def _op_store_int(self, frame: _Frame, slot: int, following: int) -> int:
+        value = frame.pop()
+        try:
+            frame.ints[slot] = value
+        except TypeError:
+            frame.ints[slot] = self._convert(BANK_INT, value)
+        return following
+
+    def _op_load_float(self, frame: _Frame, slot: int, following: int) -> int:
+        frame.append(frame.floats[slot])
+        return following
+
+    def _op_store_float(self, frame: _Frame, slot: int, following: int) -> int:
+        value = frame.pop()
+        try:
+            frame.floats[slot] = value
+        except TypeError:
+            frame.floats[slot] = self._convert(BANK_FLOAT, value)
+        return following
+
+    def _op_load_object(self, frame: _Frame, slot: int, following: int) -> int:
+        frame.append(frame.objects[slot])
+        return following
+
+    def _op_store_object(self, frame: _Frame, slot: int, following: int) -> int:
+        frame.objects[slot] = frame.pop()
+        return following
+
+    def _op_inc_int(self, frame: _Frame, slot: int, following: int) -> int:
+        frame.ints[slot] += 1
+        return following
+
+    def _op_dec_int(self, frame: _Frame, slot: int, following: int) -> int:
+        frame.ints[slot] -= 1
+        return following
+
+    def _op_load_global(self, frame: _Frame, argument: Tuple[Dict[str, Any], str], following: int) -> int:
+        values, name = argument
+        try:
+            frame.append(values[name])
+        except KeyError:
+            raise ExecutionError(f"Undefined global {name}") from None
+        return following
+
+    def _op_store_global(self, frame: _Frame, argument: Tuple[Dict[str, Any], str], following: int) -> int:
+        values, name = argument
+        values[name] = frame.pop()
+        return following
+
+    def _op_get_member(self, frame: _Frame, name: str, following: int) -> int:
+        target = frame[-1]
+        if type(target) is Instance:
+            offset = target.cls.offsets.get(name)
+            if offset is not None:
+                frame[-1] = target.fields[offset]
+                return following
+        frame[-1] = self._get(target, name)
+        return following
+
+    def _op_set_member(self, frame: _Frame, name: str, following: int) -> int:
+        value = frame.pop()
+        target = frame.pop()
+        if type(target) is Instance:
+            offset = target.cls.offsets.get(name)
+            if offset is not None:
+                target.fields[offset] = value
+                return following
+        self._set(target, name, value)
+        return following
+
+    def _op_get_static(self, frame: _Frame, argument: Tuple[Dict[str, Any], str], following: int) -> int:
+        holder, name = argument
+        frame.append(holder[name])
+        return following
+
+    def _op_set_static(self, frame: _Frame, argument: Tuple[Dict[str, Any], str], following: int) -> int:
+        holder, name = argument
+        holder[name] = frame.pop()
+        return following
+
+    def _op_get_super(self, frame: _Frame, argument: Tuple[_Class, str], following: int) -> int:
+        base, name = argument
+        this = frame[-1]
+        getter = base.getters.get(name)
+        if getter is not None:
+            frame[-1] = self._call(getter, this, [])
+        else:
+            frame[-1] = self._get(this, name)
+        return following
+
+    def _op_call_global(self, frame: _Frame, argument: Tuple[Any, int], following: int) -> int:
+        target, count = argument
+        if count:
+            arguments = frame[-count:]
+            del frame[-count:]
+        else:
+            arguments = []
+        if type(target) is _Function:
+            frame.append(self._call(target, None, arguments))
+        else:
+            frame.append(self._new(target, arguments))
+        return following
+
+    def _op_call_method(self, frame: _Frame, argument: Tuple[Tuple[str, int], int], following: int) -> int:
+        key, count = argument
+        if count:
+            arguments = frame[-count:]
+            del frame[-count:]
+        else:
+            arguments = []
+        receiver = frame[-1]
+        if type(receiver) is Instance:
+            function = receiver.cls.methods.get(key)
+            if function is not None:
+                frame[-1] = self._call(function, receiver, arguments)
+                return following
+        elif type(receiver) is _Class:
+            function = receiver.methods.get(key)
+            if function is not None and not function.this:
+                frame[-1] = self._call(function, None, arguments)
+                return following
+        raise ExecutionError(f"{text_of(receiver)} has no method {key[0]} taking {count} arguments")
+
+    def _op_call_super(self, frame: _Frame, argument: Tuple[Optional[_Function], int], following: int) -> int:
+        function, count = argument
+        if count:
+            arguments = frame[-count:]
+            del frame[-count:]
+        else:
+            arguments = []
+        # a base class without constructors is constructed by its initializers alone
+        frame[-1] = self._call(function, frame[-1], arguments) if function is not None else None
+        return following
+
+    def _op_return(self, frame: _Frame, argument: int, following: int) -> int:
+        frame.result = frame.pop()
+        frame.clear()
+        return -1
+
+    def _op_return_none(self, frame: _Frame, argument: int, following: int) -> int:
+        frame.result = None
+        frame.clear()
+        return -1
+
+    def _op_jump(self, frame: _Frame, target: int, following: int) -> int:
+        return target
+
+    def _op_jump_if_false(self, frame: _Frame, target: int, following: int) -> int:
+        return following if frame.pop() else target
+
+    def _op_jump_if_true(self, frame: _Frame, target: int, following: int) -> int:
+        return target if frame.pop() else following
+
+    def _op_jump_if_false_or_pop(self, frame: _Frame, target: int, following: int) -> int:
+        if frame[-1]:
+            frame.pop()
+            return following
+        return target
+
+    def _op_jump_if_true_or_pop(self, frame: _Frame, target: int, following: int) -> int:
+        if frame[-1]:
+            return target
+        frame.pop()
+        return following
+
+    def _op_repeat_next(self, frame: _Frame, argument: Tuple[int, int], following: int) -> int:
+        slot, target = argument
+        ints = frame.ints
+        if ints[slot] > 0:
+            ints[slot] -= 1
+            return following
+        return target
+
+    def _op_print(self, frame: _Frame, count: int, following: int) -> int:
+        values = frame[-count:] if count else []
+        del frame[len(frame) - count:]
+        print(*(text_of(value) for value in values), file=self._output or sys.stdout)
+        return following
+
+    def _op_assert(self, frame: _Frame, argument: int, following: int) -> int:
+        if not frame.pop():
+            raise ExecutionError("Assertion failed")
+        return following
+
+    def _op_add(self, frame: _Frame, argument: int, following: int) -> int:
+        right = frame.pop()
+        left = frame[-1]
+        if type(left) in _NUMBERS and type(right) in _NUMBERS:
+            frame[-1] = left + right
+        else:
+            frame[-1] = self._operator(op.ADD, left, right)
+        return following
+
+    def _op_sub(self, frame: _Frame, argument: int, following: int) -> int:
+        right = frame.pop()
+        left = frame[-1]
+        if type(left) in _NUMBERS and type(right) in _NUMBERS:
+            frame[-1] = left - right
+        else:
+            frame[-1] = self._operator(op.SUB, left, right)
+        return following
+
+    def _op_mul(self, frame: _Frame, argument: int, following: int) -> int:
+        right = frame.pop()
+        left = frame[-1]
+        if type(left) in _NUMBERS and type(right) in _NUMBERS:
+            frame[-1] = left * right
+        else:
+            frame[-1] = self._operator(op.MUL, left, right)
+        return following
+
+    def _op_div(self, frame: _Frame, argument: int, following: int) -> int:
+        right = frame.pop()
+        left = frame[-1]
+        if type(left) is int and type(right) is int:
+            # integer division truncates toward zero
+            quotient = abs(left) // abs(right)
+            frame[-1] = -quotient if (left < 0) != (right < 0) else quotient
+        elif type(left) in _NUMBERS and type(right) in _NUMBERS:
+            frame[-1] = left / right
+        else:
+            frame[-1] = self._operator(op.DIV, left, right)
+        return following
+
+    def _op_mod(self, frame: _Frame, argument: int, following: int) -> int:
+        right = frame.pop()
+        left = frame[-1]
+        if type(left) is int and type(right) is int:
+            # the remainder has the sign of the dividend, as the quotient truncates
+            remainder = abs(left) % abs(right)
+            frame[-1] = -remainder if left < 0 else remainder
+        elif type(left) in _NUMBERS and type(right) in _NUMBERS:
+            frame[-1] = math.fmod(left, right)
+        else:
+            frame[-1] = self._operator(op.MOD, left, right)
+        return following
+
+    def _op_bit_and(self, frame: _Frame, argument: int, following: int) -> int:
+        right = frame.pop()
+        left = frame[-1]
+        frame[-1] = left & right if type(left) in _INTEGERS and type(right) in _INTEGERS \
+            else self._operator(op.BIT_AND, left, right)
+        return following
+
+    def _op_bit_or(self, frame: _Frame, argument: int, following: int) -> int:
+        right = frame.pop()
+        left = frame[-1]
+        frame[-1] = left | right if type(left) in _INTEGERS and type(right) in _INTEGERS \
+            else self._operator(op.BIT_OR, left, right)
+        return following
+
+    def _op_bit_xor(self, frame: _Frame, argument: int, following: int) -> int:
+        right = frame.pop()
+        left = frame[-1]
+        frame[-1] = left ^ right if type(left) in _INTEGERS and type(right) in _INTEGERS \
+            else self._operator(op.BIT_XOR, left, right)
+        return following
+
+    def _op_shl(self, frame: _Frame, argument: int, following: int) -> int:
+        right = frame.pop()
+        left = frame[-1]
+        frame[-1] = left << right if type(left) is int and type(right) is int \
+            else self._operator(op.SHL, left, right)
+        return following
+
+    def _op_shr(self, frame: _Frame, argument: int, following: int) -> int:
+        right = frame.pop()
+        left = frame[-1]
+        frame[-1] = left >> right if type(left) is int and type(right) is int \
+            else self._operator(op.SHR, left, right)
+        return following
+
+    def _op_eq(self, frame: _Frame, argument: int, following: int) -> int:
+        right = frame.pop()
+        left = frame[-1]
+        frame[-1] = self._operator(op.EQ, left, right) if type(left) is Instance or type(right) is Instance \
+            else left == right
+        return following
+
+    def _op_ne(self, frame: _Frame, argument: int, following: int) -> int:
+        right = frame.pop()
+        left = frame[-1]
+        frame[-1] = self._operator(op.NE, left, right) if type(left) is Instance or type(right) is Instance \
+            else left != right
+        return following
+
+    def _op_lt(self, frame: _Frame, argument: int, following: int) -> int:
+        right = frame.pop()
+        left = frame[-1]
+        frame[-1] = left < right if type(left) in _ORDERED and type(right) in _ORDERED \
+            else self._operator(op.LT, left, right)
+        return following
+
+    def _op_gt(self, frame: _Frame, argument: int, following: int) -> int:
+        right = frame.pop()
+        left = frame[-1]
+        frame[-1] = left > right if type(left) in _ORDERED and type(right) in _ORDERED \
+            else self._operator(op.GT, left, right)
+        return following
+
+    def _op_le(self, frame: _Frame, argument: int, following: int) -> int:
+        right = frame.pop()
+        left = frame[-1]
+        frame[-1] = left <= right if type(left) in _ORDERED and type(right) in _ORDERED \
+            else self._operator(op.LE, left, right)
+        return following
+
+    def _op_ge(self, frame: _Frame, argument: int, following: int) -> int:
+        right = frame.pop()
+        left = frame[-1]
+        frame[-1] = left >= right if type(left) in _ORDERED and type(right) in _ORDERED \
+            else self._operator(op.GE, left, right)
+        return following
+
+    def _op_neg(self, frame: _Frame, argument: int, following: int) -> int:
+        operand = frame[-1]
+        frame[-1] = -operand if type(operand) in _NUMBERS else self._unary_operator(op.NEG, operand)
+        return following
+
+    def _op_pos(self, frame: _Frame, argument: int, following: int) -> int:
+        operand = frame[-1]
+        if type(operand) not in _NUMBERS:
+            frame[-1] = self._unary_operator(op.POS, operand)
+        return following
+
+    def _op_not(self, frame: _Frame, argument: int, following: int) -> int:
+        operand = frame[-1]
+        frame[-1] = self._unary_operator(op.NOT, operand) if type(operand) is Instance \
+            and ('!', 0) in operand.cls.operators else not operand
+        return following
+
+    def _op_invert(self, frame: _Frame, argument: int, following: int) -> int:
+        operand = frame[-1]
+        frame[-1] = ~operand if type(operand) in _INTEGERS else self._unary_operator(op.INVERT, operand)
+        return following
+
+    # endregion (handlers)
+
+
+# endregion (classes)
+# ---------------------------------------------------------
+# region FUNCTIONS
+
+
+def _accepts(function: _Function, value: Any) -> bool:
+    # whether the first parameter of a routine can hold a value
+    return function.parameters[0][0] == BANK_OBJECT or type(value) in _NUMBERS
+
+
+def text_of(value: Any) -> str:
+    """Formats a value as minilang prints it"""
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    if value is None:
+        return 'null'
+    return value if type(value) is str else repr(value)
+
+
+def run_project(path: str, preset: str = 'default', entry: str = 'main', output: Optional[TextIO] = None
+                ) -> Tuple[Any, Optional[MinilangError]]:
+    """Builds a project to bytecode and runs its main module
+
+    :param path: The project directory or configuration file
+    :param preset: The build preset
+    :param entry: The function of the main module to call
+    :param output: Where `print` writes; standard output by default
+    :return: What the function returned and None, or None and the first error
+    """
+    modules, error = build_program(path, BytecodeTarget, preset)
+    if error:
+        return None, error
+    # the entry point is looked up in the last module
+    return Machine(modules, output).run(entry)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    return run_command(sys.argv[1:] if argv is None else argv, BytecodeTarget, lambda modules: Machine(modules).run())
+
+
+# endregion (functions)
+# ---------------------------------------------------------
+# region ENTRYPOINT
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+# endregion (entrypoint)
@@ -29,8 +29,13 @@
 
 # region IMPORTS
 
+import os
+import mmap
 
-from typing import Optional
+from array import array
+from bisect import bisect_right
+
+from typing import Optional, Any, Union
 
 # endregion (imports)
 # ---------------------------------------------------------
@@ -39,7 +44,9 @@ from typing import Optional
 
 __all__ = [
     'Source',
+    'MappedSource',
     'SourceLocation',
+    'code_point',
 ]
 
 
@@ -49,6 +56,8 @@ __all__ = [
 
 class Source:
 
+    _newline: Any = '\n'
+
     # region CLASSMETHODS
 
     @classmethod
@@ -63,6 +72,7 @@ class Source:
     def __init__(self, filename: str, code: Optional[str] = None):
         self.filename: str = filename
         self.code: Optional[str] = code
+        self._line_starts: Optional[array] = None
 
     def __len__(self) -> int:
         return self.code.__len__()
@@ -83,24 +93,158 @@ class Source:
     def loaded(self) -> bool:
         return self.code is not None
 
+    @property
+    def line_starts(self) -> array:
+        """Gets the index of the first character of every line, built on first use"""
+        if self._line_starts is None:
+            code = self.code
+            newline = self._newline
+            starts = array('i', [0])
+            index = code.find(newline)
+            while index >= 0:
+                starts.append(index + 1)
+                index = code.find(newline, index + 1)
+            self._line_starts = starts
+        return self._line_starts
+
+    # endregion
+
+    # region METHODS
+
+    def replace(self, start: int, stop: int, text: str) -> int:
+        """Replaces a range of the code, as an editor would
+
+        :param start: The index of the first replaced character
+        :param stop: The index after the last replaced character
+        :param text: The replacement text
+        :return: The change in length of the code
+        """
+        self.code = self.code[:start] + text + self.code[stop:]
+        self._line_starts = None
+        return len(text) - (stop - start)
+
+    def line_of(self, index: int) -> int:
+        """Gets the line (starting at 1) of a character index"""
+        return bisect_right(self.line_starts, index)
+
+    def column_of(self, index: int) -> int:
+        """Gets the column (starting at 1) of a character index"""
+        starts = self.line_starts
+        return index - starts[bisect_right(starts, index) - 1] + 1
+
+    def line_slice(self, line: int) -> slice:
+        """Gets the start and stop indices of a line, without its line break"""
+        starts = self.line_starts
+        if line < len(starts):
+            return slice(starts[line - 1], starts[line] - 1)
+        return slice(starts[line - 1], len(self.code))
+
+    # endregion (methods)
+
+
+class MappedSource(Source):
+    """A source backed by a read-only memory map of its file
+
+    The file is never read or decoded as a whole: the code is the raw UTF-8
+    bytes, so indices and columns count bytes, and only the slices actually
+    read, like token values and source lines, get decoded. A single character
+    is the whole code point starting at a byte; as the character-driven path of
+    the ``Lexer`` steps one index at a time, these sources are only scanned by a
+    compiled ``Scanner``.
+
+    A lazy source only maps its file when its code is first read, and maps it
+    anew when read again after ``close``; sources kept along with their tokens
+    then hold no file descriptor while no one reads them.
+    """
+
+    _newline: Any = b'\n'
+
+    # region CLASSMETHODS
+
+    @classmethod
+    def load(cls, filename: str, lazy: bool = False) -> "MappedSource":
+        """Maps a source file
+
+        :param filename: The file name
+        :param lazy: Whether to wait for the code to be read to map the file
+        :return: The source
+        :raises OSError: if the file can't be read, when it is mapped
+        """
+        source = cls(filename)
+        source._lazy = lazy
+        if not lazy:
+            source.code = _map(filename)
+        return source
+
+    # endregion
+
+    # region SPECIAL
+
+    def __init__(self, filename: str, code: Optional[Union[bytes, mmap.mmap]] = None):
+        self._lazy: bool = False
+        self._code: Optional[Union[bytes, mmap.mmap]] = None
+        super().__init__(filename, code)
+
+    def __getitem__(self, key) -> Optional[str]:
+        if not self.loaded:
+            return None
+        if isinstance(key, slice):
+            return self.code[key].decode('utf-8', 'replace')
+        code = self.code
+        return code_point(code, key + len(code) if key < 0 else key)
+
+    def __str__(self) -> str:
+        return f"[ '{self.filename}' | { 0 if not self.loaded else len(self.code)} bytes ]"
+
     # endregion
 
+    # region PROPERTIES
+
+    @property
+    def code(self) -> Optional[Union[bytes, mmap.mmap]]:
+        if self._code is None and self._lazy:
+            self._code = _map(self.filename)
+        return self._code
+
+    @code.setter
+    def code(self, code: Optional[Union[bytes, mmap.mmap]]) -> None:
+        self._code = code
+
+    @property
+    def lazy(self) -> bool:
+        return self._lazy
+
+    # endregion
+
+    # region METHODS
+
+    def close(self) -> None:
+        """Releases the memory map; only a lazy source can be read afterwards"""
+        if isinstance(self._code, mmap.mmap):
+            self._code.close()
+        self._code = None
+        self._line_starts = None
+
+    # endregion (methods)
+
 
 class SourceLocation:
+    """A character index in a source code
+
+    Only the index is stored; line, column and line slice are resolved on demand
+    through the line index of the source.
+    """
 
     # region SPECIAL
 
-    __slots__ = '_index', '_line_slice', '_line', '_column', '_source'
+    __slots__ = '_index', '_source'
 
-    def __init__(self, source: Source, line_slice: slice, index: int = 0, line: int = 0, column: int = 0):
+    def __init__(self, source: Source, index: int = 0):
         self._index: int = index
-        self._line_slice: slice = line_slice
-        self._line: int = line
-        self._column: int = column
         self._source: Source = source
 
     def __str__(self):
-        return f"{self._line}:{self._column}"
+        return f"{self.line}:{self.column}"
 
     # endregion
 
@@ -114,17 +258,17 @@ class SourceLocation:
     @property
     def line_slice(self):
         """Gets this location's line start and stop indices in the source code string"""
-        return self._line_slice
+        return self._source.line_slice(self.line)
 
     @property
     def line(self):
         """Gets this location line"""
-        return self._line
+        return self._source.line_of(self._index)
 
     @property
     def column(self):
         """Gets this location column"""
-        return self._column
+        return self._source.column_of(self._index)
 
     @property
     def source(self):
@@ -139,22 +283,40 @@ class SourceLocation:
 
     # region METHODS
 
-    def advance(self, char: str) -> "SourceLocation":
-        self._index += 1
-        if char == '\n':
-            stop = self.source.code.find(char, self._index + 1)
-            self._line_slice = slice(self._index, stop)
-            self._line += 1
-            self._column = 1
-        else:
-            self._column += 1
-
+    def advance(self, count: int = 1) -> "SourceLocation":
+        self._index += count
         return self
 
     def copy(self) -> "SourceLocation":
-        return SourceLocation(
-            self._source, slice(self._line_slice.start, self._line_slice.stop), self._index, self._line, self._column)
+        return SourceLocation(self._source, self._index)
 
     # endregion (methods)
 
 # endregion (classes)
+# ---------------------------------------------------------
+# region FUNCTIONS
+
+
+def code_point(code: Union[bytes, mmap.mmap], index: int) -> str:
+    """Decodes the character whose UTF-8 sequence starts at a byte
+
+    :param code: The UTF-8 bytes
+    :param index: The index of the first byte of the character
+    :return: The character; U+FFFD if the bytes are not a valid sequence
+    """
+    lead: int = code[index]
+    if lead < 0x80:
+        return chr(lead)
+    # the length of a UTF-8 sequence is given by its leading byte
+    width = 2 if lead < 0xe0 else 3 if lead < 0xf0 else 4
+    return code[index:index + width].decode('utf-8', 'replace')[0]
+
+
+def _map(filename: str) -> Union[bytes, mmap.mmap]:
+    with open(filename, 'rb') as file:
+        # empty files can't be mapped
+        if os.fstat(file.fileno()).st_size == 0:
+            return b''
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+# endregion (functions)
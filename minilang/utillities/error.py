@@ -31,7 +31,8 @@
 
 import sys
 
-from typing import Optional, Any, Union, List, Tuple, Dict, Type
+from minilang.utillities.code import SourceLocation
+from typing import Optional, Any, List, Tuple
 
 # endregion (imports)
 # ---------------------------------------------------------
@@ -39,7 +40,13 @@ from typing import Optional, Any, Union, List, Tuple, Dict, Type
 
 
 __all__ = [
-    '',
+    'MinilangError',
+    'TokenStreamError',
+    'UnexpectedTokenError',
+    'UnexpectedEndOfTokensError',
+    'ParseError',
+    'TranslateError',
+    'ExecutionError',
 ]
 
 
@@ -51,6 +58,100 @@ __all__ = [
 # ---------------------------------------------------------
 # region CLASSES
 
+
+class MinilangError(Exception):
+    """Base class of the exceptions raised by the toolchain
+
+    Carries the location in the source code the error refers to, if any, so
+    whoever catches it can report it without parsing the message.
+    """
+
+    def __init__(self, message: str, location: Optional[SourceLocation] = None):
+        super().__init__(message)
+        self.message: str = message
+        self.location: Optional[SourceLocation] = location
+
+    def __str__(self) -> str:
+        if self.location is None:
+            return self.message
+        filename = self.filename
+        return f"{self.message} at {filename}:{self.location}" if filename else f"{self.message} at {self.location}"
+
+    @property
+    def filename(self) -> Optional[str]:
+        if self.location is None or self.location.source is None:
+            return None
+        return self.location.source.filename
+
+    @property
+    def line(self) -> Optional[int]:
+        return None if self.location is None else self.location.line
+
+    @property
+    def column(self) -> Optional[int]:
+        return None if self.location is None else self.location.column
+
+
+class TokenStreamError(MinilangError):
+    """An error found while consuming the tokens of a ``TokenStream``"""
+
+
+class UnexpectedTokenError(TokenStreamError):
+    """The current token is not one of the expected ones
+
+    `attribute` tells what was tested: 'value', 'kind', 'subkind' or 'code';
+    `expected` holds the accepted values of that attribute and `found` the
+    value of the token.
+    """
+
+    def __init__(self, message: str, location: Optional[SourceLocation] = None, token: Any = None,
+                 expected: Tuple[Any, ...] = (), attribute: str = 'value', found: Any = None):
+        super().__init__(message, location)
+        self.token: Any = token
+        self.expected: Tuple[Any, ...] = expected
+        self.attribute: str = attribute
+        self.found: Any = found
+
+
+class UnexpectedEndOfTokensError(TokenStreamError):
+    """The tokens ended while more were expected"""
+
+
+class ParseError(MinilangError):
+    """The tokens do not follow the grammar; `token` is the index of the offending token"""
+
+    def __init__(self, message: str, location: Optional[SourceLocation] = None, token: Optional[int] = None):
+        super().__init__(message, location)
+        self.token: Optional[int] = token
+
+
+class TranslateError(MinilangError):
+    """The syntax tree holds something the translator can't translate, like an undefined name
+
+    `node` is the syntax tree node the error refers to, if any.
+    """
+
+    def __init__(self, message: str, location: Optional[SourceLocation] = None, node: Any = None):
+        super().__init__(message, location)
+        self.node: Any = node
+
+
+class ExecutionError(MinilangError):
+    """An error raised while running a program, like a division by zero
+
+    `trace` lists the routines being run when it was raised, innermost first,
+    as "file:line in routine" strings.
+    """
+
+    def __init__(self, message: str, location: Optional[SourceLocation] = None):
+        super().__init__(message, location)
+        self.trace: List[str] = []
+
+    def __str__(self) -> str:
+        text = super().__str__()
+        return f"{text} at {self.trace[0]}" if self.trace and self.location is None else text
+
+
 # endregion (classes)
 # ---------------------------------------------------------
 # region FUNCTIONS
@@ -0,0 +1,101 @@
+# -*- encoding: utf8 -*-
+# ------------------------------------------------------------------------------
+# test_flat.py
+# Created on 18/10/2026
+#
+# The MIT License
+#
+#
+# Copyright 2022 Jorge A. Gomes
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# region IMPORTS
+
+import struct
+
+from minilang.utillities.code import Source
+from minilang.lexing.core import Lexer
+from minilang.parsing.parser import Parser
+from minilang.parsing.flat import HEADER, NODE_TYPES, FlatTree
+from minilang.building.cache import TreeCache
+from tests.test_scanner import CONF, SCANNER
+from typing import List, Tuple
+
+# endregion (imports)
+# ---------------------------------------------------------
+# region CONSTANTS & ENUMS
+
+CODE = "main(): i32 {\n    x: i32 = 1 + 2;\n    print x * 3;\n    return 0;\n}\n"
+
+# endregion (constants)
+# ---------------------------------------------------------
+# region FUNCTIONS
+
+
+def parse(code: str) -> Tuple[FlatTree, List]:
+    source = Source('<test>', code)
+    tokens, error = Lexer(CONF, source, scanner=SCANNER).gen_tokens()
+    assert error is None
+    module, error = Parser(source, tokens).parse()
+    assert error is None
+    return FlatTree.from_node(module), tokens
+
+
+def corrupt(data: bytes, column: int, row: int, value: int) -> bytes:
+    """Overwrites one cell of a serialized tree; columns are tokens, data, children, siblings, then kinds"""
+    count = HEADER.unpack_from(data)[3]
+    if column == 4:
+        offset = HEADER.size + 4 * count * 4 + row
+        return data[:offset] + bytes([value]) + data[offset + 1:]
+    offset = HEADER.size + (column * count + row) * 4
+    return data[:offset] + struct.pack('=i', value) + data[offset + 4:]
+
+
+def test_round_trip():
+    tree, tokens = parse(CODE)
+    loaded = FlatTree.frombytes(tree.tobytes(), len(tokens))
+    assert loaded is not None and [list(column) for column in loaded.columns] == [list(column)
+                                                                                  for column in tree.columns]
+
+
+def test_corrupt_trees_are_rejected():
+    tree, tokens = parse(CODE)
+    data = tree.tobytes()
+    last = len(tree) - 1
+    for column, row, value in ((2, 0, len(tree)), (2, 1, 0), (2, 0, -2), (3, 1, len(tree) + 5), (3, last, 1),
+                               (4, 1, len(NODE_TYPES)), (0, 0, len(tokens)), (0, 0, -7)):
+        assert FlatTree.frombytes(corrupt(data, column, row, value), len(tokens)) is None, (column, row, value)
+    assert FlatTree.frombytes(data[:-1]) is None
+
+
+def test_corrupt_cache_entry_is_a_miss(tmp_path):
+    tree, tokens = parse(CODE)
+    cache = TreeCache(str(tmp_path), CONF)
+    path = cache.store('digest', tree)
+    assert cache.load('digest', token_count=len(tokens)) is not None
+    with open(path, 'rb') as file:
+        data = file.read()
+    with open(path, 'wb') as file:
+        file.write(corrupt(data, 2, 0, len(tree) * 2))
+    assert cache.load('digest', token_count=len(tokens)) is None
+
+
+# endregion (functions)
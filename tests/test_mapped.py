@@ -0,0 +1,92 @@
+# -*- encoding: utf8 -*-
+# ------------------------------------------------------------------------------
+# test_mapped.py
+# Created on 18/10/2026
+#
+# The MIT License
+#
+#
+# Copyright 2022 Jorge A. Gomes
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# region IMPORTS
+
+import re
+
+from minilang.utillities.code import Source, MappedSource
+from minilang.lexing.core import Lexer, Token
+from tests.test_scanner import CONF, SCANNER, random_codes
+from typing import List, Tuple
+
+# endregion (imports)
+# ---------------------------------------------------------
+# region CONSTANTS & ENUMS
+
+# error locations are counted in characters for text and in bytes for mapped sources
+LOCATION = re.compile(r" at \d+:\d+")
+
+# endregion (constants)
+# ---------------------------------------------------------
+# region FUNCTIONS
+
+
+def scan(source: Source, recover: bool) -> Tuple[List[tuple], List[str]]:
+    """Scans a source, giving comparable tokens, located by character, and error messages"""
+    code = source.code
+    offset = (lambda index: index) if isinstance(code, str) else (lambda index: len(code[:index].decode('utf-8')))
+    lexer = Lexer(CONF, source, scanner=SCANNER, recover=recover)
+    if recover:
+        tokens, errors = lexer.recover_tokens()
+    else:
+        tokens, error = lexer.gen_tokens()
+        errors = [error] if error else []
+    return [row(token, offset) for token in tokens], [LOCATION.sub('', error.message) for error in errors]
+
+
+def row(token: Token, offset) -> tuple:
+    return token.kind, token.subkind, offset(token.location.index), token.value, token.base, token.suffix
+
+
+def compare(tmp_path, codes: List[str], recover: bool):
+    filename = str(tmp_path / 'mapped.ml')
+    for code in codes:
+        with open(filename, 'w', encoding='utf-8') as file:
+            file.write(code)
+        source = MappedSource.load(filename)
+        try:
+            assert scan(source, recover) == scan(Source(filename, code), recover), repr(code)
+        finally:
+            source.close()
+
+
+def test_non_letters_are_rejected(tmp_path):
+    compare(tmp_path, ['a × b — ²;', '12×', 'x½', '😀', 'é' * 200, 'a' * 127 + 'éé'], False)
+
+
+def test_mapped_source_matches_source(tmp_path):
+    compare(tmp_path, random_codes(1000, 2), False)
+
+
+def test_mapped_source_matches_source_in_recovery_mode(tmp_path):
+    compare(tmp_path, random_codes(1000, 3), True)
+
+
+# endregion (functions)
@@ -0,0 +1,103 @@
+# -*- encoding: utf8 -*-
+# ------------------------------------------------------------------------------
+# test_scanner.py
+# Created on 18/10/2026
+#
+# The MIT License
+#
+#
+# Copyright 2022 Jorge A. Gomes
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# region IMPORTS
+
+import random
+
+from minilang.utillities.jsom import JSOM
+from minilang.utillities.code import Source
+from minilang.lexing.core import Lexer, Token
+from minilang.lexing.scanner import Scanner
+from minilang.building.driver import LEXCONF
+from typing import List, Tuple
+
+# endregion (imports)
+# ---------------------------------------------------------
+# region CONSTANTS & ENUMS
+
+CONF: JSOM = JSOM.parse_file(LEXCONF)
+SCANNER: Scanner = Scanner.compile(CONF)
+
+# the pieces random inputs are made of: ASCII code, and non-ASCII characters of
+# every class, letters, digits and numeric characters, marks, symbols and spaces
+ASCII = list("abcxyzAB019_ .,;(){}[]+-*/=<>!&|^~%\"'`\n\t#@$\\") + ['0b', '0x', '1.5', '12a3b', 'if', 'while', '//',
+                                                                   '/*', '*/']
+UNICODE = ['é', '²', '½', '×', '—', '一', '٣', 'Ⅻ', 'ß', '́', '\xa0', '😀', 'ǅ', 'ª', ' ', 'Ω', '﻿']
+
+# endregion (constants)
+# ---------------------------------------------------------
+# region FUNCTIONS
+
+
+def scan(code: str, recover: bool, scanner: bool) -> Tuple[List[tuple], List[str]]:
+    """Scans a code with or without the Scanner, giving comparable tokens and error messages"""
+    lexer = Lexer(CONF, Source('<test>', code), scanner=SCANNER if scanner else None, recover=recover)
+    if recover:
+        tokens, errors = lexer.recover_tokens()
+    else:
+        tokens, error = lexer.gen_tokens()
+        errors = [error] if error else []
+    return [row(token) for token in tokens], [error.message for error in errors]
+
+
+def row(token: Token) -> tuple:
+    return token.kind, token.subkind, token.location.index, token.value, token.base, token.suffix
+
+
+def random_codes(count: int, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    return [''.join(rng.choice(ASCII if rng.random() < 0.8 else UNICODE) for _ in range(rng.randint(1, 25)))
+            for _ in range(count)]
+
+
+def test_numeric_characters_are_not_letters():
+    for code in ('²', 'a = ²;', '1_0000b²', 'Ⅻ', '½x'):
+        tokens, errors = scan(code, False, True)
+        assert errors and errors == scan(code, False, False)[1], code
+
+
+def test_non_ascii_letters_and_digits():
+    tokens, errors = scan('é2 = ß + 一٣; 12é', False, True)
+    assert not errors
+    assert [value for _, _, _, value, _, _ in tokens[:-1]] == ['é2', '=', 'ß', '+', '一٣', ';', '12é']
+    assert tokens[-2][5] == 'é'
+
+
+def test_scanner_matches_lexer():
+    for code in random_codes(2000, 0):
+        assert scan(code, False, True) == scan(code, False, False), repr(code)
+
+
+def test_scanner_matches_lexer_in_recovery_mode():
+    for code in random_codes(2000, 1):
+        assert scan(code, True, True) == scan(code, True, False), repr(code)
+
+
+# endregion (functions)
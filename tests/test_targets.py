@@ -0,0 +1,126 @@
+# -*- encoding: utf8 -*-
+# ------------------------------------------------------------------------------
+# test_targets.py
+# Created on 18/10/2026
+#
+# The MIT License
+#
+#
+# Copyright 2022 Jorge A. Gomes
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# region IMPORTS
+
+import io
+import pytest
+
+from minilang.utillities.code import Source
+from minilang.lexing.core import Lexer
+from minilang.parsing.parser import Parser
+from minilang.translating.translator import Translator
+from minilang.translating.pysource import PythonTranslator
+from minilang.translating.pyrun import run_modules
+from minilang.translating.vm import Machine
+from tests.test_scanner import CONF, SCANNER
+from typing import Any, Tuple
+
+# endregion (imports)
+# ---------------------------------------------------------
+# region CONSTANTS & ENUMS
+
+PROGRAM = """
+Counter {
+    count: i64;
+    step: i32 = 3;
+    Counter(start: i64) { count = start; }
+    next(): i64 { count += step; return count; }
+    +(other: Counter): Counter { return Counter(count + other.count); }
+}
+
+fib(n: i32): i64 { if (n < 2) { return n; } return fib(n - 1) + fib(n - 2); }
+
+main(): i32 {
+    c: Counter = Counter(10) + Counter(5);
+    total: i64 = 0;
+    i: i32 = 0;
+    while (i < 20) {
+        i++;
+        if (i % 3 == 0) { continue; }
+        total += c.next() * i / 4 - i % 7;
+    }
+    repeat (3) { print 'tick ' + total; }
+    print -7 / 2, -7 % 2, 7.5 / 2, fib(15), c.count, 1 << 40;
+    return 0;
+}
+"""
+
+# int locals hold 64-bit integers on both targets; fields, globals and temporaries do not
+CASES = {
+    'declaration': "y: i64 = 99999999999999999999;",
+    'assignment': "y: i64 = 4611686018427387904;\n    y = y * 4;",
+    'augmented': "y: i64 = 9223372036854775000;\n    y += 1000;",
+    'increment': "y: i64 = 9223372036854775807;\n    print y;\n    y++;",
+    'decrement': "y: i64 = -9223372036854775807;\n    y--;\n    print y;\n    y--;",
+    'postfix': "y: i64 = 9223372036854775807;\n    print y++;",
+    'chained': "y: i64 = 4611686018427387904;\n    z: i64 = 0;\n    z = y = y * 2;",
+    'float': "f: f64 = 2.7;\n    y: i64 = f;\n    print y;\n    f = 9223372036854775807;\n    y = f * 2;",
+    'temporary': "y: i64 = 4611686018427387904;\n    print y * 4;",
+    'in range': "y: i64 = 9223372036854775806;\n    y++;\n    print y, -y - 1;",
+}
+
+# endregion (constants)
+# ---------------------------------------------------------
+# region FUNCTIONS
+
+
+def run(translator: type, code: str) -> Tuple[Any, str, str]:
+    """Translates and runs a program, giving its result, its output and its error message"""
+    source = Source('t.ml', code)
+    tokens, error = Lexer(CONF, source, scanner=SCANNER).gen_tokens()
+    assert error is None
+    module, error = Parser(source, tokens).parse()
+    assert error is None
+    translated, error = translator(module).translate()
+    assert error is None
+    translated.filename = 't.ml'
+    output = io.StringIO()
+    if translator is Translator:
+        result, error = Machine([translated], output).run('main')
+    else:
+        result, error = run_modules([translated], 'main', output=output)
+    return result, output.getvalue(), error.message if error else ''
+
+
+def test_targets_agree():
+    result = run(Translator, PROGRAM)
+    assert result[2] == '' and result[1].count('tick') == 3
+    assert run(PythonTranslator, PROGRAM) == result
+
+
+@pytest.mark.parametrize('case', list(CASES))
+def test_int_locals_agree(case):
+    code = f"main(): i32 {{\n    {CASES[case]}\n    return 0;\n}}\n"
+    result = run(Translator, code)
+    assert run(PythonTranslator, code) == result
+    assert (result[2] == "Integer overflow") == (case not in ('temporary', 'in range')), result
+
+
+# endregion (functions)
@@ -0,0 +1,83 @@
+# -*- encoding: utf8 -*-
+# ------------------------------------------------------------------------------
+# test_translator.py
+# Created on 18/10/2026
+#
+# The MIT License
+#
+#
+# Copyright 2022 Jorge A. Gomes
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+
+# region IMPORTS
+
+import pytest
+
+from minilang.utillities.code import Source
+from minilang.utillities.error import TranslateError
+from minilang.lexing.core import Lexer
+from minilang.parsing.parser import Parser
+from minilang.translating.translator import Translator
+from minilang.translating.pysource import PythonTranslator
+from tests.test_scanner import CONF, SCANNER
+
+# endregion (imports)
+# ---------------------------------------------------------
+# region CONSTANTS & ENUMS
+
+TRANSLATORS = [Translator, PythonTranslator]
+
+# endregion (constants)
+# ---------------------------------------------------------
+# region FUNCTIONS
+
+
+def translate(translator: type, literal: str):
+    source = Source('t.ml', f"main(): i32 {{\n    x: i32 = {literal};\n    return 0;\n}}\n")
+    tokens, error = Lexer(CONF, source, scanner=SCANNER).gen_tokens()
+    assert error is None
+    module, error = Parser(source, tokens).parse()
+    assert error is None
+    return translator(module).translate()
+
+
+@pytest.mark.parametrize('translator', TRANSLATORS)
+@pytest.mark.parametrize('literal', ['0b', '0x', '0x_', '12a3b', '1i3.5', '1f.5'])
+def test_malformed_numbers_are_errors(translator, literal):
+    module, error = translate(translator, literal)
+    assert module is None
+    assert isinstance(error, TranslateError) and f"Invalid number '{literal}'" in error.message
+
+
+@pytest.mark.parametrize('translator', TRANSLATORS)
+@pytest.mark.parametrize('literal', ['0b101', '0x1F', '1_000', '10i32', '1.5f', '1.', '12é'])
+def test_numbers(translator, literal):
+    module, error = translate(translator, literal)
+    assert error is None and module is not None
+
+
+def test_number_values():
+    for literal, value in (('0b101', 5), ('0x1F', 31), ('1_000', 1000), ('10i32', 10), ('1.5f', 1.5)):
+        module, error = translate(Translator, literal)
+        assert value in module.constants, literal
+
+
+# endregion (functions)